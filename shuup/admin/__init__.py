@@ -99,6 +99,13 @@ class ShuupAdminAppConfig(AppConfig):
         order_creator_finished.connect(handle_custom_payment_return_requests,
                                        dispatch_uid='shuup.admin.handle_cash_payments')
 
+        from shuup.admin.utils.search_index import connect_signals
+        connect_signals()
+
+        from shuup.apps.provides import get_provide_objects
+        from shuup.admin.dashboard.utils import connect_dashboard_cache_signals
+        connect_dashboard_cache_signals(get_provide_objects("admin_module"))
+
         validate_templates_configuration()
 
 
@@ -23,6 +23,20 @@ class AdminModule(object):
     # A menu entry to represent this module in breadcrumbs
     breadcrumbs_menu_entry = None
 
+    # Seconds to cache the dashboard blocks and notifications of this
+    # module for.  The cached values are shared between requests with
+    # the same shop, currency and permission set.  `None` disables caching.
+    dashboard_cache_timeout = None
+    notifications_cache_timeout = None
+
+    # Models whose saving or deletion invalidates the cached dashboard
+    # blocks and notifications of this module
+    dashboard_cache_models = ()
+
+    # Whether the dashboard blocks of this module are slow to compute and
+    # should be loaded asynchronously when there are none cached yet
+    dashboard_async = False
+
     def get_urls(self):
         """
         :rtype: list[django.core.urlresolvers.RegexURLPattern]
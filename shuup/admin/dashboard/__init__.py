@@ -7,8 +7,9 @@
 # LICENSE file in the root directory of this source tree.
 
 from .blocks import (
-    DashboardBlock, DashboardChartBlock, DashboardContentBlock,
-    DashboardMoneyBlock, DashboardNumberBlock, DashboardValueBlock
+    DashboardAsyncBlock, DashboardBlock, DashboardChartBlock,
+    DashboardContentBlock, DashboardMoneyBlock, DashboardNumberBlock,
+    DashboardValueBlock
 )
 from .charts import BarChart, ChartDataType, ChartType, MixedChart
 from .utils import get_activity
@@ -18,6 +19,7 @@ __all__ = [
     "MixedChart",
     "ChartType",
     "ChartDataType",
+    "DashboardAsyncBlock",
     "DashboardBlock",
     "DashboardChartBlock",
     "DashboardContentBlock",
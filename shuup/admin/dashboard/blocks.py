@@ -39,6 +39,17 @@ class DashboardContentBlock(DashboardBlock):
         return cls(id=id, content=content)
 
 
+class DashboardAsyncBlock(DashboardBlock):
+    """
+    Placeholder for the blocks of a module loaded asynchronously from `url`.
+    """
+    type = "async"
+
+    def __init__(self, id, url, size="medium"):
+        super(DashboardAsyncBlock, self).__init__(id=id, size=size)
+        self.url = url
+
+
 class DashboardValueBlock(DashboardBlock):
     type = "value"
     default_size = "small"
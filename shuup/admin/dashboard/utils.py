@@ -10,9 +10,14 @@ import time
 from heapq import heappop, heappush
 from itertools import islice
 
+from django.db.models.signals import post_delete, post_save
 from django.utils.timezone import now
+from django.utils.translation import get_language
 
 from shuup.admin.module_registry import get_modules
+from shuup.admin.utils.permissions import get_permission_set_key
+from shuup.core import cache
+from shuup.core.signals import objects_bulk_updated
 
 
 def get_activity(request, n_entries=30, cutoff_hours=10):
@@ -38,3 +43,113 @@ def get_activity(request, n_entries=30, cutoff_hours=10):
     while activities and len(out) < n_entries:
         out.append(heappop(activities)[1])
     return out
+
+
+def get_module_key(module):
+    """
+    Get a string identifying the given admin module (or module class).
+
+    :rtype: str
+    """
+    module_class = (module if isinstance(module, type) else module.__class__)
+    return "%s.%s" % (module_class.__module__, module_class.__name__)
+
+
+def _get_dashboard_cache_namespace(module):
+    return "admin_dashboard_%s" % get_module_key(module)
+
+
+def get_dashboard_cache_key(request, module, kind, timeout):
+    """
+    Get the cache key for dashboard data of the given kind of the module.
+
+    The key varies by shop, currency, the permission set of the user and
+    language, and by a time bucket `timeout` seconds long, so every
+    cached value is recomputed at the latest when the bucket changes.
+
+    :type request: django.http.HttpRequest
+    :type module: shuup.admin.base.AdminModule
+    :type kind: str
+    :type timeout: int
+    :rtype: str
+    """
+    shop = getattr(request, "shop", None)
+    return "%s:%s:%s:%s:%s:%s:%d" % (
+        _get_dashboard_cache_namespace(module),
+        kind,
+        (shop.pk if shop else ""),
+        getattr(module, "currency", ""),
+        get_permission_set_key(getattr(request, "user", None)),
+        get_language(),
+        int(time.time() // timeout)
+    )
+
+
+def _get_cached_module_data(request, module, kind, timeout, getter):
+    if not timeout:
+        return list(getter(request=request) or ())
+    cache_key = get_dashboard_cache_key(request, module, kind, timeout)
+    data = cache.get(cache_key)
+    if data is None:
+        data = list(getter(request=request) or ())
+        cache.set(cache_key, data, timeout=timeout)
+    return data
+
+
+def get_cached_dashboard_blocks(request, module):
+    """
+    Get the cached dashboard blocks of the module, if any.
+
+    :return: list of blocks or None if not cached
+    :rtype: list[shuup.admin.dashboard.DashboardBlock]|None
+    """
+    timeout = module.dashboard_cache_timeout
+    if not timeout:
+        return None
+    return cache.get(get_dashboard_cache_key(request, module, "blocks", timeout))
+
+
+def get_dashboard_blocks(request, module):
+    """
+    Get the dashboard blocks of the module, using the cache if enabled.
+
+    :rtype: list[shuup.admin.dashboard.DashboardBlock]
+    """
+    return _get_cached_module_data(
+        request, module, "blocks", module.dashboard_cache_timeout, module.get_dashboard_blocks)
+
+
+def get_notifications(request, module):
+    """
+    Get the notifications of the module, using the cache if enabled.
+
+    :rtype: list[shuup.admin.base.Notification]
+    """
+    return _get_cached_module_data(
+        request, module, "notifications", module.notifications_cache_timeout, module.get_notifications)
+
+
+def _get_bump_handler(module_class):
+    namespace = _get_dashboard_cache_namespace(module_class)
+
+    def bump_dashboard_cache(sender, **kwargs):
+        cache.bump_version(namespace)
+    return bump_dashboard_cache
+
+
+def connect_dashboard_cache_signals(module_classes):
+    """
+    Connect the `dashboard_cache_models` of the module classes to bump
+    the dashboard caches of the modules when saved, deleted or bulk updated.
+
+    :type module_classes: Iterable[type]
+    """
+    for module_class in module_classes:
+        handler = None
+        for model in getattr(module_class, "dashboard_cache_models", ()):
+            handler = (handler or _get_bump_handler(module_class))
+            uid = "shuup_admin:dashboard_cache:%s:%s.%s" % (
+                get_module_key(module_class), model._meta.app_label, model._meta.model_name)
+            post_save.connect(handler, sender=model, dispatch_uid=uid, weak=False)
+            post_delete.connect(handler, sender=model, dispatch_uid=uid, weak=False)
+            objects_bulk_updated.connect(handler, sender=model, dispatch_uid=uid, weak=False)
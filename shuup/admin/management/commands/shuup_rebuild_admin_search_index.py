@@ -0,0 +1,21 @@
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Rebuild the token index used by the admin search.
+"""
+from django.core.management.base import BaseCommand
+
+from shuup.admin.utils.search_index import INDEXERS, rebuild_index
+
+
+class Command(BaseCommand):
+    help = __doc__.strip()
+
+    def handle(self, *args, **options):
+        for kind in sorted(INDEXERS):
+            count = rebuild_index(kind)
+            self.stdout.write("Indexed %d %s objects" % (count, kind))
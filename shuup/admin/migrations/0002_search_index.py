@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shuup_admin', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexEntry',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('kind', models.CharField(verbose_name='kind', max_length=32)),
+                ('object_id', models.PositiveIntegerField(verbose_name='object id')),
+                ('token', models.CharField(verbose_name='token', max_length=64, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'search index entry',
+                'verbose_name_plural': 'search index entries',
+            },
+        ),
+        migrations.AlterIndexTogether(
+            name='searchindexentry',
+            index_together=set([('kind', 'object_id'), ('kind', 'token')]),
+        ),
+    ]
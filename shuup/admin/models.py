@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+from __future__ import unicode_literals
+
+from django.db import models
+from django.utils.encoding import python_2_unicode_compatible
+from django.utils.translation import ugettext_lazy as _
+
+
+@python_2_unicode_compatible
+class SearchIndexEntry(models.Model):
+    """
+    A normalized search token of an object indexed for the admin search.
+
+    Entries are maintained by the signal handlers in
+    `shuup.admin.utils.search_index` and queried with indexed prefix
+    lookups instead of `icontains` scans.
+    """
+    kind = models.CharField(max_length=32, verbose_name=_("kind"))
+    object_id = models.PositiveIntegerField(verbose_name=_("object id"))
+    token = models.CharField(max_length=64, db_index=True, verbose_name=_("token"))
+
+    class Meta:
+        index_together = (("kind", "object_id"), ("kind", "token"))
+        verbose_name = _("search index entry")
+        verbose_name_plural = _("search index entries")
+
+    def __str__(self):
+        return "%s:%s %s" % (self.kind, self.object_id, self.token)
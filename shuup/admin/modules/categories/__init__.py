@@ -6,13 +6,13 @@
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
 import six
-from django.db.models import Q
 from django.utils.translation import ugettext_lazy as _
 from filer.models import File
 
 from shuup.admin.base import AdminModule, MenuEntry, SearchResult
 from shuup.admin.menu import PRODUCTS_MENU_CATEGORY
 from shuup.admin.utils.permissions import get_default_model_permissions
+from shuup.admin.utils.search_index import search_index
 from shuup.admin.utils.urls import (
     admin_url, derive_model_url, get_edit_and_list_urls, get_model_url
 )
@@ -57,11 +57,9 @@ class CategoryModule(AdminModule):
     def get_search_results(self, request, query):
         minimum_query_length = 3
         if len(query) >= minimum_query_length:
-            categories = Category.objects.filter(
-                Q(translations__name__icontains=query) |
-                Q(identifier__icontains=query)
-            ).distinct().order_by("tree_id", "lft")
-            for i, category in enumerate(categories[:10]):
+            pks = search_index("category", query, limit=10)
+            categories = Category.objects.in_bulk(pks)
+            for i, category in enumerate(categories[pk] for pk in pks if pk in categories):
                 relevance = 100 - i
                 yield SearchResult(
                     text=six.text_type(category),
@@ -6,12 +6,12 @@
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
 import six
-from django.db.models import Q
 from django.utils.translation import ugettext_lazy as _
 
 from shuup.admin.base import AdminModule, MenuEntry, SearchResult
 from shuup.admin.menu import CONTACTS_MENU_CATEGORY
 from shuup.admin.utils.permissions import get_default_model_permissions
+from shuup.admin.utils.search_index import search_index
 from shuup.admin.utils.urls import admin_url, derive_model_url, get_model_url
 from shuup.core.models import CompanyContact, Contact, PersonContact
 
@@ -90,11 +90,9 @@ class ContactModule(AdminModule):
     def get_search_results(self, request, query):
         minimum_query_length = 3
         if len(query) >= minimum_query_length:
-            contacts = Contact.objects.filter(
-                Q(name__icontains=query) |
-                Q(email=query)
-            )
-            for i, contact in enumerate(contacts[:10]):
+            pks = search_index("contact", query, limit=10)
+            contacts = Contact.objects.in_bulk(pks)
+            for i, contact in enumerate(contacts[pk] for pk in pks if pk in contacts):
                 relevance = 100 - i
                 yield SearchResult(
                     text=six.text_type(contact), url=get_model_url(contact),
@@ -14,6 +14,7 @@ from .dashboard import get_active_customers_block
 
 class CustomersDashboardModule(AdminModule):
     name = _("Customers Dashboard")
+    dashboard_cache_timeout = 300
 
     def get_required_permissions(self):
         return ("shuup.view_customers_dashboard",)
@@ -8,7 +8,6 @@
 from datetime import timedelta
 
 import six
-from django.db.models import Q
 from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
 
@@ -17,6 +16,7 @@ from shuup.admin.menu import ORDERS_MENU_CATEGORY, STOREFRONT_MENU_CATEGORY
 from shuup.admin.utils.permissions import (
     get_default_model_permissions, get_permissions_from_urls
 )
+from shuup.admin.utils.search_index import search_index
 from shuup.admin.utils.urls import (
     admin_url, derive_model_url, get_edit_and_list_urls, get_model_url
 )
@@ -28,6 +28,8 @@ from shuup.core.models import (
 
 class OrderModule(AdminModule):
     name = _("Orders")
+    notifications_cache_timeout = 600
+    dashboard_cache_models = (Order,)
     breadcrumbs_menu_entry = MenuEntry(name, url="shuup_admin:order.list")
 
     def get_urls(self):
@@ -163,14 +165,9 @@ class OrderModule(AdminModule):
     def get_search_results(self, request, query):
         minimum_query_length = 3
         if len(query) >= minimum_query_length:
-            orders = Order.objects.filter(
-                Q(identifier__istartswith=query) |
-                Q(reference_number__istartswith=query) |
-                Q(email__icontains=query) |
-                Q(phone__icontains=query)
-            ).order_by("-id")[:15]
-
-            for i, order in enumerate(orders):
+            pks = search_index("order", query, limit=15)
+            orders = Order.objects.in_bulk(pks)
+            for i, order in enumerate(orders[pk] for pk in pks if pk in orders):
                 relevance = 100 - i
                 yield SearchResult(
                     text=six.text_type(order),
@@ -4,16 +4,17 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
-import zipfile
-
 import six
 from django.db.models import Q
-from django.http import HttpResponse, JsonResponse
+from django.http import JsonResponse
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
 from django.utils.translation import ugettext
-from six import BytesIO
 
+from shuup.admin.modules.orders.utils import cancel_orders
+from shuup.admin.utils.mass_actions import (
+    run_mass_action, should_run_in_background
+)
 from shuup.admin.utils.picotable import (
     PicotableFileMassAction, PicotableMassAction
 )
@@ -21,6 +22,11 @@ from shuup.core.models import Order, Shipment
 from shuup.order_printouts.admin_module.views import (
     get_confirmation_pdf, get_delivery_pdf
 )
+from shuup.order_printouts.batch import (
+    get_confirmation_documents, get_delivery_documents, get_pdf_zip_response
+)
+from shuup.utils.excs import Problem
+from shuup.utils.pdf import ensure_pdf_rendering_available
 
 
 class CancelOrderAction(PicotableMassAction):
@@ -31,10 +37,7 @@ class CancelOrderAction(PicotableMassAction):
         query = Q(id__in=ids)
         if isinstance(ids, six.string_types) and ids == "all":
             query = Q()
-        for order in Order.objects.filter(query):
-            if not order.can_set_canceled():
-                continue
-            order.set_canceled()
+        run_mass_action(cancel_orders, (Order.objects.filter(query),), background=should_run_in_background(ids))
 
 
 class OrderConfirmationPdfAction(PicotableFileMassAction):
@@ -53,30 +56,8 @@ class OrderConfirmationPdfAction(PicotableFileMassAction):
                 msg = e.message if hasattr(e, "message") else e
                 return JsonResponse({"error": force_text(msg)})
 
-        buff = BytesIO()
-        archive = zipfile.ZipFile(buff, 'w', zipfile.ZIP_DEFLATED)
-        added = 0
-        errors = []
-        for id in ids:
-            try:
-                pdf_file = get_confirmation_pdf(request, id)
-                filename = "order_%d_confirmation.pdf" % id
-                archive.writestr(filename, pdf_file.content)
-                added += 1
-            except Exception as e:
-                msg = e.message if hasattr(e, "message") else e
-                errors.append(force_text(msg))
-                continue
-        if added:
-            archive.close()
-            buff.flush()
-            ret_zip = buff.getvalue()
-            buff.close()
-            response = HttpResponse(content_type='application/zip')
-            response['Content-Disposition'] = 'attachment; filename=order_confirmation_pdf.zip'
-            response.write(ret_zip)
-            return response
-        return JsonResponse({"errors": errors})
+        return _get_pdf_zip_response(
+            get_confirmation_documents(request, list(ids)), "order_confirmation_pdf.zip")
 
 
 class OrderDeliveryPdfAction(PicotableFileMassAction):
@@ -86,37 +67,27 @@ class OrderDeliveryPdfAction(PicotableFileMassAction):
     def process(self, request, ids):
         if isinstance(ids, six.string_types) and ids == "all":
             return JsonResponse({"error": ugettext("Selecting all is not supported.")})
-        shipment_ids = set(Shipment.objects.filter(order_id__in=ids).values_list("id", flat=True))
+        shipment_ids = list(Shipment.objects.filter(order_id__in=ids).order_by("pk").values_list("id", flat=True))
         if len(shipment_ids) == 1:
             try:
-                response = get_delivery_pdf(request, ids[0])
-                response['Content-Disposition'] = 'attachment; filename=shipment_%s_delivery.pdf' % ids[0]
+                response = get_delivery_pdf(request, shipment_ids[0])
+                response['Content-Disposition'] = 'attachment; filename=shipment_%s_delivery.pdf' % shipment_ids[0]
                 return response
             except Exception as e:
                 msg = e.message if hasattr(e, "message") else e
                 return JsonResponse({"error": force_text(msg)})
-        buff = BytesIO()
-        archive = zipfile.ZipFile(buff, 'w', zipfile.ZIP_DEFLATED)
 
-        added = 0
-        errors = []
-        for id in shipment_ids:
-            try:
-                pdf_file = get_delivery_pdf(request, id)
-                filename = "shipment_%d_delivery.pdf" % id
-                archive.writestr(filename, pdf_file.content)
-                added += 1
-            except Exception as e:
-                msg = e.message if hasattr(e, "message") else e
-                errors.append(force_text(msg))
-                continue
-        if added:
-            archive.close()
-            buff.flush()
-            ret_zip = buff.getvalue()
-            buff.close()
-            response = HttpResponse(content_type='application/zip')
-            response['Content-Disposition'] = 'attachment; filename=order_delivery_pdf.zip'
-            response.write(ret_zip)
-            return response
+        return _get_pdf_zip_response(
+            get_delivery_documents(request, shipment_ids), "order_delivery_pdf.zip")
+
+
+def _get_pdf_zip_response(documents_and_errors, filename):
+    (documents, errors) = documents_and_errors
+    try:
+        ensure_pdf_rendering_available()
+    except Problem as problem:
+        errors.append(force_text(problem.message))
+        documents = []
+    if not documents:
         return JsonResponse({"errors": errors})
+    return get_pdf_zip_response(documents, filename, errors)
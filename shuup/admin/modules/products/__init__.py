@@ -7,11 +7,8 @@
 # LICENSE file in the root directory of this source tree.
 from __future__ import unicode_literals
 
-from collections import Counter
-
 from django.conf import settings
 from django.core.urlresolvers import reverse
-from django.db.models import Q
 from django.db.models.signals import m2m_changed, post_save
 from django.utils.encoding import force_text
 from django.utils.translation import ugettext_lazy as _
@@ -25,7 +22,7 @@ from shuup.admin.modules.products.signal_handlers import (
 from shuup.admin.utils.permissions import (
     get_default_model_permissions, get_permissions_from_urls
 )
-from shuup.admin.utils.search import split_query
+from shuup.admin.utils.search_index import search_index
 from shuup.admin.utils.urls import (
     admin_url, derive_model_url, get_edit_and_list_urls, get_model_url,
     manipulate_query_string
@@ -100,18 +97,13 @@ class ProductModule(AdminModule):
         minimum_query_length = 3
         skus_seen = set()
         if len(query) >= minimum_query_length:
-            pk_counter = Counter()
-            pk_counter.update(Product.objects.filter(sku__startswith=query).values_list("pk", flat=True))
-            name_q = Q()
-            for part in split_query(query, minimum_query_length):
-                name_q &= Q(name__icontains=part)
-            pk_counter.update(
-                Product._parler_meta.root_model.objects.filter(name_q).values_list("master_id", flat=True)
-            )
-            pks = [pk for (pk, count) in pk_counter.most_common(10)]
-
-            for product in Product.objects.filter(pk__in=pks):
-                relevance = 100 - pk_counter.get(product.pk, 0)
+            pks = search_index("product", query, limit=10)
+            products = Product.objects.in_bulk(pks)
+            for i, pk in enumerate(pks):
+                product = products.get(pk)
+                if not product:
+                    continue
+                relevance = 100 - i
                 skus_seen.add(product.sku.lower())
                 yield SearchResult(
                     text=force_text(product),
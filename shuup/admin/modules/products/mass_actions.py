@@ -12,7 +12,11 @@ from django.http import HttpResponse
 from django.utils.translation import ugettext_lazy as _
 from six import string_types
 
+from shuup.admin.modules.products.utils import mass_edit_shop_products
 from shuup.admin.modules.settings.view_settings import ViewSettings
+from shuup.admin.utils.mass_actions import (
+    run_mass_action, should_run_in_background
+)
 from shuup.admin.utils.picotable import (
     PicotableFileMassAction, PicotableMassAction, PicotableRedirectMassAction
 )
@@ -27,7 +31,11 @@ class VisibleMassAction(PicotableMassAction):
         query = Q(product__pk__in=ids)
         if isinstance(ids, string_types) and ids == "all":
             query = Q()
-        ShopProduct.objects.filter(query).update(visibility=ShopProductVisibility.ALWAYS_VISIBLE)
+        run_mass_action(
+            mass_edit_shop_products,
+            (ShopProduct.objects.filter(query), {"visibility": ShopProductVisibility.ALWAYS_VISIBLE}),
+            background=should_run_in_background(ids)
+        )
 
 
 class InvisibleMassAction(PicotableMassAction):
@@ -38,7 +46,11 @@ class InvisibleMassAction(PicotableMassAction):
         query = Q(product__pk__in=ids)
         if isinstance(ids, string_types) and ids == "all":
             query = Q()
-        ShopProduct.objects.filter(query).update(visibility=ShopProductVisibility.NOT_VISIBLE)
+        run_mass_action(
+            mass_edit_shop_products,
+            (ShopProduct.objects.filter(query), {"visibility": ShopProductVisibility.NOT_VISIBLE}),
+            background=should_run_in_background(ids)
+        )
 
 
 class FileResponseAction(PicotableFileMassAction):
@@ -5,7 +5,18 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
-from shuup.core.models import ProductPackageLink
+from collections import defaultdict
+
+import six
+from django.conf import settings
+from django.core.cache import cache as django_cache
+from django.utils.timezone import now
+from django.utils.translation import get_language
+from parler.cache import get_translation_cache_key
+
+from shuup.admin.utils.mass_actions import run_in_chunks
+from shuup.core.models import Product, ProductPackageLink, ShopProduct
+from shuup.core.signals import objects_bulk_updated
 
 
 def clear_existing_package(parent_product):
@@ -19,3 +30,122 @@ def clear_existing_package(parent_product):
     for child in children:
         child.verify_mode()
         child.save()
+
+
+def _set_m2m_values(field, ids, values):
+    through = getattr(ShopProduct, field.name).through
+    source_field = "%s_id" % field.m2m_field_name()
+    target_field = "%s_id" % field.m2m_reverse_field_name()
+    through.objects.filter(**{"%s__in" % source_field: ids}).delete()
+    through.objects.bulk_create([
+        through(**{source_field: id, target_field: value.pk})
+        for id in ids
+        for value in values
+    ])
+
+
+def _set_translated_values(product_ids, values):
+    translation_model = Product._parler_meta.root_model
+    language_code = get_language()
+    translations = translation_model.objects.filter(master_id__in=product_ids, language_code=language_code)
+    translations.update(**values)
+    existing_ids = set(translations.values_list("master_id", flat=True))
+    translation_model.objects.bulk_create([
+        translation_model(master_id=product_id, language_code=language_code, **values)
+        for product_id in product_ids
+        if product_id not in existing_ids
+    ])
+    django_cache.delete_many([
+        get_translation_cache_key(translation_model, product_id, language_code)
+        for product_id in product_ids
+    ])
+
+
+def _add_primary_categories(ids):
+    """
+    Bulk version of the `update_categories_post_save` and `update_categories_through` signal handlers.
+    """
+    through = ShopProduct.categories.through
+    category_links = set(through.objects.filter(shopproduct_id__in=ids).values_list("shopproduct_id", "category_id"))
+    through.objects.bulk_create([
+        through(shopproduct_id=shop_product_id, category_id=category_id)
+        for (shop_product_id, category_id)
+        in ShopProduct.objects.filter(pk__in=ids).exclude(primary_category=None).values_list("pk", "primary_category")
+        if (shop_product_id, category_id) not in category_links
+    ])
+    first_category_ids = {}
+    for (shop_product_id, category_id) in sorted(category_links):
+        first_category_ids.setdefault(shop_product_id, category_id)
+    shop_product_ids_by_category = defaultdict(list)
+    for shop_product_id in ShopProduct.objects.filter(pk__in=ids, primary_category=None).values_list("pk", flat=True):
+        if shop_product_id in first_category_ids:
+            shop_product_ids_by_category[first_category_ids[shop_product_id]].append(shop_product_id)
+    for category_id, shop_product_ids in six.iteritems(shop_product_ids_by_category):
+        ShopProduct.objects.filter(pk__in=shop_product_ids).update(primary_category_id=category_id)
+
+
+def _split_values(values):
+    """
+    Split mass edit values by how they are stored.
+
+    :return: `ShopProduct` field values, many-to-many values by field
+             and translated `Product` field values
+    :rtype: tuple[dict, dict, dict]
+    """
+    shop_product_values = {}
+    m2m_values = {}
+    translated_values = {}
+    for name, value in six.iteritems(values):
+        if name in Product._parler_meta.get_translated_fields():
+            translated_values[name] = value
+            continue
+        field = ShopProduct._meta.get_field(name)
+        if field.many_to_many:
+            m2m_values[field] = value
+        else:
+            shop_product_values[name] = value
+    return (shop_product_values, m2m_values, translated_values)
+
+
+def _mass_edit_chunk(ids, shop_product_values, m2m_values, translated_values, update_categories):
+    if shop_product_values:
+        ShopProduct.objects.filter(pk__in=ids).update(**shop_product_values)
+    for field, value in six.iteritems(m2m_values):
+        _set_m2m_values(field, ids, value)
+    product_ids = list(ShopProduct.objects.filter(pk__in=ids).values_list("product_id", flat=True))
+    if translated_values:
+        _set_translated_values(product_ids, translated_values)
+    if update_categories:
+        _add_primary_categories(ids)
+    # Neither the queryset updates nor the translation updates touch `auto_now`
+    Product.objects.filter(pk__in=product_ids).update(modified_on=now())
+
+
+def mass_edit_shop_products(shop_products, values):
+    """
+    Set the given field values to the shop products (and their products) in bulk.
+
+    The objects are updated in chunks without saving them one by one,
+    and the `objects_bulk_updated` signal is sent once for all of them.
+
+    :param shop_products: Shop products to edit
+    :type shop_products: django.db.models.QuerySet
+    :param values: Values by field name of `ShopProduct` or translated
+                   field name of `Product`
+    :type values: dict
+    """
+    (shop_product_values, m2m_values, translated_values) = _split_values(values)
+    update_categories = bool(
+        getattr(settings, "SHUUP_AUTO_SHOP_PRODUCT_CATEGORIES", False) and
+        ("primary_category" in values or "categories" in values)
+    )
+    ids = run_in_chunks(shop_products, lambda ids: _mass_edit_chunk(
+        ids, shop_product_values, m2m_values, translated_values, update_categories))
+    if not ids:
+        return
+    if shop_product_values or m2m_values:
+        objects_bulk_updated.send(
+            sender=ShopProduct, ids=ids, fields=list(shop_product_values) + [f.name for f in m2m_values])
+    if translated_values:
+        product_ids = list(ShopProduct.objects.filter(pk__in=ids).values_list("product_id", flat=True))
+        objects_bulk_updated.send(sender=Product, ids=product_ids, fields=list(translated_values))
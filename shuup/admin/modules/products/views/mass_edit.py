@@ -8,7 +8,6 @@ import six
 from django import forms
 from django.contrib import messages
 from django.core.urlresolvers import reverse
-from django.db.models import Q
 from django.http import HttpResponseRedirect
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import FormView
@@ -17,10 +16,12 @@ from enumfields import EnumIntegerField
 from shuup.admin.forms.widgets import (
     QuickAddCategoryMultiSelect, QuickAddCategorySelect
 )
-from shuup.admin.utils.views import MassEditMixin
-from shuup.core.models import (
-    Category, Product, ShopProduct, ShopProductVisibility
+from shuup.admin.modules.products.utils import mass_edit_shop_products
+from shuup.admin.utils.mass_actions import (
+    is_all_selected, run_mass_action, should_run_in_background
 )
+from shuup.admin.utils.views import MassEditMixin
+from shuup.core.models import Category, ShopProduct, ShopProductVisibility
 
 
 class MassEditForm(forms.Form):
@@ -41,25 +42,18 @@ class ProductMassEditView(MassEditMixin, FormView):
     form_class = MassEditForm
 
     def form_valid(self, form):
-
-        product_ids = ShopProduct.objects.filter(id__in=self.ids).values_list("product__id", flat=True)
-
-        query = Q(id__in=product_ids)
-        if isinstance(self.ids, six.string_types) and self.ids == "all":
-            query = Q()
-        for product in Product.objects.filter(query):
-            shop_product = product.get_shop_instance(self.request.shop)
-
-            for k, v in six.iteritems(form.cleaned_data):
-                if not v:
-                    continue
-                if hasattr(product, k):
-                    setattr(product, k, v)
-                if hasattr(shop_product, k):
-                    setattr(shop_product, k, v)
-            product.save()
-            shop_product.save()
-
-        messages.success(self.request, _("Products changed successfully"))
+        shop_products = ShopProduct.objects.filter(shop=self.request.shop)
+        if not is_all_selected(self.ids):
+            product_ids = ShopProduct.objects.filter(id__in=self.ids).values_list("product_id", flat=True)
+            shop_products = shop_products.filter(product_id__in=list(product_ids))
+
+        values = dict((k, v) for (k, v) in six.iteritems(form.cleaned_data) if v)
+        background = should_run_in_background(self.ids)
+        run_mass_action(mass_edit_shop_products, (shop_products, values), background=background)
+
+        if background:
+            messages.success(self.request, _("Products are being changed in the background"))
+        else:
+            messages.success(self.request, _("Products changed successfully"))
         self.request.session["mass_action_ids"] = []
         return HttpResponseRedirect(reverse("shuup_admin:shop_product.list"))
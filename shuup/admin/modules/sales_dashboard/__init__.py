@@ -13,6 +13,8 @@ from shuup.admin.currencybound import CurrencyBound
 
 class SalesDashboardModule(CurrencyBound, AdminModule):
     name = _("Sales Dashboard")
+    dashboard_cache_timeout = 300
+    dashboard_async = True
 
     def get_required_permissions(self):
         return ("shuup.view_sales_dashboard",)
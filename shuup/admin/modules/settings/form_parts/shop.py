@@ -37,6 +37,12 @@ class ShopOrderConfigurationForm(forms.Form):
     )
 
     order_reference_number_prefix = forms.IntegerField(label=_("Reference number prefix"), required=False)
+    order_reference_number_gapless = forms.BooleanField(
+        label=_("Gapless reference numbers"),
+        required=False,
+        help_text=_("Enable to make running reference numbers strictly consecutive. "
+                    "Gapless reference numbers are slower to generate when many orders are placed at once."),
+    )
 
     def __init__(self, *args, **kwargs):
         from shuup.admin.modules.settings import consts
@@ -47,6 +53,8 @@ class ShopOrderConfigurationForm(forms.Form):
                 shop, consts.ORDER_REFERENCE_NUMBER_LENGTH_FIELD, settings.SHUUP_REFERENCE_NUMBER_LENGTH),
             consts.ORDER_REFERENCE_NUMBER_PREFIX_FIELD: configuration.get(
                 shop, consts.ORDER_REFERENCE_NUMBER_PREFIX_FIELD, settings.SHUUP_REFERENCE_NUMBER_PREFIX),
+            consts.ORDER_REFERENCE_NUMBER_GAPLESS_FIELD: configuration.get(
+                shop, consts.ORDER_REFERENCE_NUMBER_GAPLESS_FIELD, settings.SHUUP_REFERENCE_NUMBER_GAPLESS),
         }
         super(ShopOrderConfigurationForm, self).__init__(*args, **kwargs)
 
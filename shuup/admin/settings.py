@@ -21,3 +21,23 @@ your own, the :ref:`apps-naming-settings` section is an important read.
 #: Panes must be subclasses of `shuup.admin.views.WizardPane`.
 #:
 SHUUP_SETUP_WIZARD_PANE_SPEC = []
+
+#: Maximum number of worker threads used to query the admin modules
+#: concurrently in a single admin search.  Set to 0 to query the modules
+#: serially in the request thread.
+#:
+SHUUP_ADMIN_SEARCH_WORKERS = 4
+
+#: Time budget in seconds for the admin search.  Results of the modules
+#: not finished within the budget are left out.
+#:
+SHUUP_ADMIN_SEARCH_TIME_BUDGET = 0.5
+
+#: Number of objects updated per transaction by the mass actions.
+#:
+SHUUP_ADMIN_MASS_ACTION_CHUNK_SIZE = 500
+
+#: Whether mass actions on "all" objects are run in a background thread
+#: instead of within the request.
+#:
+SHUUP_ADMIN_MASS_ACTION_BACKGROUND_ALL = False
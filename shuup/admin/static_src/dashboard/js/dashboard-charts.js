@@ -20,6 +20,7 @@ window.DashboardCharts = (function(Chart) {
         "#41589B"
     ];
     let nextColorIndex = 0;
+    const activatedCharts = {};
 
     function getNextColorFromPalette (){
         return colorPalette[nextColorIndex++ % colorPalette.length];
@@ -79,7 +80,10 @@ window.DashboardCharts = (function(Chart) {
     return {
         init: function init() {
             _.each(window.CHART_CONFIGS || {}, function(config, id) {
-                activate(config, id);
+                if (!activatedCharts[id]) {
+                    activatedCharts[id] = true;
+                    activate(config, id);
+                }
             });
         }
     };
@@ -12,15 +12,31 @@ $(function() {
     if (window.DashboardCharts) {
         window.DashboardCharts.init();
     }
+    let msnry = null;
     if (window.Masonry) {
         const Masonry = window.Masonry;
 
-        const msnry = new Masonry(document.getElementById("dashboard-wrapper"), {
+        msnry = new Masonry(document.getElementById("dashboard-wrapper"), {
             itemSelector: ".block",
             columnWidth: ".block",
             percentPosition: true
         });
     }
+    $(".dashboard-async-block").each(function() {
+        const $block = $(this);
+        $.get($block.data("url"), function(html) {
+            $block.replaceWith(html);
+            if (window.DashboardCharts) {
+                window.DashboardCharts.init();
+            }
+            if (msnry) {
+                msnry.reloadItems();
+                msnry.layout();
+            }
+        }).fail(function() {
+            $block.remove();
+        });
+    });
     $(document).on("click", "button.dismiss-button", function() {
         const $button = $(this);
         const url = $button.data("dismissUrl");
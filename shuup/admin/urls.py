@@ -19,7 +19,7 @@ from django.views.i18n import set_language
 from shuup.admin.forms import EmailAuthenticationForm
 from shuup.admin.module_registry import get_module_urls
 from shuup.admin.utils.urls import admin_url, AdminRegexURLPattern
-from shuup.admin.views.dashboard import DashboardView
+from shuup.admin.views.dashboard import DashboardBlocksView, DashboardView
 from shuup.admin.views.home import HomeView
 from shuup.admin.views.menu import MenuView
 from shuup.admin.views.search import SearchView
@@ -42,6 +42,7 @@ def get_urls():
 
     urls.extend([
         admin_url(r'^$', DashboardView.as_view(), name='dashboard'),
+        admin_url(r'^dashboard/blocks/$', DashboardBlocksView.as_view(), name='dashboard.blocks'),
         admin_url(r'^home/$', HomeView.as_view(), name='home'),
         admin_url(r'^wizard/$', WizardView.as_view(), name='wizard'),
         admin_url(r'^tour/$', TourView.as_view(), name='tour'),
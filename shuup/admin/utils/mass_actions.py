@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Helpers for executing mass actions on large selections.
+
+Mass actions update their objects with queryset level updates in
+chunks, each chunk in a transaction of its own, and send a single
+`shuup.core.signals.objects_bulk_updated` signal for all of the updated
+objects instead of saving (and firing signals for) every object.
+"""
+import logging
+import threading
+
+import six
+from django.conf import settings
+from django.db import connection
+from django.db.transaction import atomic
+from django.utils import translation
+
+LOG = logging.getLogger(__name__)
+
+
+def is_all_selected(ids):
+    """
+    Return whether the mass action selection is "all" objects.
+
+    :type ids: list[int]|str
+    :rtype: bool
+    """
+    return (isinstance(ids, six.string_types) and ids == "all")
+
+
+def run_in_chunks(queryset, func, chunk_size=None):
+    """
+    Call `func` with chunks of ids of the objects of the queryset.
+
+    Every chunk is processed in a transaction of its own.
+
+    :param queryset: Queryset of the objects to process
+    :type queryset: django.db.models.QuerySet
+    :param func: Function called with a list of ids
+    :type func: callable
+    :param chunk_size: Number of ids per chunk (defaults to `SHUUP_ADMIN_MASS_ACTION_CHUNK_SIZE`)
+    :type chunk_size: int|None
+    :return: All processed ids
+    :rtype: list[int]
+    """
+    chunk_size = (chunk_size or settings.SHUUP_ADMIN_MASS_ACTION_CHUNK_SIZE)
+    ids = list(queryset.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(ids), chunk_size):
+        with atomic():
+            func(ids[start:start + chunk_size])
+    return ids
+
+
+def run_mass_action(func, args=(), background=False):
+    """
+    Run a mass action function, optionally in a background thread.
+
+    The background thread runs with the current language activated and
+    closes its database connection when done.
+
+    :param func: The function to run
+    :type func: callable
+    :param args: Positional arguments for the function
+    :type args: tuple
+    :param background: Whether to run the function in a background thread
+    :type background: bool
+    :return: Whether the function was run in the background
+    :rtype: bool
+    """
+    if not background:
+        func(*args)
+        return False
+
+    language = translation.get_language()
+
+    def run():
+        try:
+            with translation.override(language):
+                func(*args)
+        except Exception:  # pragma: no cover
+            LOG.exception("Background mass action %r failed", func)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=run, name="shuup-mass-action")
+    thread.daemon = True
+    thread.start()
+    return True
+
+
+def should_run_in_background(ids):
+    """
+    Return whether a mass action for the given selection should be run in the background.
+
+    :type ids: list[int]|str
+    :rtype: bool
+    """
+    return bool(is_all_selected(ids) and settings.SHUUP_ADMIN_MASS_ACTION_BACKGROUND_ALL)
@@ -5,7 +5,10 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
+import hashlib
+
 from django.contrib.auth.models import Permission
+from django.utils.encoding import force_bytes
 
 
 def get_default_model_permissions(model):
@@ -45,6 +48,27 @@ def get_missing_permissions(user, permissions):
     return missing_permissions
 
 
+def get_permission_set_key(user):
+    """
+    Return a digest identifying the permission set of the given user.
+
+    Users with equal permissions get equal keys, so the key can be used
+    to share cached data between them.
+
+    :param user: User instance (or None)
+    :type user: django.contrib.auth.models.User|None
+    :rtype: str
+    """
+    if getattr(user, "is_superuser", False):
+        permissions = ("*",)
+    elif hasattr(user, "get_all_permissions"):
+        permissions = sorted(user.get_all_permissions())
+    else:
+        permissions = ()
+    is_authenticated = bool(user and user.is_authenticated())
+    return hashlib.sha1(force_bytes(repr((is_authenticated, permissions)))).hexdigest()
+
+
 def get_permissions_from_urls(urls):
     """
     Return a set of permissions for a given iterable of urls.
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Token index for the admin search.
+
+Objects are indexed as sets of normalized tokens (see `tokenize`) and
+looked up with indexed prefix matches on those tokens, which keeps the
+admin typeahead fast on tables where `icontains` would scan every row.
+
+The index is kept up to date by signal handlers connected in
+`ShuupAdminAppConfig.ready`.  An index that has never been built (e.g.
+right after an upgrade) is built on its first search; use the
+`shuup_rebuild_admin_search_index` management command to build it
+beforehand or to rebuild it.
+"""
+from __future__ import unicode_literals
+
+import logging
+import re
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Case, IntegerField, Sum, Value, When
+from django.db.models.signals import post_delete, post_save
+from django.db.transaction import atomic
+from django.utils.encoding import force_text
+
+from shuup.admin.models import SearchIndexEntry
+from shuup.core.models import (
+    Category, CompanyContact, Contact, Order, PersonContact, Product
+)
+from shuup.core.signals import objects_bulk_updated
+
+LOG = logging.getLogger(__name__)
+
+TOKEN_MAX_LENGTH = 64
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+#: Kinds whose index is known to be built (see `_ensure_index`)
+_checked_kinds = set()
+
+
+def tokenize(*texts):
+    """
+    Split the given texts into a set of normalized search tokens.
+
+    Every whitespace separated part is a token by itself (so emails and
+    SKUs can be matched as a whole) and so is every word within it.
+
+    :rtype: set[str]
+    """
+    tokens = set()
+    for text in texts:
+        if not text:
+            continue
+        for part in force_text(text).lower().split():
+            tokens.add(part[:TOKEN_MAX_LENGTH])
+            tokens.update(word[:TOKEN_MAX_LENGTH] for word in _WORD_RE.findall(part))
+    return tokens
+
+
+def _get_translated_names(instance):
+    return [translation.name for translation in instance.translations.all()]
+
+
+def _get_product_texts(product):
+    return [product.sku, product.barcode] + _get_translated_names(product)
+
+
+def _get_contact_texts(contact):
+    return [contact.name, contact.email]
+
+
+def _get_order_texts(order):
+    return [order.identifier, order.reference_number, order.email, order.phone]
+
+
+def _get_category_texts(category):
+    return [category.identifier] + _get_translated_names(category)
+
+
+#: Indexed object kinds, mapped to their model and a function returning
+#: the texts to index for an instance.
+INDEXERS = {
+    "product": (Product, _get_product_texts),
+    "contact": (Contact, _get_contact_texts),
+    "order": (Order, _get_order_texts),
+    "category": (Category, _get_category_texts),
+}
+
+
+def _get_kind(instance):
+    for kind, (model, get_texts) in INDEXERS.items():
+        if isinstance(instance, model):
+            return kind
+    return None
+
+
+@atomic
+def index_object(instance, created=False):
+    """
+    Update the index entries of the given object.
+
+    Only the tokens that changed are written, so saving an object
+    without touching its indexed fields leaves the index as is.
+
+    :type instance: django.db.models.Model
+    :param created: Whether the object was just created (and thus has no entries yet)
+    :type created: bool
+    """
+    kind = _get_kind(instance)
+    if not kind or not instance.pk:
+        return
+    get_texts = INDEXERS[kind][1]
+    tokens = tokenize(*get_texts(instance))
+    entries = SearchIndexEntry.objects.filter(kind=kind, object_id=instance.pk)
+    old_tokens = (set() if created else set(entries.values_list("token", flat=True)))
+    if old_tokens - tokens:
+        entries.filter(token__in=(old_tokens - tokens)).delete()
+    if tokens - old_tokens:
+        SearchIndexEntry.objects.bulk_create([
+            SearchIndexEntry(kind=kind, object_id=instance.pk, token=token)
+            for token in (tokens - old_tokens)
+        ])
+
+
+def index_objects(kind, ids):
+    """
+    Replace the index entries of the objects of the given kind in bulk.
+
+    :type kind: str
+    :type ids: Iterable[int]
+    """
+    model, get_texts = INDEXERS[kind]
+    queryset = model.objects.filter(pk__in=ids)
+    if hasattr(model, "_parler_meta"):
+        queryset = queryset.prefetch_related("translations")
+    with atomic():
+        SearchIndexEntry.objects.filter(kind=kind, object_id__in=ids).delete()
+        SearchIndexEntry.objects.bulk_create([
+            SearchIndexEntry(kind=kind, object_id=instance.pk, token=token)
+            for instance in queryset
+            for token in tokenize(*get_texts(instance))
+        ], batch_size=1000)
+
+
+def unindex_object(instance):
+    """
+    Remove the index entries of the given object.
+
+    :type instance: django.db.models.Model
+    """
+    kind = _get_kind(instance)
+    if kind and instance.pk:
+        SearchIndexEntry.objects.filter(kind=kind, object_id=instance.pk).delete()
+
+
+def rebuild_index(kind, batch_size=500):
+    """
+    Rebuild the index for all objects of the given kind.
+
+    :type kind: str
+    :return: Number of indexed objects
+    :rtype: int
+    """
+    model = INDEXERS[kind][0]
+    ids = list(model.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(ids), batch_size):
+        index_objects(kind, ids[start:start + batch_size])
+    return len(ids)
+
+
+def _ensure_index(kind):
+    """
+    Build the index of the given kind if it has never been built.
+
+    This populates the index on the first search after upgrading from a
+    version without the index.  The check is done once per process.
+    """
+    if kind in _checked_kinds:
+        return
+    if not SearchIndexEntry.objects.filter(kind=kind).exists():
+        LOG.info("Building the admin search index of %s objects", kind)
+        rebuild_index(kind)
+    _checked_kinds.add(kind)
+
+
+def search_index(kind, query, limit=10):
+    """
+    Find ids of objects of the given kind matching every token of the query.
+
+    Each query token is matched as a prefix of the indexed tokens.
+    Objects having the most exact token matches are returned first,
+    then the newest ones.
+
+    :type kind: str
+    :type query: str
+    :rtype: list[int]
+    """
+    query_tokens = set(token[:TOKEN_MAX_LENGTH] for token in force_text(query).lower().split())
+    if not query_tokens:
+        return []
+
+    _ensure_index(kind)
+    entries = SearchIndexEntry.objects.filter(kind=kind)
+    for token in query_tokens:
+        entries = entries.filter(object_id__in=SearchIndexEntry.objects.filter(
+            kind=kind, token__startswith=token
+        ).values("object_id"))
+    exact_matches = Sum(Case(
+        When(token__in=query_tokens, then=Value(1)), default=Value(0), output_field=IntegerField()))
+    results = entries.values("object_id").annotate(exact_matches=exact_matches).order_by("-exact_matches", "-object_id")
+    return [result["object_id"] for result in results[:limit]]
+
+
+def index_object_signal_handler(sender, instance, **kwargs):
+    if kwargs.get("raw"):
+        return
+    index_object(instance, created=kwargs.get("created", False))
+
+
+def index_translated_object_signal_handler(sender, instance, **kwargs):
+    if kwargs.get("raw"):
+        return
+    try:
+        master = instance.master
+    except ObjectDoesNotExist:  # The master is being deleted
+        return
+    index_object(master)
+
+
+def unindex_object_signal_handler(sender, instance, **kwargs):
+    unindex_object(instance)
+
+
+def index_bulk_updated_objects_signal_handler(sender, ids, **kwargs):
+    for kind, (model, get_texts) in INDEXERS.items():
+        if issubclass(sender, model):
+            index_objects(kind, list(ids))
+
+
+def connect_signals():
+    for model in (Product, Contact, PersonContact, CompanyContact, Order, Category):
+        uid = "shuup_admin:search_index:%s" % model._meta.model_name
+        post_save.connect(index_object_signal_handler, sender=model, dispatch_uid=uid)
+        post_delete.connect(unindex_object_signal_handler, sender=model, dispatch_uid=uid)
+        objects_bulk_updated.connect(index_bulk_updated_objects_signal_handler, sender=model, dispatch_uid=uid)
+    for model in (Product, Category):
+        translation_model = model._parler_meta.root_model
+        uid = "shuup_admin:search_index:%s" % translation_model._meta.model_name
+        post_save.connect(index_translated_object_signal_handler, sender=translation_model, dispatch_uid=uid)
+        post_delete.connect(index_translated_object_signal_handler, sender=translation_model, dispatch_uid=uid)
@@ -6,11 +6,15 @@
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
 from django.core.urlresolvers import reverse
-from django.http.response import HttpResponseRedirect
+from django.http.response import Http404, HttpResponseRedirect
 from django.views.generic.base import TemplateView
 
 import shuup
-from shuup.admin.dashboard import get_activity
+from shuup.admin.dashboard import DashboardAsyncBlock, get_activity
+from shuup.admin.dashboard.utils import (
+    get_cached_dashboard_blocks, get_dashboard_blocks, get_module_key,
+    get_notifications
+)
 from shuup.admin.module_registry import get_modules
 from shuup.admin.utils.permissions import get_missing_permissions
 from shuup.admin.utils.tour import is_tour_complete
@@ -28,13 +32,23 @@ class DashboardView(TemplateView):
         context["blocks"] = blocks = []
         for module in get_modules():
             if not get_missing_permissions(self.request.user, module.get_required_permissions()):
-                notifications.extend(module.get_notifications(request=self.request))
-                blocks.extend(module.get_dashboard_blocks(request=self.request))
+                notifications.extend(get_notifications(self.request, module))
+                blocks.extend(self._get_module_blocks(module))
         context["activity"] = get_activity(request=self.request)
         context["tour_key"] = "dashboard"
         context["tour_complete"] = is_tour_complete("dashboard")
         return context
 
+    def _get_module_blocks(self, module):
+        if module.dashboard_async:
+            cached_blocks = get_cached_dashboard_blocks(self.request, module)
+            if cached_blocks is not None:
+                return cached_blocks
+            module_key = get_module_key(module)
+            url = "%s?module=%s" % (reverse("shuup_admin:dashboard.blocks"), module_key)
+            return [DashboardAsyncBlock(id=module_key.replace(".", "-"), url=url)]
+        return get_dashboard_blocks(self.request, module)
+
     def get(self, request, *args, **kwargs):
         try_send_telemetry(request)
         if not setup_wizard_complete():
@@ -42,3 +56,25 @@ class DashboardView(TemplateView):
         elif request.shop.maintenance_mode:
             return HttpResponseRedirect(reverse("shuup_admin:home"))
         return super(DashboardView, self).get(request, *args, **kwargs)
+
+
+class DashboardBlocksView(TemplateView):
+    """
+    Render the dashboard blocks of a single module.
+
+    Used to load the blocks of `dashboard_async` modules after the
+    dashboard itself has been rendered.
+    """
+    template_name = "shuup/admin/dashboard/_block_list.jinja"
+
+    def get_context_data(self, **kwargs):
+        context = super(DashboardBlocksView, self).get_context_data(**kwargs)
+        module_key = self.request.GET.get("module")
+        for module in get_modules():
+            if get_module_key(module) != module_key:
+                continue
+            if get_missing_permissions(self.request.user, module.get_required_permissions()):
+                break
+            context["blocks"] = get_dashboard_blocks(self.request, module)
+            return context
+        raise Http404("No such dashboard module")
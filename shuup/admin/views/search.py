@@ -5,33 +5,112 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
+import hashlib
+import logging
+import time
 from itertools import chain
+from multiprocessing import TimeoutError
+from multiprocessing.pool import ThreadPool
 
+from django.conf import settings
+from django.db import close_old_connections
 from django.http.response import JsonResponse
+from django.utils import translation
+from django.utils.encoding import force_bytes, force_text
 from django.views.generic import View
 
 from shuup.admin.base import SearchResult
 from shuup.admin.module_registry import get_modules
+from shuup.admin.utils.permissions import get_permission_set_key
 from shuup.admin.utils.search import FuzzyMatcher
+from shuup.core import cache
+
+LOG = logging.getLogger(__name__)
+
+
+def _get_module_results(module, request, query, language, deadline):
+    if time.time() >= deadline:  # Not started before the search timed out
+        return []
+    with translation.override(language):
+        try:
+            return list(module.get_search_results(request, query) or ())
+        finally:
+            close_old_connections()
+
+
+def _get_normal_results(request, query, modules):
+    if not settings.SHUUP_ADMIN_SEARCH_WORKERS or len(modules) <= 1:
+        return list(chain.from_iterable((module.get_search_results(request, query) or ()) for module in modules))
+
+    language = translation.get_language()
+    deadline = time.time() + settings.SHUUP_ADMIN_SEARCH_TIME_BUDGET
+    # Every search gets a pool of its own: the threads of modules that
+    # exceed the time budget are left to finish in the background and
+    # must not hold up the searches that come after this one.
+    pool = ThreadPool(min(settings.SHUUP_ADMIN_SEARCH_WORKERS, len(modules)))
+    async_results = [
+        (module, pool.apply_async(_get_module_results, (module, request, query, language, deadline)))
+        for module in modules
+    ]
+    pool.close()
+    results = []
+    for module, async_result in async_results:
+        try:
+            results.extend(async_result.get(timeout=max(deadline - time.time(), 0)))
+        except TimeoutError:
+            LOG.warning("Admin search of module %r exceeded the time budget", module)
+    return results
+
+
+def _get_menu_entries_cache_key(request, modules):
+    module_names = ["%s.%s" % (module.__class__.__module__, module.__class__.__name__) for module in modules]
+    key_data = (get_permission_set_key(getattr(request, "user", None)), module_names, translation.get_language())
+    return "admin_search_menu_entries:%s" % hashlib.sha1(force_bytes(repr(key_data))).hexdigest()
+
+
+def _get_searchable_menu_entries(request, modules):
+    """
+    Get the searchable data of the menu entries of the given modules.
+
+    The data is cached per permission set (and language), so the menu
+    entries need not be rebuilt for every keystroke of the search.
+
+    :return: list of (text, url, icon, category, search texts) tuples
+    :rtype: list[tuple]
+    """
+    cache_key = _get_menu_entries_cache_key(request, modules)
+    entries = cache.get(cache_key)
+    if entries is None:
+        entries = [
+            (
+                force_text(menu_entry.text),
+                menu_entry.original_url,
+                menu_entry.icon,
+                (force_text(menu_entry.category) if menu_entry.category else menu_entry.category),
+                [force_text(text) for text in (menu_entry.get_search_query_texts() or ())],
+            )
+            for module in modules
+            for menu_entry in (module.get_menu_entries(request) or ())
+        ]
+        cache.set(cache_key, entries)
+    return entries
 
 
 def get_search_results(request, query):
     fuzzer = FuzzyMatcher(query)
-    normal_results = []
+    modules = list(get_modules())
+    normal_results = _get_normal_results(request, query, modules)
     menu_entry_results = []
-    for module in get_modules():
-        normal_results.extend(module.get_search_results(request, query) or ())
-        for menu_entry in module.get_menu_entries(request) or ():
-            texts = (menu_entry.get_search_query_texts() or ())
-            if any(fuzzer.test(text) for text in texts):
-                menu_entry_results.append(SearchResult(
-                    text=menu_entry.text,
-                    url=menu_entry.url,
-                    icon=menu_entry.icon,
-                    category=menu_entry.category,
-                    relevance=90,
-                    is_action=True
-                ))
+    for (text, url, icon, category, texts) in _get_searchable_menu_entries(request, modules):
+        if any(fuzzer.test(search_text) for search_text in texts):
+            menu_entry_results.append(SearchResult(
+                text=text,
+                url=url,
+                icon=icon,
+                category=category,
+                relevance=90,
+                is_action=True
+            ))
     results = sorted(
         chain(normal_results, menu_entry_results),
         key=lambda r: r.relevance,
@@ -7,7 +7,11 @@
 # LICENSE file in the root directory of this source tree.
 from django.db.models.deletion import ProtectedError
 from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
+from rest_framework.serializers import ListSerializer
+
+from shuup.api.pagination import ShuupCursorPagination
 
 
 class PermissionHelperMixin(object):
@@ -31,3 +35,56 @@ class ProtectedModelViewSetMixin(object):
             ref_obj = exc.protected_objects[0].__class__.__name__
             msg = "This object can not be deleted because it is referenced by {}".format(ref_obj)
             return Response(data={"error": msg}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class CursorPaginationMixin(object):
+    """
+    Mixin to allow clients to opt in to keyset (cursor) pagination by passing `pagination=cursor`.
+
+    The default pagination of the view is used otherwise.
+    """
+    cursor_pagination_class = ShuupCursorPagination
+    cursor_ordering_fields = ("id",)
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and self.request.query_params.get("pagination") == "cursor":
+            self._paginator = self.cursor_pagination_class()
+        return super(CursorPaginationMixin, self).paginator
+
+
+class SparseFieldsetSerializerMixin(object):
+    """
+    Mixin to limit the serialized fields to the ones requested with the `fields` query parameter.
+
+    E.g. `?fields=id,sku` only serializes the `id` and `sku` fields. The fields are dropped
+    before serialization so the omitted fields (e.g. `SerializerMethodField`s) are never computed.
+    This only applies to read requests and top level serializers, and the `id` field is always kept.
+    """
+    fields_query_param = "fields"
+
+    def get_fields(self):
+        # The fields are built lazily, after the serializer is bound to its
+        # parent, so the context is that of the root serializer here.
+        fields = super(SparseFieldsetSerializerMixin, self).get_fields()
+        if not self._is_top_level():
+            return fields
+
+        request = self.context.get("request")
+        if not request or request.method not in SAFE_METHODS:
+            return fields
+
+        requested_fields = request.query_params.get(self.fields_query_param)
+        if not requested_fields:
+            return fields
+
+        allowed = set(field.strip() for field in requested_fields.split(",")) | set(["id"])
+        for field_name in set(fields.keys()) - allowed:
+            fields.pop(field_name)
+        return fields
+
+    def _is_top_level(self):
+        parent = self.parent
+        if isinstance(parent, ListSerializer):  # `many=True`
+            parent = parent.parent
+        return (parent is None)
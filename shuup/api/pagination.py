@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+from rest_framework.pagination import CursorPagination
+
+
+class ShuupCursorPagination(CursorPagination):
+    """
+    Keyset based pagination for crawling large result sets.
+
+    Unlike limit/offset pagination this never issues `COUNT(*)` queries
+    and every page is fetched with an indexed `WHERE` clause instead of
+    an `OFFSET`, so deep pages are as fast as the first one.
+
+    The ordering can be selected with the `cursor_ordering` query
+    parameter from the fields listed in the view's
+    `cursor_ordering_fields` (defaults to `id`).  It is deliberately not
+    `ordering`, which belongs to the view's `OrderingFilter`.
+    """
+    ordering = "id"
+    ordering_query_param = "cursor_ordering"
+    page_size = 100
+    page_size_query_param = "limit"
+    max_page_size = 1000
+
+    def get_page_size(self, request):
+        value = request.query_params.get(self.page_size_query_param)
+        try:
+            page_size = int(value)
+        except (TypeError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, request, queryset, view):
+        allowed_fields = getattr(view, "cursor_ordering_fields", None) or (self.ordering,)
+        ordering = request.query_params.get(self.ordering_query_param, "")
+        if ordering.lstrip("-") in allowed_fields:
+            return (ordering,)
+        return (allowed_fields[0],)
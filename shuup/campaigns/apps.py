@@ -71,9 +71,11 @@ class CampaignAppConfig(AppConfig):
         from shuup.campaigns.models import ContactCondition, ContactGroupCondition
         from shuup.campaigns.signal_handlers import (
             invalidate_context_condition_cache,
-            update_customers_groups, update_filter_cache
+            update_customers_groups, update_filter_cache,
+            update_filter_cache_for_bulk_update
         )
         from shuup.core.models import ContactGroup, Payment, ShopProduct
+        from shuup.core.signals import objects_bulk_updated
         post_save.connect(
             update_customers_groups,
             sender=Payment,
@@ -123,3 +125,8 @@ class CampaignAppConfig(AppConfig):
             sender=ShopProduct.categories.through,
             dispatch_uid="campaigns:invalidate_caches_for_shop_product_m2m_change"
         )
+        objects_bulk_updated.connect(
+            update_filter_cache_for_bulk_update,
+            sender=ShopProduct,
+            dispatch_uid="campaigns:invalidate_caches_for_shop_product_bulk_update"
+        )
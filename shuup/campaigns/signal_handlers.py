@@ -9,7 +9,7 @@ from shuup.campaigns.consts import (
     CAMPAIGNS_CACHE_NAMESPACE, CATALOG_FILTER_CACHE_NAMESPACE,
     CONTEXT_CONDITION_CACHE_NAMESPACE
 )
-from shuup.campaigns.models import CatalogFilter
+from shuup.campaigns.models import CatalogFilter, CategoryFilter
 from shuup.campaigns.models.contact_group_sales_ranges import \
     ContactGroupSalesRange
 from shuup.campaigns.models.matching import (
@@ -61,3 +61,19 @@ def invalidate_context_filter_cache(sender, instance, **kwargs):
     cache.bump_version(CAMPAIGNS_CACHE_NAMESPACE)
     # Let's try to preserve catalog filter cache as long as possible
     cache.bump_version("%s:%s" % (CATALOG_FILTER_CACHE_NAMESPACE, instance.pk))
+
+
+def update_filter_cache_for_bulk_update(sender, ids, fields=None, **kwargs):
+    cache.bump_version(CAMPAIGNS_CACHE_NAMESPACE)
+    for shop_product_id in ids:
+        cache.bump_version("%s:%s" % (CATALOG_FILTER_CACHE_NAMESPACE, shop_product_id))
+
+    # Catalog filters only match on categories among the bulk editable fields
+    if fields is not None and not set(fields) & {"categories", "primary_category"}:
+        return
+    # The previous categories are not known anymore, so recheck every filtered category
+    filter_category_ids = set(CategoryFilter.objects.exclude(categories=None).values_list("categories", flat=True))
+    for shop_product in ShopProduct.objects.filter(pk__in=ids):
+        update_matching_catalog_filters(shop_product)
+        if filter_category_ids:
+            update_matching_category_filters(shop_product, filter_category_ids)
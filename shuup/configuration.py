@@ -25,9 +25,17 @@ configuration.
 """
 from __future__ import unicode_literals
 
+import copy
+
+from django.db.models import Q
+
 from shuup.core import cache
 from shuup.core.models import ConfigurationItem
 
+#: Process-local configuration snapshots by shop id (0 for the global
+#: configuration) as (versions, configuration) pairs
+_snapshots = {}
+
 
 def set(shop, key, value):
     """
@@ -48,6 +56,7 @@ def set(shop, key, value):
         shop=shop, key=key, defaults={"value": value})
     if shop:
         cache.set(_get_cache_key(shop), None)
+        cache.bump_version(_get_shop_namespace(shop.pk))
     else:
         cache.bump_version(_SHOP_CONF_NAMESPACE)
 
@@ -69,24 +78,74 @@ def get(shop, key, default=None):
     :return: Configuration value or the default value
     :rtype: Any
     """
-    return _get_configuration(shop).get(key, default)
+    value = _get_configuration(shop).get(key, default)
+    # The snapshot is shared, so don't hand out its mutable values
+    return (copy.deepcopy(value) if isinstance(value, (dict, list)) else value)
+
+
+def preload(shops=()):
+    """
+    Load the configuration snapshots of the given shops and the global configuration.
+
+    All of the configuration items are read with a single query.
+
+    :param shops: Shops to load the configuration for
+    :type shops: Iterable[shuup.core.models.Shop]
+    """
+    shop_ids = [shop.pk for shop in shops]
+    items = {}
+    for conf_item in ConfigurationItem.objects.filter(Q(shop__in=shop_ids) | Q(shop=None)):
+        items.setdefault(conf_item.shop_id or 0, {})[conf_item.key] = conf_item.value
+
+    global_configuration = items.get(0, {})
+    for shop_id in [0] + shop_ids:
+        configuration = dict(global_configuration)
+        if shop_id:
+            configuration.update(items.get(shop_id, {}))
+        cache.set(_get_shop_id_cache_key(shop_id), configuration)
+        _snapshots[shop_id] = (_get_versions(shop_id), configuration)
 
 
 def _get_configuration(shop):
     """
     Get global or shop specific configuration with caching.
 
+    The configuration is kept in a process-local snapshot which is
+    valid for as long as the versions of the global and the shop's
+    configuration namespaces are unchanged.  The versions are read from
+    the cache at most once per request (see `shuup.core.cache`).
+
     :param shop: Shop to get configuration for, or None
     :type shop: shuup.core.models.Shop|None
     :return: Global or shop specific configuration
     :rtype: dict
     """
+    shop_id = (shop.pk if shop else 0)
+    versions = _get_versions(shop_id)
+    (snapshot_versions, configuration) = _snapshots.get(shop_id, (None, None))
+    if configuration is not None and snapshot_versions == versions:
+        return configuration
     configuration = cache.get(_get_cache_key(shop))
     if configuration is None:
         configuration = _cache_shop_configuration(shop)
+    _snapshots[shop_id] = (versions, configuration)
     return configuration
 
 
+def _get_versions(shop_id):
+    namespaces = [_SHOP_CONF_NAMESPACE]
+    if shop_id:
+        namespaces.append(_get_shop_namespace(shop_id))
+    versions = []
+    for namespace in namespaces:
+        version = cache.get_version(namespace)
+        if version is None:
+            cache.bump_version(namespace)
+            version = cache.get_version(namespace)
+        versions.append(version)
+    return tuple(versions)
+
+
 def _cache_shop_configuration(shop):
     """
     Cache global or shop specific configuration.
@@ -125,6 +184,10 @@ def _get_configuration_from_db(shop):
 _SHOP_CONF_NAMESPACE = str("shop_config")
 
 
+def _get_shop_namespace(shop_id):
+    return str("%s_%d") % (_SHOP_CONF_NAMESPACE, shop_id)
+
+
 def _get_cache_key(shop):
     """
     Get global or shop specific cache key.
@@ -134,4 +197,8 @@ def _get_cache_key(shop):
     :return: Global or shop specific cache key
     :rtype: str
     """
-    return str("%s:%s") % (_SHOP_CONF_NAMESPACE, shop.pk if shop else 0)
+    return _get_shop_id_cache_key(shop.pk if shop else 0)
+
+
+def _get_shop_id_cache_key(shop_id):
+    return str("%s:%s") % (_SHOP_CONF_NAMESPACE, shop_id)
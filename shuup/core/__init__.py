@@ -49,8 +49,14 @@ class ShuupCoreAppConfig(AppConfig):
         from shuup.core.utils.context_cache import (
             bump_product_signal_handler, bump_shop_product_signal_handler
         )
-        from shuup.core.models import Product, ShopProduct
+        from shuup.core.models import ContactGroup, Product, ShopProduct
+        from shuup.core.models._contacts import clear_contact_group_ids_signal_handler
         from django.db.models.signals import m2m_changed
+        m2m_changed.connect(
+            clear_contact_group_ids_signal_handler,
+            sender=ContactGroup.members.through,
+            dispatch_uid="contact:clear_contact_group_ids"
+        )
         m2m_changed.connect(
             bump_shop_product_signal_handler,
             sender=ShopProduct.categories.through,
@@ -68,5 +74,18 @@ class ShuupCoreAppConfig(AppConfig):
             dispatch_uid="shop_product:bump_shop_product_cache"
         )
 
+        from shuup.core.signals import objects_bulk_updated
+        from shuup.core.utils.context_cache import bump_bulk_updated_products_signal_handler
+        objects_bulk_updated.connect(
+            bump_bulk_updated_products_signal_handler,
+            sender=Product,
+            dispatch_uid="product:bump_bulk_updated_product_cache"
+        )
+        objects_bulk_updated.connect(
+            bump_bulk_updated_products_signal_handler,
+            sender=ShopProduct,
+            dispatch_uid="shop_product:bump_bulk_updated_shop_product_cache"
+        )
+
 
 default_app_config = "shuup.core.ShuupCoreAppConfig"
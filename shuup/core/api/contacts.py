@@ -12,7 +12,10 @@ from django_filters.rest_framework import DjangoFilterBackend, FilterSet
 from rest_framework.serializers import ModelSerializer
 from rest_framework.viewsets import ModelViewSet
 
-from shuup.api.mixins import PermissionHelperMixin, ProtectedModelViewSetMixin
+from shuup.api.mixins import (
+    CursorPaginationMixin, PermissionHelperMixin, ProtectedModelViewSetMixin,
+    SparseFieldsetSerializerMixin
+)
 from shuup.core.models import Contact, ContactGroup
 
 
@@ -22,13 +25,12 @@ class ContactGroupSerializer(ModelSerializer):
         model = ContactGroup
 
 
-class ContactSerializer(ModelSerializer):
+class ContactSerializer(SparseFieldsetSerializerMixin, ModelSerializer):
     groups = ContactGroupSerializer(many=True, read_only=True)
 
     class Meta:
         fields = "__all__"
         model = Contact
-        fields = "__all__"
 
 
 class ContactFilter(FilterSet):
@@ -37,11 +39,13 @@ class ContactFilter(FilterSet):
         fields = ['email', 'groups']
 
 
-class ContactViewSet(ProtectedModelViewSetMixin, PermissionHelperMixin, ModelViewSet):
+class ContactViewSet(CursorPaginationMixin, ProtectedModelViewSetMixin, PermissionHelperMixin, ModelViewSet):
     """
     retrieve: Fetches a contact by its ID.
 
     list: Lists all available contacts.
+    Pass `pagination=cursor` to crawl the list with cursor pagination
+    and `fields` to limit the returned fields.
 
     delete: Deletes a contact.
     If the object is related to another one and the relationship is protected, an error will be returned.
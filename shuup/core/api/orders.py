@@ -11,7 +11,7 @@ from django.http import JsonResponse
 from django.utils.encoding import force_text
 from django.utils.timezone import now
 from django.utils.translation import ugettext_lazy as _
-from django_filters import DateTimeFilter
+from django_filters import DateTimeFilter, IsoDateTimeFilter
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet
 from rest_framework import serializers, status
 from rest_framework.decorators import detail_route
@@ -20,7 +20,10 @@ from rest_framework.viewsets import ModelViewSet
 
 from shuup.admin.modules.orders.json_order_creator import JsonOrderCreator
 from shuup.admin.modules.orders.views.edit import encode_address
-from shuup.api.mixins import PermissionHelperMixin, ProtectedModelViewSetMixin
+from shuup.api.mixins import (
+    CursorPaginationMixin, PermissionHelperMixin, ProtectedModelViewSetMixin,
+    SparseFieldsetSerializerMixin
+)
 from shuup.core.models import (
     Contact, MutableAddress, Order, OrderLine, OrderStatus, Payment, Shop
 )
@@ -50,7 +53,7 @@ class PaymentSerializer(serializers.ModelSerializer):
         fields = ("payment_identifier", "amount_value", "description")
 
 
-class OrderSerializer(serializers.ModelSerializer):
+class OrderSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     lines = OrderLineSerializer(many=True)
     billing_address = AddressSerializer(read_only=True)
     shipping_address = AddressSerializer(read_only=True)
@@ -76,6 +79,7 @@ class OrderSerializer(serializers.ModelSerializer):
 
 class OrderFilter(FilterSet):
     date = DateTimeFilter(name="order_date", method="filter_date")
+    modified_since = IsoDateTimeFilter(name="modified_on", lookup_expr="gte")
 
     def filter_date(self, queryset, name, value):
         if not value:
@@ -84,14 +88,18 @@ class OrderFilter(FilterSet):
 
     class Meta:
         model = Order
-        fields = ["identifier", "date", "status"]
+        fields = ["identifier", "date", "status", "modified_since"]
 
 
-class OrderViewSet(PermissionHelperMixin, ProtectedModelViewSetMixin, ModelViewSet):
+class OrderViewSet(CursorPaginationMixin, PermissionHelperMixin, ProtectedModelViewSetMixin, ModelViewSet):
     """
     retrieve: Fetches an order by its ID.
 
     list: Lists all orders.
+    Pass `pagination=cursor` to crawl the list with cursor pagination ordered by `id` or `modified_on`
+    (selected with `cursor_ordering`),
+    `fields` to limit the returned fields and `modified_since` to only list orders modified after
+    the given ISO 8601 timestamp.
 
     delete: Deletes an order.
     If the object is related to another one and the relationship is protected, an error will be returned.
@@ -109,6 +117,7 @@ class OrderViewSet(PermissionHelperMixin, ProtectedModelViewSetMixin, ModelViewS
     queryset = Order.objects.all()
     filter_backends = (DjangoFilterBackend,)
     filter_class = OrderFilter
+    cursor_ordering_fields = ("id", "modified_on")
 
     def get_view_name(self):
         return _("Orders")
@@ -18,7 +18,10 @@ from rest_framework.response import Response
 
 from shuup.api.decorators import schema_serializer_class
 from shuup.api.fields import EnumField
-from shuup.api.mixins import PermissionHelperMixin, ProtectedModelViewSetMixin
+from shuup.api.mixins import (
+    CursorPaginationMixin, PermissionHelperMixin, ProtectedModelViewSetMixin,
+    SparseFieldsetSerializerMixin
+)
 from shuup.core.api.product_media import (
     ProductMediaSerializer, ProductMediaUploadSerializer
 )
@@ -36,7 +39,7 @@ from .product_variation import (
 )
 
 
-class ShopProductSerializer(serializers.ModelSerializer):
+class ShopProductSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     orderable = serializers.SerializerMethodField()
     visibility = EnumField(enum=ShopProductVisibility)
     visibility_limit = EnumField(enum=ProductVisibility)
@@ -114,7 +117,7 @@ class ShopProductSubsetSerializer(ShopProductSerializer):
         exclude = ("id", "product")
 
 
-class ProductSerializer(TranslatableModelSerializer):
+class ProductSerializer(SparseFieldsetSerializerMixin, TranslatableModelSerializer):
     translations = TranslatedFieldsField(shared_model=Product)
     shop_products = ShopProductSubsetSerializer(many=True, required=False)
     primary_image = ProductMediaSerializer(read_only=True)
@@ -265,17 +268,22 @@ class ProductFilter(FilterSet):
     supplier = django_filters.ModelChoiceFilter(name="shop_products__suppliers",
                                                 queryset=Supplier.objects.all(),
                                                 lookup_expr="exact")
+    modified_since = django_filters.IsoDateTimeFilter(name="modified_on", lookup_expr="gte")
 
     class Meta:
         model = Product
-        fields = ["id", "product", "sku", "supplier"]
+        fields = ["id", "product", "sku", "supplier", "modified_since"]
 
 
-class ProductViewSet(ProtectedModelViewSetMixin, PermissionHelperMixin, viewsets.ModelViewSet):
+class ProductViewSet(CursorPaginationMixin, ProtectedModelViewSetMixin, PermissionHelperMixin, viewsets.ModelViewSet):
     """
     retrieve: Fetches a product by its ID.
 
     list: Lists all available products.
+    Pass `pagination=cursor` to crawl the list with cursor pagination ordered by `id` or `modified_on`
+    (selected with `cursor_ordering`),
+    `fields` to limit the returned fields and `modified_since` to only list products modified after
+    the given ISO 8601 timestamp.
 
     delete: Deletes a product.
     If the object is related to another one and the relationship is protected, an error will be returned.
@@ -293,6 +301,7 @@ class ProductViewSet(ProtectedModelViewSetMixin, PermissionHelperMixin, viewsets
     serializer_class = ProductSerializer
     filter_backends = (filters.OrderingFilter, DjangoFilterBackend)
     filter_class = ProductFilter
+    cursor_ordering_fields = ("id", "modified_on")
 
     def get_view_name(self):
         return _("Products")
@@ -483,11 +492,14 @@ class ProductViewSet(ProtectedModelViewSetMixin, PermissionHelperMixin, viewsets
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class ShopProductViewSet(ProtectedModelViewSetMixin, PermissionHelperMixin, viewsets.ModelViewSet):
+class ShopProductViewSet(CursorPaginationMixin, ProtectedModelViewSetMixin, PermissionHelperMixin,
+                         viewsets.ModelViewSet):
     """
     retrieve: Fetches a shop product by its ID.
 
     list: Lists all available products.
+    Pass `pagination=cursor` to crawl the list with cursor pagination
+    and `fields` to limit the returned fields.
 
     delete: Deletes a shop product.
     If the object is related to another one and the relationship is protected, an error will be returned.
@@ -12,7 +12,10 @@ from django.utils.translation import ugettext_lazy as _
 from django_filters.rest_framework import DjangoFilterBackend, FilterSet
 from rest_framework import serializers, viewsets
 
-from shuup.api.mixins import PermissionHelperMixin
+from shuup.api.mixins import (
+    CursorPaginationMixin, PermissionHelperMixin,
+    SparseFieldsetSerializerMixin
+)
 from shuup.core.models import Product, Shipment, ShipmentProduct, Shop
 
 
@@ -22,7 +25,7 @@ class ShipmentProductSerializer(serializers.ModelSerializer):
         exclude = ("shipment", "id")
 
 
-class ShipmentSerializar(serializers.ModelSerializer):
+class ShipmentSerializar(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     products = ShipmentProductSerializer(many=True, read_only=True)
 
     class Meta:
@@ -43,12 +46,14 @@ class ShipmentFilter(FilterSet):
         fields = ["order", "product", "shop"]
 
 
-class ShipmentViewSet(PermissionHelperMixin, viewsets.ReadOnlyModelViewSet):
+class ShipmentViewSet(CursorPaginationMixin, PermissionHelperMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve: Fetches a shipment by its ID.
 
     list: Lists all shipments.
     You can filter the shipments by `product`, `order` or `shop`.
+    Pass `pagination=cursor` to crawl the list with cursor pagination
+    and `fields` to limit the returned fields.
     """
 
     queryset = Shipment.objects.all()
@@ -27,6 +27,7 @@ __all__ = [
     "bump_version",
     "clear",
     "get",
+    "get_version",
     "set",
     "VersionedCache",
 ]
@@ -35,4 +36,5 @@ _default_cache = VersionedCache(using="default")
 get = _default_cache.get
 set = _default_cache.set
 bump_version = _default_cache.bump_version
+get_version = _default_cache.get_version
 clear = _default_cache.clear
@@ -151,3 +151,4 @@ class VersionedCache(object):
 
     def clear(self):
         self._cache.clear()
+        _versions.__dict__.clear()
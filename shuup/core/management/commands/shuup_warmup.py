@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Import all provides and spec settings, compile templates and preload caches.
+
+Reports the time taken by each step, slowest first.
+"""
+from django.core.management.base import BaseCommand
+
+from shuup.core.utils.warmup import warm_up
+
+
+class Command(BaseCommand):
+    help = __doc__.strip()
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--no-templates", action="store_false", dest="templates", default=True,
+            help="Do not compile the templates")
+        parser.add_argument(
+            "--no-caches", action="store_false", dest="caches", default=True,
+            help="Do not preload the caches")
+        parser.add_argument(
+            "--limit", type=int, default=30,
+            help="Number of the slowest steps to report (0 for all)")
+
+    def handle(self, *args, **options):
+        steps = warm_up(templates=options["templates"], caches=options["caches"])
+        slowest = sorted(steps, key=lambda step: step.duration, reverse=True)
+        for step in (slowest[:options["limit"]] if options["limit"] else slowest):
+            self.stdout.write("%9.1f ms  %-8s  %s" % (step.duration * 1000, step.kind, step.name))
+        for step in steps:
+            if step.error:
+                self.stderr.write("Failed %s %s: %s" % (step.kind, step.name, step.error))
+        self.stdout.write("Warmed up %d items in %.1f ms (%d failed)" % (
+            len(steps), sum(step.duration for step in steps) * 1000, len([step for step in steps if step.error])))
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import django.db.models.deletion
+import enumfields.fields
+from django.db import migrations, models
+
+import shuup.core.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shuup', '0027_modify_shop_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShopCounter',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('type', enumfields.fields.EnumIntegerField(verbose_name='type', enum=shuup.core.models.CounterType)),
+                ('value', models.IntegerField(verbose_name='value', default=0)),
+                ('shop', models.ForeignKey(
+                    verbose_name='shop', related_name='+', on_delete=django.db.models.deletion.CASCADE,
+                    to='shuup.Shop')),
+            ],
+            options={
+                'verbose_name': 'shop counter',
+                'verbose_name_plural': 'shop counters',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='shopcounter',
+            unique_together=set([('shop', 'type')]),
+        ),
+    ]
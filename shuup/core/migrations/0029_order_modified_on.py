@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shuup', '0028_shop_counter'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='order',
+            name='modified_on',
+            field=models.DateTimeField(auto_now=True, verbose_name='modified on'),
+        ),
+    ]
@@ -21,7 +21,7 @@ from ._contacts import (
     AnonymousContact, CompanyContact, Contact, ContactGroup, Gender,
     get_company_contact, get_person_contact, PersonContact
 )
-from ._counters import Counter, CounterType
+from ._counters import Counter, CounterType, ShopCounter
 from ._currencies import Currency, get_currency_precision
 from ._manufacturers import Manufacturer
 from ._order_lines import (
@@ -152,6 +152,7 @@ __all__ = [
     "ShippingStatus",
     "ShuupModel",
     "Shop",
+    "ShopCounter",
     "ShopProduct",
     "ShopProductVisibility",
     "ShopStatus",
@@ -35,6 +35,10 @@ PROTECTED_CONTACT_GROUP_IDENTIFIERS = [
     DEFAULT_ANONYMOUS_GROUP_IDENTIFIER
 ]
 
+#: Version of the contact group memberships, bumped on every change to
+#: invalidate the memoized group ids of the contacts of the process
+_group_memberships_version = [0]
+
 
 class ContactGroupQuerySet(TranslatableQuerySet):
     def with_price_display_options(self):
@@ -92,6 +96,7 @@ class Contact(PolymorphicShuupModel):
     default_tax_group_getter = None
     default_contact_group_identifier = None
     default_contact_group_name = None
+    _group_ids = None
 
     created_on = models.DateTimeField(auto_now_add=True, editable=False, verbose_name=_('created on'))
     identifier = InternalIdentifierField(unique=True, null=True, blank=True)
@@ -213,6 +218,23 @@ class Contact(PolymorphicShuupModel):
             return group_with_options.get_price_display_options()
         return PriceDisplayOptions()
 
+    def get_group_ids(self):
+        """
+        Get the ids of the groups of the contact.
+
+        The ids are memoized on the contact instance.  Changing any
+        group memberships (through a contact or a group) invalidates the
+        memos of all contact instances of the process.
+
+        :rtype: set[int]
+        """
+        if self._group_ids is None or self._group_ids[0] != _group_memberships_version[0]:
+            self._group_ids = (_group_memberships_version[0], set(self.groups.values_list("pk", flat=True)))
+        return self._group_ids[1]
+
+    def clear_group_ids(self):
+        self._group_ids = None
+
     def save(self, *args, **kwargs):
         add_to_default_group = bool(self.pk is None and self.default_contact_group_identifier)
         super(Contact, self).save(*args, **kwargs)
@@ -390,6 +412,19 @@ class AnonymousContact(Contact):
         return ContactGroup.objects.filter(identifier=self.default_contact_group_identifier)
 
 
+def clear_contact_group_ids_signal_handler(sender, instance, action, reverse, **kwargs):
+    """
+    Signal handler for invalidating the memoized group ids of contacts
+
+    :param instance: Contact or contact group whose memberships changed
+    :type instance: shuup.core.models.Contact|shuup.core.models.ContactGroup
+    """
+    if action.startswith("post_"):
+        # The contacts of a change made through a group are only known by
+        # their ids, so the memos of all contact instances are invalidated.
+        _group_memberships_version[0] += 1
+
+
 def _split_name(full_name):
     names = full_name.rsplit(" ", 1)
     return (names if len(names) == 2 else [full_name, ""])
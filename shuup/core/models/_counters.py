@@ -7,11 +7,18 @@
 # LICENSE file in the root directory of this source tree.
 from __future__ import with_statement
 
-from django.db import models, transaction
+import threading
+
+from django.conf import settings
+from django.db import connections, models, router, transaction
 from django.utils.translation import ugettext_lazy as _
 from enumfields import Enum, EnumIntegerField
 
-__all__ = ("Counter", )
+__all__ = ("Counter", "CounterType", "ShopCounter")
+
+#: Process-local reserved counter blocks (as [next value, end]) by counter key
+_blocks = {}
+_blocks_lock = threading.Lock()
 
 
 class CounterType(Enum):
@@ -31,9 +38,115 @@ class Counter(models.Model):
 
     @classmethod
     def get_and_increment(cls, id):
-        with transaction.atomic():
-            counter, created = cls.objects.select_for_update().get_or_create(id=id)
+        return cls.allocate(id)
+
+    @classmethod
+    def allocate(cls, id, count=1, using=None):
+        """
+        Reserve `count` consecutive values of the counter.
+
+        The counter row stays locked until the end of the current
+        transaction.
+
+        :return: The first reserved value
+        :rtype: int
+        """
+        using = (using or router.db_for_write(cls))
+        with transaction.atomic(using=using):
+            counter, created = cls.objects.using(using).select_for_update().get_or_create(id=id)
             current = counter.value
-            counter.value += 1
-            counter.save()
+            counter.value += count
+            counter.save(using=using, update_fields=("value",))
         return current
+
+
+class ShopCounter(models.Model):
+    shop = models.ForeignKey("Shop", related_name="+", on_delete=models.CASCADE, verbose_name=_("shop"))
+    type = EnumIntegerField(CounterType, verbose_name=_('type'))
+    value = models.IntegerField(default=0, verbose_name=_('value'))
+
+    class Meta:
+        unique_together = [("shop", "type")]
+        verbose_name = _('shop counter')
+        verbose_name_plural = _('shop counters')
+
+    @classmethod
+    def allocate(cls, shop, type, count=1, using=None):
+        """
+        Reserve `count` consecutive values of the shop's counter.
+
+        A new shop counter starts from the value of the global counter
+        of the same type, so it never hands out values already handed
+        out by the global counter.
+
+        :return: The first reserved value
+        :rtype: int
+        """
+        using = (using or router.db_for_write(cls))
+        with transaction.atomic(using=using):
+            queryset = cls.objects.using(using).select_for_update()
+            counter = queryset.filter(shop=shop, type=type).first()
+            if counter is None:
+                initial = Counter.objects.using(using).filter(id=type).values_list("value", flat=True).first()
+                counter, created = queryset.get_or_create(shop=shop, type=type, defaults={"value": initial or 0})
+            current = counter.value
+            counter.value += count
+            counter.save(using=using, update_fields=("value",))
+        return current
+
+
+def _allocate(type, shop, count, using=None):
+    if shop:
+        return ShopCounter.allocate(shop, type, count, using=using)
+    return Counter.allocate(type, count, using=using)
+
+
+def _allocate_block(type, shop, size):
+    using = router.db_for_write(ShopCounter if shop else Counter)
+    if connections[using].in_atomic_block:
+        # A block reserved within the current transaction would be
+        # handed out again by other processes if the transaction was
+        # rolled back, so blocks are only reserved (and committed)
+        # through a connection of their own, if one is configured.
+        alias = settings.SHUUP_COUNTER_DATABASE_ALIAS
+        if not alias:
+            return (_allocate(type, shop, 1, using=using), 1)
+        using = alias
+    return (_allocate(type, shop, size, using=using), size)
+
+
+def get_next_counter_value(type, shop=None, gapless=False):
+    """
+    Get the next value of a counter.
+
+    By default the values are handed out from blocks of
+    `SHUUP_COUNTER_BLOCK_SIZE` values reserved by each process at a
+    time (hi/lo allocation), so the counter row is only locked once per
+    block.  The values are unique and ascending per process, but values
+    of blocks of different processes interleave and values reserved by a
+    process that exits are never used.
+
+    In gapless mode every value is reserved in the current transaction,
+    keeping the counter row locked until the transaction ends.
+
+    :param type: Type of the counter
+    :type type: CounterType
+    :param shop: Shop of a per-shop counter, or None for the global counter
+    :type shop: shuup.core.models.Shop|None
+    :param gapless: Whether to use strictly gapless allocation
+    :type gapless: bool
+    :rtype: int
+    """
+    block_size = settings.SHUUP_COUNTER_BLOCK_SIZE
+    if gapless or block_size <= 1:
+        return _allocate(type, shop, 1)
+
+    key = (type.value, (shop.pk if shop else None))
+    with _blocks_lock:
+        block = _blocks.get(key)
+        if not block or block[0] >= block[1]:
+            (start, size) = _allocate_block(type, shop, block_size)
+            block = _blocks[key] = [start, start + size]
+        value = block[0]
+        block[0] += 1
+    return value
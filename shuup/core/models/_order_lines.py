@@ -18,6 +18,7 @@ from jsonfield import JSONField
 from shuup.core.fields import MoneyValueField, QuantityField, UnsavedForeignKey
 from shuup.core.pricing import Priceful
 from shuup.core.taxing import LineTax
+from shuup.core.utils.stock_updates import schedule_stock_update
 from shuup.utils.analog import define_log_model
 from shuup.utils.money import Money
 from shuup.utils.properties import MoneyProperty, MoneyPropped, PriceProperty
@@ -147,6 +148,22 @@ class AbstractOrderLine(MoneyPropped, models.Model, Priceful):
             shipment__order=self.order
         ).aggregate(total=Sum("quantity"))["total"] or 0
 
+    def __init__(self, *args, **kwargs):
+        super(AbstractOrderLine, self).__init__(*args, **kwargs)
+        self._saved_stock_state = self._get_stock_state()
+
+    def _get_stock_state(self):
+        # The values of the fields affecting stocks (read without
+        # triggering loads of deferred fields)
+        return tuple(self.__dict__.get(field) for field in ("supplier_id", "product_id", "quantity", "type"))
+
+    def _schedule_stock_updates(self, stock_states):
+        from ._suppliers import Supplier
+        for (supplier_id, product_id) in set(state[:2] for state in stock_states):
+            if supplier_id and product_id:
+                supplier = (self.supplier if supplier_id == self.supplier_id else Supplier.objects.get(pk=supplier_id))
+                schedule_stock_update(supplier, product_id)
+
     def save(self, *args, **kwargs):
         if not self.sku:
             self.sku = u""
@@ -159,9 +176,18 @@ class AbstractOrderLine(MoneyPropped, models.Model, Priceful):
         if self.product_id and not self.supplier_id:
             raise ValidationError("Order line has product but no supplier")
 
+        adding = self._state.adding
+        stock_state = self._get_stock_state()
         super(AbstractOrderLine, self).save(*args, **kwargs)
-        if self.product_id:
-            self.supplier.module.update_stock(self.product_id)
+        if adding:
+            self._schedule_stock_updates([stock_state])
+        elif stock_state != self._saved_stock_state:
+            self._schedule_stock_updates([self._saved_stock_state, stock_state])
+        self._saved_stock_state = stock_state
+
+    def delete(self, *args, **kwargs):
+        super(AbstractOrderLine, self).delete(*args, **kwargs)
+        self._schedule_stock_updates([self._saved_stock_state])
 
 
 class OrderLine(AbstractOrderLine):
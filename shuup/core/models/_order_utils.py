@@ -14,7 +14,7 @@ from django.utils.encoding import force_text
 
 from shuup.utils.importing import load
 
-from ._counters import Counter, CounterType
+from ._counters import CounterType, get_next_counter_value
 
 
 def calc_reference_number_checksum(rn):
@@ -39,31 +39,31 @@ def get_unique_reference_number_for_order(order):
     return get_unique_reference_number(order.shop, order.pk)
 
 
-def get_running_reference_number(order):
+def _get_running_reference_number(order, prefix, shop=None):
     from shuup import configuration
-    from shuup.admin.modules.settings.consts import (ORDER_REFERENCE_NUMBER_PREFIX_FIELD,
+    from shuup.admin.modules.settings.consts import (ORDER_REFERENCE_NUMBER_GAPLESS_FIELD,
                                                      ORDER_REFERENCE_NUMBER_LENGTH_FIELD)
-    value = Counter.get_and_increment(CounterType.ORDER_REFERENCE)
-    prefix = "%s" % configuration.get(
-        order.shop, ORDER_REFERENCE_NUMBER_PREFIX_FIELD, settings.SHUUP_REFERENCE_NUMBER_PREFIX)
+    gapless = configuration.get(
+        order.shop, ORDER_REFERENCE_NUMBER_GAPLESS_FIELD, settings.SHUUP_REFERENCE_NUMBER_GAPLESS)
+    value = get_next_counter_value(CounterType.ORDER_REFERENCE, shop=shop, gapless=gapless)
     ref_length = configuration.get(
         order.shop, ORDER_REFERENCE_NUMBER_LENGTH_FIELD, settings.SHUUP_REFERENCE_NUMBER_LENGTH)
-
     padded_value = force_text(value).rjust(ref_length - len(prefix), "0")
     reference_no = "%s%s" % (prefix, padded_value)
     return reference_no + calc_reference_number_checksum(reference_no)
 
 
-def get_shop_running_reference_number(order):
+def get_running_reference_number(order):
     from shuup import configuration
-    from shuup.admin.modules.settings.consts import ORDER_REFERENCE_NUMBER_LENGTH_FIELD
-    value = Counter.get_and_increment(CounterType.ORDER_REFERENCE)
+    from shuup.admin.modules.settings.consts import ORDER_REFERENCE_NUMBER_PREFIX_FIELD
+    prefix = "%s" % configuration.get(
+        order.shop, ORDER_REFERENCE_NUMBER_PREFIX_FIELD, settings.SHUUP_REFERENCE_NUMBER_PREFIX)
+    return _get_running_reference_number(order, prefix)
+
+
+def get_shop_running_reference_number(order):
     prefix = "%06d" % order.shop.pk
-    ref_length = configuration.get(
-        order.shop, ORDER_REFERENCE_NUMBER_LENGTH_FIELD, settings.SHUUP_REFERENCE_NUMBER_LENGTH)
-    padded_value = force_text(value).rjust(ref_length - len(prefix), "0")
-    reference_no = "%s%s" % (prefix, padded_value)
-    return reference_no + calc_reference_number_checksum(reference_no)
+    return _get_running_reference_number(order, prefix, shop=order.shop)
 
 
 def get_reference_number(order):
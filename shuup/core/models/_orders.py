@@ -40,6 +40,9 @@ from shuup.core.pricing import TaxfulPrice, TaxlessPrice
 from shuup.core.signals import (
     payment_created, refund_created, shipment_created
 )
+from shuup.core.utils.stock_updates import (
+    deferred_stock_updates, schedule_stock_updates
+)
 from shuup.utils.analog import define_log_model, LogEntryKind
 from shuup.utils.dates import local_now, to_aware
 from shuup.utils.money import Money
@@ -47,7 +50,7 @@ from shuup.utils.properties import (
     MoneyPropped, TaxfulPriceProperty, TaxlessPriceProperty
 )
 
-from ._order_lines import OrderLine, OrderLineType
+from ._order_lines import OrderLine, OrderLineTax, OrderLineType
 from ._order_utils import get_order_identifier, get_reference_number
 from ._products import Product, StockBehavior
 from ._suppliers import Supplier
@@ -291,12 +294,19 @@ class OrderQuerySet(models.QuerySet):
         return result
 
 
+def _get_quantities_by_product(queryset, product_field="product_id"):
+    return (
+        queryset.order_by().values(product_field)
+        .annotate(total=models.Sum("quantity")).values_list(product_field, "total")
+    )
+
+
 @python_2_unicode_compatible
 class Order(MoneyPropped, models.Model):
     # Identification
     shop = UnsavedForeignKey("Shop", on_delete=models.PROTECT, verbose_name=_('shop'))
     created_on = models.DateTimeField(auto_now_add=True, editable=False, verbose_name=_('created on'))
-    modified_on = models.DateTimeField(auto_now_add=True, editable=False, verbose_name=_('modified on'))
+    modified_on = models.DateTimeField(auto_now=True, editable=False, verbose_name=_('modified on'))
     identifier = InternalIdentifierField(unique=True, db_index=True, verbose_name=_('order identifier'))
     # TODO: label is actually a choice field, need to check migrations/choice deconstruction
     label = models.CharField(max_length=32, db_index=True, verbose_name=_('label'))
@@ -405,6 +415,11 @@ class Order(MoneyPropped, models.Model):
         verbose_name = _('order')
         verbose_name_plural = _('orders')
 
+    def __init__(self, *args, **kwargs):
+        super(Order, self).__init__(*args, **kwargs)
+        # The status affects the stocks (canceled orders are not counted)
+        self._saved_status_id = self.__dict__.get("status_id")
+
     def __str__(self):  # pragma: no cover
         if self.billing_address_id:
             name = self.billing_address.name
@@ -429,13 +444,40 @@ class Order(MoneyPropped, models.Model):
         self._codes = codes
 
     def cache_prices(self):
+        (self.taxful_total_price, self.taxless_total_price) = self._get_total_prices(self.lines.all())
+
+    def _get_total_prices(self, lines):
+        """
+        Get the total taxful and taxless prices of the given lines.
+
+        The prices are calculated (and rounded per line) as by `Priceful`,
+        but from the values of the lines and their tax amounts summed up
+        by a single grouped query instead of line and tax objects.
+
+        :type lines: django.db.models.QuerySet
+        :rtype: tuple[TaxfulPrice, TaxlessPrice]
+        """
+        tax_amounts = dict(
+            OrderLineTax.objects.filter(order_line__in=lines).order_by()
+            .values("order_line_id").annotate(total=models.Sum("amount_value"))
+            .values_list("order_line_id", "total")
+        )
+        price_class = (TaxfulPrice if self.prices_include_tax else TaxlessPrice)
         taxful_total = TaxfulPrice(0, self.currency)
         taxless_total = TaxlessPrice(0, self.currency)
-        for line in self.lines.all():
-            taxful_total += line.taxful_price
-            taxless_total += line.taxless_price
-        self.taxful_total_price = taxful_total
-        self.taxless_total_price = taxless_total
+        values = lines.values_list("id", "base_unit_price_value", "quantity", "discount_amount_value")
+        for (line_id, base_unit_price_value, quantity, discount_amount_value) in values:
+            price = (
+                price_class(base_unit_price_value, self.currency) * quantity -
+                price_class(discount_amount_value, self.currency))
+            tax_amount = Money(tax_amounts.get(line_id) or 0, self.currency)
+            if self.prices_include_tax:
+                taxful_total += price.as_rounded()
+                taxless_total += TaxlessPrice(price.amount - tax_amount).as_rounded()
+            else:
+                taxful_total += TaxfulPrice(price.amount + tax_amount).as_rounded()
+                taxless_total += price.as_rounded()
+        return (taxful_total, taxless_total)
 
     def _cache_contact_values(self):
         sources = [
@@ -503,18 +545,31 @@ class Order(MoneyPropped, models.Model):
                     "when SHUUP_ALLOW_ANONYMOUS_ORDERS is not enabled.")
         self._cache_values()
         first_save = (not self.pk)
+        update_fields = kwargs.get("update_fields")
+        status_changed = (
+            self.status_id != self._saved_status_id and
+            (update_fields is None or "status" in update_fields or "status_id" in update_fields)
+        )
         super(Order, self).save(*args, **kwargs)
         if first_save:  # Have to do a double save the first time around to be able to save identifiers
             self._save_identifiers()
-        for line in self.lines.exclude(product_id=None):
-            line.supplier.module.update_stock(line.product_id)
+        if status_changed:
+            self._saved_status_id = self.status_id
+            if not first_save:  # The lines of a new order update the stocks themselves
+                self._update_stocks()
+
+    def _update_stocks(self):
+        schedule_stock_updates(
+            (line.supplier, line.product_id)
+            for line in self.lines.exclude(product_id=None).select_related("supplier")
+        )
 
     def delete(self, using=None):
         if not self.deleted:
             self.deleted = True
             self.add_log_entry("Deleted.", kind=LogEntryKind.DELETION)
             # Bypassing local `save()` on purpose.
-            super(Order, self).save(update_fields=("deleted", ), using=using)
+            super(Order, self).save(update_fields=("deleted", "modified_on"), using=using)
 
     def set_canceled(self):
         if self.status.role != OrderStatusRole.CANCELED:
@@ -544,8 +599,8 @@ class Order(MoneyPropped, models.Model):
         return (self.payment_status == PaymentStatus.NOT_PAID)
 
     def get_total_paid_amount(self):
-        amounts = self.payments.values_list('amount_value', flat=True)
-        return Money(sum(amounts, Decimal(0)), self.currency)
+        total = self.payments.aggregate(total=models.Sum("amount_value"))["total"]
+        return Money(total or 0, self.currency)
 
     def get_total_unpaid_amount(self):
         difference = self.taxful_total_price.amount - self.get_total_paid_amount()
@@ -649,15 +704,15 @@ class Order(MoneyPropped, models.Model):
         else:
             from ._shipments import Shipment
             shipment = Shipment(order=self, supplier=supplier)
-        shipment.save()
-
-        if not supplier:
-            supplier = shipment.supplier
 
-        supplier.module.ship_products(shipment, product_quantities)
-
-        self.add_log_entry(_(u"Shipment #%d created.") % shipment.id)
-        self.update_shipping_status()
+        with deferred_stock_updates():
+            shipment.save()
+            if not supplier:
+                supplier = shipment.supplier
+            supplier.module.ship_products(shipment, product_quantities)
+            shipment._update_stocks()  # The shipment had no products yet when saved
+            self.add_log_entry(_(u"Shipment #%d created.") % shipment.id)
+            self.update_shipping_status()
         shipment_created.send(sender=type(self), order=self, shipment=shipment)
         return shipment
 
@@ -736,6 +791,10 @@ class Order(MoneyPropped, models.Model):
                            adjusting supplier stock.
         :type created_by: django.contrib.auth.User|None
         """
+        with deferred_stock_updates():
+            self._create_refund(refund_data, created_by)
+
+    def _create_refund(self, refund_data, created_by):
         index = self.lines.all().aggregate(models.Max("ordering"))["ordering__max"]
         tax_proportions = self._get_tax_class_proportions()
         zero = Money(0, self.currency)
@@ -841,8 +900,8 @@ class Order(MoneyPropped, models.Model):
         self.create_refund(line_data)
 
     def get_total_refunded_amount(self):
-        total = sum([line.taxful_price.amount.value for line in self.lines.refunds()])
-        return Money(-total, self.currency)
+        (taxful_total, taxless_total) = self._get_total_prices(self.lines.refunds())
+        return -taxful_total.amount
 
     def get_total_unrefunded_amount(self):
         return max(self.taxful_total_price.amount, Money(0, self.currency))
@@ -924,10 +983,7 @@ class Order(MoneyPropped, models.Model):
         return taxing.TaxSummary.from_line_taxes(all_line_taxes, untaxed)
 
     def get_product_ids_and_quantities(self):
-        quantities = defaultdict(lambda: 0)
-        for product_id, quantity in self.lines.filter(type=OrderLineType.PRODUCT).values_list("product_id", "quantity"):
-            quantities[product_id] += quantity
-        return dict(quantities)
+        return dict(_get_quantities_by_product(self.lines.filter(type=OrderLineType.PRODUCT)))
 
     def has_products(self):
         return self.lines.products().exists()
@@ -957,7 +1013,7 @@ class Order(MoneyPropped, models.Model):
         status_before_update = self.shipping_status
         if not self.get_unshipped_products():
             self.shipping_status = ShippingStatus.FULLY_SHIPPED
-        elif self.shipments.all_except_deleted().count():
+        elif self.shipments.all_except_deleted().exists():
             self.shipping_status = ShippingStatus.PARTIALLY_SHIPPED
         else:
             self.shipping_status = ShippingStatus.NOT_SHIPPED
@@ -967,13 +1023,14 @@ class Order(MoneyPropped, models.Model):
                     "shipping_status": self.shipping_status
                 })
             )
-            self.save(update_fields=("shipping_status",))
+            self.save(update_fields=("shipping_status", "modified_on"))
 
     def update_payment_status(self):
         status_before_update = self.payment_status
-        if self.get_total_unpaid_amount().value == 0:
+        total_paid_amount = self.get_total_paid_amount()
+        if self.taxful_total_price.amount <= total_paid_amount:
             self.payment_status = PaymentStatus.FULLY_PAID
-        elif self.get_total_paid_amount().value > 0:
+        elif total_paid_amount.value > 0:
             self.payment_status = PaymentStatus.PARTIALLY_PAID
         else:
             self.payment_status = PaymentStatus.NOT_PAID
@@ -983,7 +1040,7 @@ class Order(MoneyPropped, models.Model):
                     "payment_status": self.payment_status
                 })
             )
-            self.save(update_fields=("payment_status",))
+            self.save(update_fields=("payment_status", "modified_on"))
 
     def get_known_additional_data(self):
         """
@@ -1006,40 +1063,28 @@ class Order(MoneyPropped, models.Model):
 
     def get_product_summary(self):
         """Return a dict of product IDs -> {ordered, unshipped, refunded, shipped}"""
+        from ._products import ShippingMode
+        from ._shipments import ShipmentProduct, ShipmentStatus
 
         products = defaultdict(lambda: defaultdict(lambda: Decimal(0)))
-        lines = (
-            self.lines.filter(type=OrderLineType.PRODUCT)
-            .values_list("product_id", "quantity"))
-        for product_id, quantity in lines:
+        product_lines = self.lines.filter(type=OrderLineType.PRODUCT)
+        for product_id, quantity in _get_quantities_by_product(product_lines):
             products[product_id]['ordered'] += quantity
 
-        from ._products import ShippingMode
-
-        lines_to_ship = (
-            self.lines.filter(type=OrderLineType.PRODUCT, product__shipping_mode=ShippingMode.SHIPPED)
-            .values_list("product_id", "quantity"))
-        for product_id, quantity in lines_to_ship:
+        lines_to_ship = product_lines.filter(product__shipping_mode=ShippingMode.SHIPPED)
+        for product_id, quantity in _get_quantities_by_product(lines_to_ship):
             products[product_id]['unshipped'] += quantity
 
-        from ._shipments import ShipmentProduct, ShipmentStatus
-
         shipment_prods = (
             ShipmentProduct.objects
             .filter(shipment__order=self)
-            .exclude(shipment__status=ShipmentStatus.DELETED)
-            .values_list("product_id", "quantity"))
-        for product_id, quantity in shipment_prods:
+            .exclude(shipment__status=ShipmentStatus.DELETED))
+        for product_id, quantity in _get_quantities_by_product(shipment_prods):
             products[product_id]['shipped'] += quantity
             products[product_id]['unshipped'] -= quantity
 
-        refunded_prods = self.lines.refunds().filter(
-            type=OrderLineType.REFUND,
-            parent_line__type=OrderLineType.PRODUCT
-        ).distinct().values_list("parent_line__product_id", flat=True)
-        for product_id in refunded_prods:
-            refunds = self.lines.refunds().filter(parent_line__product_id=product_id)
-            refunded_quantity = refunds.aggregate(total=models.Sum("quantity"))["total"] or 0
+        refunds = self.lines.refunds().filter(parent_line__type=OrderLineType.PRODUCT)
+        for product_id, refunded_quantity in _get_quantities_by_product(refunds, "parent_line__product_id"):
             products[product_id]["refunded"] = refunded_quantity
             products[product_id]["unshipped"] = max(products[product_id]["unshipped"] - refunded_quantity, 0)
 
@@ -43,6 +43,44 @@ class ShopProductVisibility(Enum):
         ALWAYS_VISIBLE = _("always visible")
 
 
+class ShopProductQuerySet(models.QuerySet):
+    def with_orderability_data(self):
+        """
+        Fetch the related data needed for checking orderability.
+
+        The products, suppliers and visibility groups are fetched in bulk
+        so checking the orderability of the shop products runs a fixed
+        number of queries.
+        """
+        return self.select_related("shop", "product", "product__sales_unit").prefetch_related(
+            "suppliers", "visibility_groups")
+
+    def get_orderability_errors(self, customer, supplier=None, quantity=None, ignore_minimum=False):
+        """
+        Get orderability errors for all shop products in the queryset.
+
+        :param customer: Customer contact.
+        :type customer: shuup.core.models.Contact
+        :param supplier: Supplier to order the products from. May be None.
+        :type supplier: shuup.core.models.Supplier
+        :param quantity: Quantity to order. Defaults to the minimum purchase quantity of each shop product.
+        :type quantity: int|Decimal|None
+        :param ignore_minimum: Ignore any limitations caused by quantity minimums.
+        :type ignore_minimum: bool
+        :return: Dict of shop product ids and lists of validation errors
+        :rtype: dict[int, list[ValidationError]]
+        """
+        return {
+            shop_product.pk: list(shop_product.get_orderability_errors(
+                supplier=supplier,
+                quantity=(quantity if quantity is not None else shop_product.minimum_purchase_quantity),
+                customer=customer,
+                ignore_minimum=ignore_minimum
+            ))
+            for shop_product in self.with_orderability_data()
+        }
+
+
 class ShopProduct(MoneyPropped, models.Model):
     shop = models.ForeignKey("Shop", related_name="shop_products", on_delete=models.CASCADE, verbose_name=_("shop"))
     product = UnsavedForeignKey(
@@ -160,6 +198,8 @@ class ShopProduct(MoneyPropped, models.Model):
         )
     )
 
+    objects = ShopProductQuerySet.as_manager()
+
     class Meta:
         unique_together = (("shop", "product",),)
 
@@ -224,9 +264,8 @@ class ShopProduct(MoneyPropped, models.Model):
                 code="product_not_visible_to_anonymous")
 
         if is_logged_in and self.visibility_limit == ProductVisibility.VISIBLE_TO_GROUPS:
-            # TODO: Optimization
-            user_groups = set(customer.groups.all().values_list("pk", flat=True))
-            my_groups = set(self.visibility_groups.values_list("pk", flat=True))
+            user_groups = customer.get_group_ids()
+            my_groups = self._get_related_ids("visibility_groups")
             if not bool(user_groups & my_groups):
                 yield ValidationError(
                     _('This product is not visible to your group.'),
@@ -256,7 +295,8 @@ class ShopProduct(MoneyPropped, models.Model):
         for error in self.get_visibility_errors(customer):
             yield error
 
-        if supplier is None and not self.suppliers.exists():
+        supplier_ids = self._get_related_ids("suppliers", prefetched_only=True)
+        if supplier is None and not (self.suppliers.exists() if supplier_ids is None else supplier_ids):
             # `ShopProduct` must have at least one `Supplier`.
             # If supplier is not given and the `ShopProduct` itself
             # doesn't have suppliers we cannot sell this product.
@@ -271,24 +311,22 @@ class ShopProduct(MoneyPropped, models.Model):
                 code="purchase_quantity_not_met"
             )
 
-        if supplier and not self.suppliers.filter(pk=supplier.pk).exists():
+        if supplier and not (
+            self.suppliers.filter(pk=supplier.pk).exists() if supplier_ids is None else supplier.pk in supplier_ids
+        ):
             yield ValidationError(
                 _('The product is not supplied by %s.') % supplier,
                 code="invalid_supplier"
             )
 
         if self.product.mode == ProductMode.SIMPLE_VARIATION_PARENT:
-            sellable = 0
-            for child_product in self.product.variation_children.all():
-                if child_product.get_shop_instance(self.shop).is_orderable(
-                        supplier=supplier,
-                        customer=customer,
-                        quantity=1,
-                        allow_cache=False
-                ):
-                    sellable += 1
-
-            if sellable == 0:
+            child_shop_products = ShopProduct.objects.filter(
+                shop=self.shop, product__variation_parent=self.product).with_orderability_data()
+            sellable = any(
+                child_shop_product.is_orderable(supplier=supplier, customer=customer, quantity=1, allow_cache=False)
+                for child_shop_product in child_shop_products
+            )
+            if not sellable:
                 yield ValidationError(_("Product has no sellable children"), code="no_sellable_children")
 
         if self.product.mode == ProductMode.VARIABLE_VARIATION_PARENT:
@@ -356,6 +394,28 @@ class ShopProduct(MoneyPropped, models.Model):
             for error in response:
                 yield error
 
+    def _get_related_ids(self, field_name, prefetched_only=False):
+        """
+        Get the ids of the objects related through the given many-to-many field.
+
+        Uses the objects prefetched with `with_orderability_data` when available.
+
+        :param prefetched_only: Return None instead of querying when the objects are not prefetched.
+        :rtype: set[int]|None
+        """
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if field_name in prefetched:
+            return set(obj.pk for obj in prefetched[field_name])
+        if prefetched_only:
+            return None
+        return set(getattr(self, field_name).values_list("pk", flat=True))
+
+    def _get_first_supplier(self):
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        if "suppliers" in prefetched:
+            return min(prefetched["suppliers"], key=(lambda supplier: supplier.pk)) if prefetched["suppliers"] else None
+        return self.suppliers.first()
+
     def raise_if_not_orderable(self, supplier, customer, quantity, ignore_minimum=False):
         for message in self.get_orderability_errors(
             supplier=supplier, quantity=quantity, customer=customer, ignore_minimum=ignore_minimum
@@ -374,7 +434,7 @@ class ShopProduct(MoneyPropped, models.Model):
             return val
 
         if not supplier:
-            supplier = self.suppliers.first()  # TODO: Allow multiple suppliers
+            supplier = self._get_first_supplier()  # TODO: Allow multiple suppliers
         for message in self.get_orderability_errors(supplier=supplier, quantity=quantity, customer=customer):
             if customer:
                 context_cache.set_cached_value(key, False)
@@ -396,12 +396,25 @@ class Product(TaxableItem, AttributableMixin, TranslatableModel):
           List of products and their price infos sorted from cheapest to
           most expensive.
         """
-        priced_children = (
-            (child, child.get_price_info(context, quantity=quantity))
-            for child in self.variation_children.all()
-            if child.get_shop_instance(context.shop).is_orderable(supplier=None, customer=context.customer, quantity=1)
-        )
-        return sorted(priced_children, key=(lambda x: x[1].price))
+        children_price_infos = self._get_children_price_infos(context, quantity)
+        if not children_price_infos:
+            return []
+
+        # Orderability depends on stocks, so it is never taken from the cache
+        from shuup.core.models import ShopProduct
+        shop_products = ShopProduct.objects.filter(
+            shop=context.shop, product_id__in=[child_id for (child_id, price_info) in children_price_infos]
+        ).with_orderability_data()
+        children = {
+            shop_product.product_id: shop_product.product
+            for shop_product in shop_products
+            if shop_product.is_orderable(supplier=None, customer=context.customer, quantity=1)
+        }
+        return [
+            (children[child_id], price_info)
+            for (child_id, price_info) in children_price_infos
+            if child_id in children
+        ]
 
     def get_cheapest_child_price(self, context, quantity=1):
         price_info = self.get_cheapest_child_price_info(context, quantity)
@@ -422,12 +435,11 @@ class Product(TaxableItem, AttributableMixin, TranslatableModel):
         :return: a tuple of prices
         :rtype: (shuup.core.pricing.Price, shuup.core.pricing.Price)
         """
-        items = [c.get_price_info(context, quantity=quantity) for c in self.variation_children.all()]
+        items = self._get_children_price_infos(context, quantity)
         if not items:
             return (None, None)
 
-        infos = sorted(items, key=lambda x: x.price)
-        return (infos[0].price, infos[-1].price)
+        return (items[0][1].price, items[-1][1].price)
 
     def get_cheapest_child_price_info(self, context, quantity=1):
         """
@@ -441,11 +453,42 @@ class Product(TaxableItem, AttributableMixin, TranslatableModel):
         :type context: shuup.core.pricing.PricingContextable
         :rtype: shuup.core.pricing.PriceInfo
         """
-        items = [c.get_price_info(context, quantity=quantity) for c in self.variation_children.all()]
+        items = self._get_children_price_infos(context, quantity)
         if not items:
             return None
 
-        return sorted(items, key=lambda x: x.price)[0]
+        return items[0][1]
+
+    def _get_children_price_infos(self, context, quantity=1):
+        """
+        Get price infos of all variation children.
+
+        The prices are calculated in one pass with `get_price_infos`
+        and the result is cached per shop, customer groups and parent.
+
+        :type context: shuup.core.pricing.PricingContextable
+        :rtype: list[(int,shuup.core.pricing.PriceInfo)]
+        :return:
+          List of child ids and their price infos sorted from cheapest
+          to most expensive.
+        """
+        key, val = context_cache.get_cached_value(
+            identifier="children_price_infos", item=self, context=context, quantity=quantity)
+        if val is not None:
+            return val
+
+        children = list(self.variation_children.all())
+        if not children:
+            context_cache.set_cached_value(key, [])
+            return []
+
+        from shuup.core.pricing import get_price_infos
+
+        price_infos = get_price_infos(context, children, quantity=quantity)
+        items = [(child.pk, price_infos[child.pk]) for child in children if child.pk in price_infos]
+        items.sort(key=(lambda x: x[1].price))
+        context_cache.set_cached_value(key, items)
+        return items
 
     def get_price_info(self, context, quantity=1):
         """
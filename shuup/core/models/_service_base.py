@@ -9,6 +9,7 @@ from __future__ import unicode_literals
 
 import functools
 import random
+from itertools import chain
 
 import six
 from django.core.exceptions import ValidationError
@@ -166,14 +167,22 @@ class ServiceQuerySet(TranslatableQuerySet):
             "product__in": products,
             shop_product_limiter_attr: True
         }
+        # All of the limiting shop products and their services in a single query
+        service_ids_by_shop_product = {}
+        limiting_service_ids = ShopProduct.objects.filter(
+            **limiting_products_query).values_list("pk", shop_product_m2m)
+        for (shop_product_id, service_id) in limiting_service_ids:
+            service_ids = service_ids_by_shop_product.setdefault(shop_product_id, set())
+            if service_id:
+                service_ids.add(service_id)
+
+        if any(not service_ids for service_ids in service_ids_by_shop_product.values()):
+            return set()  # Out of IDs, better just fail fast
+
         enabled_for_shop = self.enabled().for_shop(shop)
         available_ids = set(enabled_for_shop.values_list("pk", flat=True))
-
-        for shop_product in ShopProduct.objects.filter(**limiting_products_query):
-            available_ids &= set(getattr(shop_product, shop_product_m2m).values_list("pk", flat=True))
-            if not available_ids:  # Out of IDs, better just fail fast
-                break
-
+        for service_ids in service_ids_by_shop_product.values():
+            available_ids &= service_ids
         return available_ids
 
     def available(self, shop, products):
@@ -229,6 +238,20 @@ class Service(TranslatableShuupModel):
         """
         return getattr(self, self.provider_attr)
 
+    def get_behavior_components(self):
+        """
+        Get the behavior components of this service.
+
+        Uses the components loaded by `prefetch_behavior_components`
+        when available.
+
+        :rtype: list[ServiceBehaviorComponent]
+        """
+        components = getattr(self, "_prefetched_behavior_components", None)
+        if components is None:
+            components = list(self.behavior_components.all())
+        return components
+
     def get_effective_name(self, source):
         """
         Get effective name of the service for given order source.
@@ -268,7 +291,7 @@ class Service(TranslatableShuupModel):
             yield ValidationError(
                 _("%s is for different shop") % self, code='wrong_shop')
 
-        for component in self.behavior_components.all():
+        for component in self.get_behavior_components():
             for reason in component.get_unavailability_reasons(self, source):
                 yield reason
 
@@ -289,7 +312,7 @@ class Service(TranslatableShuupModel):
         :return: description, price and tax class of the costs
         :rtype: Iterable[ServiceCost]
         """
-        for component in self.behavior_components.all():
+        for component in self.get_behavior_components():
             for cost in component.get_costs(self, source):
                 yield cost
 
@@ -362,6 +385,67 @@ class Service(TranslatableShuupModel):
                 '%s of %r is disabled' % (self.provider_attr, self))
 
 
+def prefetch_behavior_components(services):
+    """
+    Load the behavior components of the given services in a batch.
+
+    The components of all of the services are loaded with a query for
+    the links and a polymorphic query for the components (one per
+    component type), after which the component types may load their
+    related data in a batch (see
+    `ServiceBehaviorComponent.prefetch_component_data`).
+
+    The (polymorphic) providers of the services are loaded in a batch
+    too, since checking the availability and costs of a service accesses
+    its provider.
+
+    :type services: Iterable[Service]
+    :return: The services
+    :rtype: list[Service]
+    """
+    services = list(services)
+    if not services:
+        return services
+    _prefetch_providers(services)
+    field = services[0]._meta.get_field("behavior_components")
+    service_attr = "%s_id" % field.m2m_field_name()
+    component_attr = "%s_id" % field.m2m_reverse_field_name()
+    component_ids_by_service = {}
+    links = type(services[0]).behavior_components.through.objects.filter(
+        **{"%s__in" % service_attr: [service.pk for service in services]}
+    ).values_list(service_attr, component_attr)
+    for (service_id, component_id) in links:
+        component_ids_by_service.setdefault(service_id, []).append(component_id)
+
+    component_ids = set(chain.from_iterable(component_ids_by_service.values()))
+    components = (ServiceBehaviorComponent.objects.in_bulk(component_ids) if component_ids else {})
+    components_by_type = {}
+    for component in components.values():
+        components_by_type.setdefault(type(component), []).append(component)
+    for (component_type, type_components) in components_by_type.items():
+        component_type.prefetch_component_data(type_components)
+
+    for service in services:
+        service._prefetched_behavior_components = [
+            components[component_id]
+            for component_id in sorted(component_ids_by_service.get(service.pk, ()))
+            if component_id in components
+        ]
+    return services
+
+
+def _prefetch_providers(services):
+    provider_attr = services[0].provider_attr
+    provider_id_attr = "%s_id" % provider_attr
+    provider_ids = set(getattr(service, provider_id_attr) for service in services)
+    provider_ids.discard(None)
+    providers = (ServiceProvider.objects.in_bulk(provider_ids) if provider_ids else {})
+    for service in services:
+        provider = providers.get(getattr(service, provider_id_attr))
+        if provider is not None:
+            setattr(service, provider_attr, provider)
+
+
 def _sum_costs(costs, source):
     """
     Sum price info of given costs and return the sum as PriceInfo.
@@ -425,6 +509,18 @@ class ServiceBehaviorComponent(PolymorphicShuupModel):
             raise TypeError('%s.name is not defined' % type(self).__name__)
         super(ServiceBehaviorComponent, self).__init__(*args, **kwargs)
 
+    @classmethod
+    def prefetch_component_data(cls, components):
+        """
+        Load the related data of the given components of this type in a batch.
+
+        Called by `prefetch_behavior_components`; override in
+        subclasses having related data used for availability or costs.
+
+        :type components: list[ServiceBehaviorComponent]
+        """
+        pass
+
     def get_unavailability_reasons(self, service, source):
         """
         :type service: Service
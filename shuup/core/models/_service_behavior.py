@@ -134,9 +134,25 @@ class WeightBasedPricingBehaviorComponent(ServiceBehaviorComponent):
         "Define price based on basket weight. "
         "Range minimums is counted in range only as zero.")
 
+    @classmethod
+    def prefetch_component_data(cls, components):
+        ranges_by_component = dict((component.pk, []) for component in components)
+        ranges = WeightBasedPriceRange.objects.filter(
+            component__in=list(ranges_by_component)).prefetch_related("translations")
+        for range in ranges:
+            ranges_by_component[range.component_id].append(range)
+        for component in components:
+            component._prefetched_ranges = ranges_by_component[component.pk]
+
+    def _get_ranges(self):
+        ranges = getattr(self, "_prefetched_ranges", None)
+        if ranges is None:
+            ranges = list(self.ranges.all())
+        return ranges
+
     def _get_matching_range_with_lowest_price(self, source):
         total_gross_weight = source.total_gross_weight
-        matching_ranges = [range for range in self.ranges.all() if range.matches_to_value(total_gross_weight)]
+        matching_ranges = [range for range in self._get_ranges() if range.matches_to_value(total_gross_weight)]
         if not matching_ranges:
             return
         return min(matching_ranges, key=lambda x: x.price_value)
@@ -162,13 +178,32 @@ class GroupAvailabilityBehaviorComponent(ServiceBehaviorComponent):
         "The contact groups for which this service is available."
     ))
 
+    @classmethod
+    def prefetch_component_data(cls, components):
+        field = cls._meta.get_field("groups")
+        component_attr = "%s_id" % field.m2m_field_name()
+        group_ids_by_component = dict((component.pk, set()) for component in components)
+        group_links = cls.groups.through.objects.filter(
+            **{"%s__in" % component_attr: list(group_ids_by_component)}
+        ).values_list(component_attr, "%s_id" % field.m2m_reverse_field_name())
+        for (component_id, group_id) in group_links:
+            group_ids_by_component[component_id].add(group_id)
+        for component in components:
+            component._prefetched_group_ids = group_ids_by_component[component.pk]
+
+    def _get_group_ids(self):
+        group_ids = getattr(self, "_prefetched_group_ids", None)
+        if group_ids is None:
+            group_ids = set(self.groups.all().values_list("pk", flat=True))
+        return group_ids
+
     def get_unavailability_reasons(self, service, source):
         if source.customer and not source.customer.pk:
             yield ValidationError(_("Customer does not belong to any group."))
             return
 
-        customer_groups = set(source.customer.groups.all().values_list("pk", flat=True))
-        groups_to_match = set(self.groups.all().values_list("pk", flat=True))
+        customer_groups = source.customer.get_group_ids()
+        groups_to_match = self._get_group_ids()
         if not bool(customer_groups & groups_to_match):
             yield ValidationError(_("Service is not available for any of the customers groups."))
 
@@ -52,7 +52,7 @@ class ShippingMethod(Service):
         :rtype: shuup.utils.dates.DurationRange|None
         """
         min_time, max_time = None, None
-        for component in self.behavior_components.all():
+        for component in self.get_behavior_components():
             delivery_time = component.get_delivery_time(self, source)
             if delivery_time:
                 assert isinstance(delivery_time, DurationRange)
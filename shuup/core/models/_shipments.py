@@ -21,6 +21,7 @@ from shuup.core.fields import (
 )
 from shuup.core.models import ShuupModel
 from shuup.core.signals import shipment_deleted
+from shuup.core.utils.stock_updates import schedule_stock_updates
 from shuup.utils.analog import define_log_model
 
 __all__ = ("Shipment", "ShipmentProduct")
@@ -98,8 +99,11 @@ class Shipment(ShuupModel):
 
     def save(self, *args, **kwargs):
         super(Shipment, self).save(*args, **kwargs)
-        for product_id in self.products.values_list("product_id", flat=True):
-            self.supplier.module.update_stock(product_id=product_id)
+        self._update_stocks()
+
+    def _update_stocks(self):
+        schedule_stock_updates(
+            (self.supplier, product_id) for product_id in self.products.values_list("product_id", flat=True))
 
     def delete(self, using=None):
         raise NotImplementedError("Not implemented: Use `soft_delete()` for shipments.")
@@ -110,8 +114,6 @@ class Shipment(ShuupModel):
             return
         self.status = ShipmentStatus.DELETED
         self.save(update_fields=["status"])
-        for product_id in self.products.values_list("product_id", flat=True):
-            self.supplier.module.update_stock(product_id=product_id)
         if self.order:
             self.order.update_shipping_status()
         shipment_deleted.send(sender=type(self), shipment=self)
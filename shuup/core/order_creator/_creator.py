@@ -16,6 +16,7 @@ from shuup.core.models import Order, OrderLine, OrderLineType
 from shuup.core.order_creator.signals import order_creator_finished
 from shuup.core.shortcuts import update_order_line_from_product
 from shuup.core.utils import context_cache
+from shuup.core.utils.stock_updates import deferred_stock_updates
 from shuup.core.utils.users import real_user_or_none
 from shuup.utils.deprecation import RemovedFromShuupWarning
 from shuup.utils.numbers import bankers_round
@@ -292,8 +293,9 @@ class OrderCreator(OrderProcessor):
     def create_order(self, order_source):
         data = self.get_source_base_data(order_source)
         order = Order(**data)
-        order.save()
-        order = self.finalize_creation(order, order_source)
+        with deferred_stock_updates():
+            order.save()
+            order = self.finalize_creation(order, order_source)
         order_creator_finished.send(sender=type(self), order=order, source=order_source)
         # reset product prices
         for line in order.lines.exclude(product_id=None):
@@ -9,6 +9,7 @@ from django.db.transaction import atomic
 from django.utils.timezone import now
 
 from shuup.core.models import Order
+from shuup.core.utils.stock_updates import deferred_stock_updates
 from shuup.core.utils.users import real_user_or_none
 
 from ._creator import OrderProcessor
@@ -28,6 +29,10 @@ class OrderModifier(OrderProcessor):
 
     @atomic
     def update_order_from_source(self, order_source, order):
+        with deferred_stock_updates():
+            return self._update_order_from_source(order_source, order)
+
+    def _update_order_from_source(self, order_source, order):
         data = self.get_source_base_data(order_source)
         for key in self._PROTECTED_ATTRIBUTES:
             if key in data:
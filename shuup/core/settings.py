@@ -50,7 +50,8 @@ SHUUP_ORDER_IDENTIFIER_METHOD = "id"
 #:    The reference number has the Finnish bank reference check digit
 #:    appended, making the reference number valid for Finnish bank transfers.
 #: ``shop_running``
-#:    As ``running``, but with the shop ID prepended.
+#:    As ``running``, but with the shop ID prepended and a counter of its own
+#:    for each shop.
 SHUUP_REFERENCE_NUMBER_METHOD = "unique"
 
 #: The default length of reference numbers generated by certain reference number generators.
@@ -59,6 +60,33 @@ SHUUP_REFERENCE_NUMBER_LENGTH = 17
 #: An arbitrary (numeric) default prefix for certain reference number generators.
 SHUUP_REFERENCE_NUMBER_PREFIX = ""
 
+#: Whether the ``running`` and ``shop_running`` reference number generators
+#: use strictly gapless counters by default.
+#:
+#: Gapless counters lock the counter row until the end of the order creation
+#: transaction, serializing concurrent checkouts.  The setting can be
+#: overridden per shop in the shop settings.
+SHUUP_REFERENCE_NUMBER_GAPLESS = True
+
+#: Number of counter values (such as running order reference numbers)
+#: reserved by each process at a time.
+#:
+#: Values are handed out from the reserved blocks without touching the
+#: counter row, so values may be skipped and values of concurrent processes
+#: may interleave.  Set to 1 to reserve values one at a time.
+SHUUP_COUNTER_BLOCK_SIZE = 20
+
+#: Alias of a database connection (configured in ``DATABASES`` for the
+#: same database as the counter tables) used to reserve counter blocks
+#: outside of the current transaction.
+#:
+#: Without one, values needed within a transaction (such as during order
+#: creation) are reserved one at a time in that transaction, since a
+#: block reserved in a transaction that is rolled back could be handed out
+#: again by other processes.  SQLite, which allows a single writer at a
+#: time, should not use a separate connection.
+SHUUP_COUNTER_DATABASE_ALIAS = None
+
 #: The identifier of the pricing module to use for pricing products.
 #:
 #: Determines how product prices are calculated.  See
@@ -13,15 +13,18 @@ current template context into account (see `PriceDisplayOptions`).
 Especially, they convert prices to correct taxness.
 
 There is also a global context function `show_prices` which can be used
-to render certain price container elements conditionally.
+to render certain price container elements conditionally, and
+`preload_prices` which can be used to declare the products rendered by
+a template so their prices are calculated in one batch.
 """
 
 import django_jinja
 import jinja2
 
 from shuup.core.utils.price_display import (
-    PriceDisplayFilter, PriceDisplayOptions, PricePercentPropertyFilter,
-    PricePropertyFilter, PriceRangeDisplayFilter, TotalPriceDisplayFilter
+    preload_price_display, PriceDisplayFilter, PriceDisplayOptions,
+    PricePercentPropertyFilter, PricePropertyFilter, PriceRangeDisplayFilter,
+    TotalPriceDisplayFilter
 )
 
 # Filters for Product, SourceLine, BasketLine, OrderLine, Service
@@ -57,3 +60,21 @@ def show_prices(context):
     """
     options = PriceDisplayOptions.from_context(context)
     return options.show_prices
+
+
+@django_jinja.library.global_function
+@jinja2.contextfunction
+def preload_prices(context, products, quantity=1):
+    """
+    Preload the prices of the given products for the price filters.
+
+    Renders nothing, use like ``{{ preload_prices(products) }}``
+    before rendering the prices of the products.
+
+    :type context: jinja2.runtime.Context
+    :type products: Iterable[shuup.core.models.Product]
+    """
+    options = PriceDisplayOptions.from_context(context)
+    if options.show_prices:
+        preload_price_display(context.get("request"), products, quantity)
+    return ""
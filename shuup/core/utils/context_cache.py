@@ -92,6 +92,39 @@ def bump_cache_for_shop_product(shop_product):
                 bump_cache_for_item(sp.product)
 
 
+def bump_cache_for_shop_product_ids(shop_product_ids):
+    """
+    Bump cache for the shop products with the given ids
+
+    Does the same as `bump_cache_for_shop_product` for every shop
+    product, but looks up the related shop products in bulk.
+
+    :param shop_product_ids: shop product ids
+    :type shop_product_ids: Iterable[int]
+    """
+    from shuup.core.models import ProductPackageLink, ShopProduct
+    product_ids = set()
+    parent_ids = set()
+    for shop_product in ShopProduct.objects.filter(pk__in=shop_product_ids).select_related("product"):
+        bump_cache_for_item(shop_product)
+        bump_cache_for_item(shop_product.product)
+        product_ids.add(shop_product.product_id)
+        if shop_product.product.variation_parent_id:
+            parent_ids.add(shop_product.product.variation_parent_id)
+
+    if not product_ids:
+        return
+
+    # Bump all variation children, variation parents and package parents
+    parent_ids.update(ProductPackageLink.objects.filter(child_id__in=product_ids).values_list("parent_id", flat=True))
+    q = Q(product__variation_parent_id__in=product_ids)
+    if parent_ids:
+        q |= Q(product_id__in=parent_ids)
+    for related in ShopProduct.objects.filter(q).select_related("product"):
+        bump_cache_for_item(related)
+        bump_cache_for_item(related.product)
+
+
 def bump_cache_for_product(product, shop=None):
     """
     Bump cache for product
@@ -164,6 +197,21 @@ def bump_shop_product_signal_handler(sender, instance, **kwargs):
     bump_cache_for_shop_product(instance)
 
 
+def bump_bulk_updated_products_signal_handler(sender, ids, **kwargs):
+    """
+    Signal handler for clearing cache of bulk updated products or shop products
+
+    :param ids: ids of the updated `Product` or `ShopProduct` objects
+    :type ids: list[int]
+    """
+    from shuup.core.models import Product, ShopProduct
+    if sender is Product:
+        for product_id in ids:
+            bump_cache_for_pk(Product, product_id)
+        ids = ShopProduct.objects.filter(product_id__in=ids).values_list("pk", flat=True)
+    bump_cache_for_shop_product_ids(list(ids))
+
+
 def _get_cache_key_for_context(identifier, item, context, **kwargs):
     namespace = _get_namespace_for_item(item)
 
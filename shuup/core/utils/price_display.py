@@ -14,13 +14,16 @@ Contents:
   * Helper function `render_price_property` for rendering prices
     correctly from Python code.
 
+  * Function `preload_price_display` for preloading the prices of the
+    products rendered on a page.
+
   * Various filter classes for implementing Jinja2 filters.
 """
 
 import django_jinja.library
 import jinja2
 
-from shuup.core.pricing import PriceDisplayOptions, Priceful
+from shuup.core.pricing import get_price_infos, PriceDisplayOptions, Priceful
 from shuup.core.templatetags.shuup_common import money, percent
 from shuup.core.utils import context_cache
 
@@ -46,6 +49,67 @@ def render_price_property(request, item, priceful, property_name='price'):
     return money(price_value)
 
 
+class _PriceDisplayPreload(object):
+    """
+    Prices and display values of the products preloaded for a request.
+    """
+    def __init__(self):
+        #: Pricefuls by (product id, quantity)
+        self.pricefuls = {}
+        #: Rendered filter values by filter name, product id and arguments
+        self.values = {}
+
+
+def _get_preload(request, create=False):
+    preload = getattr(request, "_price_display_preload", None)
+    if preload is None and create and request is not None:
+        preload = request._price_display_preload = _PriceDisplayPreload()
+    return preload
+
+
+def preload_price_display(request, products, quantity=1):
+    """
+    Preload the prices of the products about to be rendered.
+
+    The price infos of the products are calculated in one batch with
+    `get_price_infos` and the price display filters read them (and
+    memoize the rendered values) in memory, instead of doing a context
+    cache round-trip per product and filter.
+
+    :type request: django.http.HttpRequest
+    :type products: Iterable[shuup.core.models.Product]
+    :type quantity: numbers.Number
+    """
+    preload = _get_preload(request, create=True)
+    if preload is None:
+        return
+    products = [
+        product for product in products
+        if hasattr(product, "is_variation_parent") and (product.pk, quantity) not in preload.pricefuls
+    ]
+    simple_products = []
+    for product in products:
+        if product.is_variation_parent():
+            # The children prices are batched (and cached) per parent
+            preload.pricefuls[(product.pk, quantity)] = product.get_cheapest_child_price_info(request, quantity)
+        else:
+            simple_products.append(product)
+    if simple_products:
+        price_infos = get_price_infos(request, simple_products, quantity)
+        for product in simple_products:
+            preload.pricefuls[(product.pk, quantity)] = price_infos.get(product.pk)
+
+
+def _get_preloaded_priceful(request, item, quantity):
+    preload = _get_preload(request)
+    if preload is None or not hasattr(item, "is_variation_parent"):
+        return (False, None)
+    key = (item.pk, quantity)
+    if key not in preload.pricefuls:
+        return (False, None)
+    return (True, preload.pricefuls[key])
+
+
 class _ContextObject(object):
     def __init__(self, name, property_name=None):
         self.name = name
@@ -63,6 +127,30 @@ class _ContextFilter(_ContextObject):
     def cache_identifier(self):
         return "price_filter_%s" % self.name
 
+    def _get_cached_value(self, context, item, get_value, allow_cache=True, **kwargs):
+        """
+        Get the filter value from the price display preload or the context cache.
+
+        :param get_value: Function calculating the value
+        :type get_value: callable
+        """
+        request = context.get('request')
+        if allow_cache and _get_preloaded_priceful(request, item, kwargs.get("quantity"))[0]:
+            values = _get_preload(request).values
+            key = (self.name, item.pk, tuple(sorted(kwargs.items())))
+            if key not in values:
+                values[key] = get_value()
+            return values[key]
+
+        key, val = context_cache.get_cached_value(
+            identifier=self.cache_identifier, item=item, context=context,
+            name=self.name, allow_cache=allow_cache, **kwargs)
+        if val is not None:
+            return val
+        val = get_value()
+        context_cache.set_cached_value(key, val)
+        return val
+
 
 class _ContextFunction(_ContextObject):
     def _register(self):
@@ -73,15 +161,13 @@ class _ContextFunction(_ContextObject):
 
 class PriceDisplayFilter(_ContextFilter):
     def __call__(self, context, item, quantity=1, include_taxes=None, allow_cache=True):
-        key, val = context_cache.get_cached_value(
-            identifier=self.cache_identifier, item=item, context=context,
-            quantity=quantity, include_taxes=include_taxes, name=self.name, allow_cache=allow_cache)
-        if val is not None:
-            return val
+        return self._get_cached_value(
+            context, item, (lambda: self._get_value(context, item, quantity, include_taxes)),
+            allow_cache=allow_cache, quantity=quantity, include_taxes=include_taxes)
 
+    def _get_value(self, context, item, quantity, include_taxes):
         options = PriceDisplayOptions.from_context(context)
         if options.hide_prices:
-            context_cache.set_cached_value(key, "")
             return ""
 
         if include_taxes is None:
@@ -90,49 +176,36 @@ class PriceDisplayFilter(_ContextFilter):
         request = context.get('request')
         orig_priceful = _get_priceful(request, item, quantity)
         if not orig_priceful:
-            context_cache.set_cached_value(key, "")
             return ""
         priceful = convert_taxness(request, item, orig_priceful, include_taxes)
         price_value = getattr(priceful, self.property_name)
-        val = money(price_value)
-        context_cache.set_cached_value(key, val)
-        return val
+        return money(price_value)
 
 
 class PricePropertyFilter(_ContextFilter):
     def __call__(self, context, item, quantity=1, allow_cache=True):
-        key, val = context_cache.get_cached_value(
-            identifier=self.cache_identifier, item=item, context=context,
-            quantity=quantity, name=self.name, allow_cache=allow_cache)
-        if val is not None:
-            return val
+        return self._get_cached_value(
+            context, item, (lambda: self._get_value(context, item, quantity)),
+            allow_cache=allow_cache, quantity=quantity)
 
+    def _get_value(self, context, item, quantity):
         priceful = _get_priceful(context.get('request'), item, quantity)
         if not priceful:
-            context_cache.set_cached_value(key, "")
             return ""
-
-        price = getattr(priceful, self.property_name)
-        context_cache.set_cached_value(key, price)
-        return price
+        return getattr(priceful, self.property_name)
 
 
 class PricePercentPropertyFilter(_ContextFilter):
     def __call__(self, context, item, quantity=1, allow_cache=True):
-        key, val = context_cache.get_cached_value(
-            identifier=self.cache_identifier, item=item, context=context,
-            quantity=quantity, name=self.name, allow_cache=allow_cache)
-        if val is not None:
-            return val
+        return self._get_cached_value(
+            context, item, (lambda: self._get_value(context, item, quantity)),
+            allow_cache=allow_cache, quantity=quantity)
 
+    def _get_value(self, context, item, quantity):
         priceful = _get_priceful(context.get('request'), item, quantity)
         if not priceful:
-            context_cache.set_cached_value(key, "")
             return ""
-
-        val = percent(getattr(priceful, self.property_name))
-        context_cache.set_cached_value(key, val)
-        return val
+        return percent(getattr(priceful, self.property_name))
 
 
 class TotalPriceDisplayFilter(_ContextFilter):
@@ -163,18 +236,14 @@ class PriceRangeDisplayFilter(_ContextFilter):
         """
         :type product: shuup.core.models.Product
         """
+        return self._get_cached_value(
+            context, product, (lambda: self._get_value(context, product, quantity)),
+            allow_cache=allow_cache, quantity=quantity)
 
-        key, val = context_cache.get_cached_value(
-            identifier=self.cache_identifier, item=product, context=context,
-            quantity=quantity, name=self.name, allow_cache=allow_cache)
-        if val is not None:
-            return val
-
+    def _get_value(self, context, product, quantity):
         options = PriceDisplayOptions.from_context(context)
         if options.hide_prices:
-            val = ("", "")
-            context_cache.set_cached_value(key, val)
-            return val
+            return ("", "")
 
         request = context.get('request')
         priced_children = product.get_priced_children(request, quantity)
@@ -190,9 +259,7 @@ class PriceRangeDisplayFilter(_ContextFilter):
             return price
 
         min_max = (priced_products[0], priced_products[-1])
-        prices = tuple(get_formatted_price(x) for x in min_max)
-        context_cache.set_cached_value(key, prices)
-        return prices
+        return tuple(get_formatted_price(x) for x in min_max)
 
 
 def _get_priceful(request, item, quantity):
@@ -208,6 +275,9 @@ def _get_priceful(request, item, quantity):
     :type quantity: numbers.Number
     :rtype: shuup.core.pricing.Priceful|None
     """
+    (preloaded, priceful) = _get_preloaded_priceful(request, item, quantity)
+    if preloaded:
+        return priceful
     if hasattr(item, 'get_price_info'):
         if hasattr(item, 'is_variation_parent'):
             if item.is_variation_parent():
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Deferred stock updates.
+
+Models affecting stocks (order lines, orders and shipments) call
+`schedule_stock_update` instead of updating the stocks right away.
+Within a `deferred_stock_updates` block the scheduled updates are
+collected and run once at the end of the (outermost) block, grouped by
+supplier through `update_stocks`; outside of one they are run
+immediately.
+"""
+from __future__ import unicode_literals
+
+import threading
+from contextlib import contextmanager
+
+from django.db import connection
+
+_state = threading.local()
+
+
+def _get_depth():
+    return getattr(_state, "depth", 0)
+
+
+def schedule_stock_update(supplier, product_id):
+    """
+    Schedule updating the stock of a product of a supplier.
+
+    :type supplier: shuup.core.models.Supplier
+    :type product_id: int
+    """
+    if not _get_depth():
+        supplier.module.update_stock(product_id)
+        return
+    (supplier, product_ids) = _state.pending.setdefault(supplier.pk, (supplier, set()))
+    product_ids.add(product_id)
+
+
+def schedule_stock_updates(supplier_product_ids):
+    """
+    Schedule updating the stocks of the given supplier and product pairs.
+
+    :type supplier_product_ids: Iterable[tuple[shuup.core.models.Supplier, int]]
+    """
+    with deferred_stock_updates():
+        for (supplier, product_id) in supplier_product_ids:
+            schedule_stock_update(supplier, product_id)
+
+
+def _flush(pending):
+    for supplier_id in sorted(pending):
+        (supplier, product_ids) = pending[supplier_id]
+        supplier.module.update_stocks(sorted(product_ids))
+
+
+@contextmanager
+def deferred_stock_updates():
+    """
+    Defer the stock updates scheduled within the block to its end.
+
+    Nested blocks are flushed at the end of the outermost block.  If the
+    block exits with an exception within a transaction, the collected
+    updates are discarded, since the transaction is about to be rolled
+    back anyway.
+    """
+    depth = _get_depth()
+    if not depth:
+        _state.pending = {}
+    _state.depth = depth + 1
+    flush = False
+    try:
+        yield
+        flush = True
+    except Exception:
+        flush = (not connection.in_atomic_block)
+        raise
+    finally:
+        _state.depth = depth
+        if not depth:
+            pending = _state.pending
+            _state.pending = {}
+            if flush:
+                _flush(pending)
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Warm-up of a Shuup process.
+
+Provides, spec settings (and the modules they refer to) are otherwise
+loaded lazily when first used, and templates are compiled when first
+rendered, so the first requests of a fresh worker process pay for
+dozens of imports and template compilations.  Calling `warm_up` (e.g.
+from the WSGI module or a Gunicorn ``post_fork`` hook) does that work
+up front.  The ``shuup_warmup`` management command runs the same steps
+and reports how long each of them took; running it before starting the
+workers also fills the shared caches and the template bytecode cache
+(see ``SHUUP_ENABLE_TEMPLATE_BYTECODE_CACHE``).
+"""
+from __future__ import unicode_literals
+
+import time
+
+import six
+from django.apps import apps
+from django.conf import settings
+from django.template import engines
+from django.utils.encoding import force_text
+from jinja2 import Environment
+
+from shuup.apps import AppConfig
+from shuup.apps.provides import (
+    get_identifier_to_object_map, get_provide_objects
+)
+from shuup.utils.importing import cached_load, load
+
+
+class WarmupStep(object):
+    """
+    A timed step of the warm-up.
+    """
+
+    def __init__(self, kind, name, duration, error=None):
+        """
+        :param kind: Kind of the step (e.g. ``provide`` or ``template``)
+        :type kind: str
+        :param name: Name of the warmed up thing
+        :type name: str
+        :param duration: Duration of the step in seconds
+        :type duration: float
+        :param error: Error message if the step failed
+        :type error: str|None
+        """
+        self.kind = kind
+        self.name = name
+        self.duration = duration
+        self.error = error
+
+
+def _run_step(kind, name, func, *args):
+    start = time.time()
+    try:
+        func(*args)
+        error = None
+    except Exception as exc:
+        error = force_text(exc)
+    return WarmupStep(kind, name, time.time() - start, error)
+
+
+def _get_provide_categories():
+    categories = set()
+    for app_config in apps.get_app_configs():
+        if isinstance(app_config, AppConfig):
+            categories.update(app_config.provides)
+    return sorted(categories)
+
+
+def _load_provide_category(category):
+    list(get_provide_objects(category))
+    get_identifier_to_object_map(category)
+
+
+def warm_up_provides():
+    """
+    Import the objects of all provides of all categories.
+
+    :return: Steps of the imported provides (one per spec)
+    :rtype: list[WarmupStep]
+    """
+    steps = []
+    for category in _get_provide_categories():
+        for app_config in apps.get_app_configs():
+            if not isinstance(app_config, AppConfig):
+                continue
+            spec_list = app_config.provides.get(category, ())
+            if isinstance(spec_list, six.string_types):
+                spec_list = (spec_list,)
+            for spec in spec_list:
+                steps.append(_run_step("provide", "%s: %s" % (category, spec), load, spec))
+        # Fill the loaded provides and identifier maps from the now imported objects
+        steps.append(_run_step("provides", category, _load_provide_category, category))
+    return steps
+
+
+def warm_up_spec_settings():
+    """
+    Load the objects of all ``*_SPEC`` settings.
+
+    :return: Steps of the loaded settings
+    :rtype: list[WarmupStep]
+    """
+    steps = []
+    for setting_name in sorted(dir(settings)):
+        if not (setting_name.startswith("SHUUP_") and setting_name.endswith("_SPEC")):
+            continue
+        if not isinstance(getattr(settings, setting_name), six.string_types):
+            continue
+        steps.append(_run_step("setting", setting_name, cached_load, setting_name))
+    return steps
+
+
+def warm_up_templates():
+    """
+    Compile all of the Jinja templates of the configured template engines.
+
+    The templates are compiled by name, without resolving themed
+    variants, since the themed templates are listed by their own names.
+
+    :return: Steps of the compiled templates
+    :rtype: list[WarmupStep]
+    """
+    steps = []
+    for engine in engines.all():
+        env = getattr(engine, "env", None)
+        if not isinstance(env, Environment):
+            continue
+        for template_name in env.list_templates(extensions=("jinja",)):
+            steps.append(_run_step("template", template_name, Environment.get_template, env, template_name))
+    return steps
+
+
+def warm_up_caches():
+    """
+    Preload the configuration of all shops.
+
+    :return: Steps of the preloaded caches
+    :rtype: list[WarmupStep]
+    """
+    from shuup import configuration
+    from shuup.core.models import Shop
+    return [_run_step("cache", "configuration", lambda: configuration.preload(Shop.objects.all()))]
+
+
+def warm_up(templates=True, caches=True):
+    """
+    Warm up the current process.
+
+    :param templates: Whether to compile the templates
+    :type templates: bool
+    :param caches: Whether to preload caches (requires database access)
+    :type caches: bool
+    :return: All of the warm-up steps
+    :rtype: list[WarmupStep]
+    """
+    steps = warm_up_provides() + warm_up_spec_settings()
+    if templates:
+        steps += warm_up_templates()
+    if caches:
+        steps += warm_up_caches()
+    return steps
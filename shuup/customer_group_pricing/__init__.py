@@ -27,5 +27,20 @@ class CustomerGroupPricingAppConfig(shuup.apps.AppConfig):
         ]
     }
 
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+        from .models import CgpPrice
+        from .utils import bump_price_table_signal_handler
+        post_save.connect(
+            bump_price_table_signal_handler,
+            sender=CgpPrice,
+            dispatch_uid="cgp_price:bump_price_table"
+        )
+        post_delete.connect(
+            bump_price_table_signal_handler,
+            sender=CgpPrice,
+            dispatch_uid="cgp_price:bump_price_table"
+        )
+
 
 default_app_config = __name__ + ".CustomerGroupPricingAppConfig"
@@ -6,13 +6,35 @@
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
 import six
-from django.db.models import Q
+from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
 
 from shuup.core.models import ShopProduct
 from shuup.core.pricing import PriceInfo, PricingModule
 
-from .models import CgpPrice
+from .utils import get_group_prices, get_price_table
+
+
+def _get_group_ids(context):
+    """
+    Get the group ids of the customer of the pricing context.
+
+    The ids are memoized on the context.
+
+    :type context: shuup.core.pricing.PricingContext
+    :rtype: frozenset[int]
+    """
+    group_ids = getattr(context, "_cgp_group_ids", None)
+    if group_ids is None:
+        group_ids = context._cgp_group_ids = frozenset(context.customer.get_group_ids())
+    return group_ids
+
+
+def _get_group_prices(context, product_ids):
+    group_ids = _get_group_ids(context)
+    if settings.SHUUP_CUSTOMER_GROUP_PRICING_USE_PRICE_TABLE:
+        return get_price_table(context.shop, group_ids)
+    return get_group_prices(context.shop, group_ids, product_ids)
 
 
 class CustomerGroupPricingModule(PricingModule):
@@ -29,20 +51,38 @@ class CustomerGroupPricingModule(PricingModule):
             shop_product = product.get_shop_instance(shop)
             product_id = product.pk
 
-        default_price = (shop_product.default_price_value or 0)
+        group_price = _get_group_prices(context, [product_id]).get(product_id)
+        return self._get_price_info(shop, shop_product.default_price_value, group_price, quantity)
 
-        filter = Q(
-            product=product_id, shop=shop,
-            price_value__gt=0,
-            group__in=context.customer.groups.all())
-        result = (
-            CgpPrice.objects.filter(filter)
-            .order_by("price_value")[:1]
-            .values_list("price_value", flat=True)
+    def get_price_infos(self, context, products, quantity=1):
+        shop = context.shop
+        product_ids = set(getattr(product, "pk", product) for product in products)
+        default_prices = dict(
+            ShopProduct.objects.filter(
+                shop=shop, product_id__in=product_ids
+            ).values_list("product_id", "default_price_value")
         )
+        missing_ids = product_ids - set(default_prices)
+        if missing_ids:
+            raise ShopProduct.DoesNotExist(
+                "Products %s are not available in shop %s" % (sorted(missing_ids), shop.pk))
+
+        group_prices = _get_group_prices(context, product_ids)
+        return {
+            product_id: self._get_price_info(shop, default_prices[product_id], group_prices.get(product_id), quantity)
+            for product_id in product_ids
+        }
+
+    def get_pricing_steps_for_products(self, context, products):
+        return {
+            product_id: [price_info]
+            for (product_id, price_info) in six.iteritems(self.get_price_infos(context, products))
+        }
 
-        if result:
-            price = result[0]
+    def _get_price_info(self, shop, default_price, group_price, quantity):
+        default_price = (default_price or 0)
+        if group_price:
+            price = group_price
             if default_price > 0:
                 price = min([default_price, price])
         else:
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Settings of Shuup Customer Group Pricing.
+
+See :ref:`apps-settings` (in :obj:`shuup.apps`) for general information
+about the Shuup settings system.  Especially, when inventing settings of
+your own, the :ref:`apps-naming-settings` section is an important read.
+"""
+from __future__ import unicode_literals
+
+#: Whether the cheapest group prices of all products are kept in an
+#: in-process table per shop and customer group set.  The table makes
+#: pricing product listings query-free, but uses memory proportional to
+#: the number of group prices of the shop.
+#:
+SHUUP_CUSTOMER_GROUP_PRICING_USE_PRICE_TABLE = False
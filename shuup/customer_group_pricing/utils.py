@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+from __future__ import unicode_literals
+
+import threading
+
+from django.db.models import Min
+
+from shuup.core import cache
+
+from .models import CgpPrice
+
+#: In-process price tables by (shop id, group ids)
+_price_tables = {}
+_price_tables_lock = threading.Lock()
+
+
+def _get_price_table_namespace(shop_id):
+    return "cgp_price_table_%d" % shop_id
+
+
+def _get_cheapest_prices(queryset):
+    return dict(
+        queryset.filter(price_value__gt=0).values("product_id")
+        .annotate(price=Min("price_value")).values_list("product_id", "price")
+    )
+
+
+def get_group_prices(shop, group_ids, product_ids):
+    """
+    Get the cheapest (positive) group prices of the given products.
+
+    All of the prices are fetched in a single grouped query.
+
+    :type shop: shuup.core.models.Shop
+    :type group_ids: Iterable[int]
+    :type product_ids: Iterable[int]
+    :return: Price values by product id
+    :rtype: dict[int, decimal.Decimal]
+    """
+    group_ids = list(group_ids)
+    product_ids = list(product_ids)
+    if not (group_ids and product_ids):
+        return {}
+    return _get_cheapest_prices(CgpPrice.objects.filter(shop=shop, group__in=group_ids, product__in=product_ids))
+
+
+def get_price_table(shop, group_ids):
+    """
+    Get the in-process table of the cheapest group prices of all products.
+
+    The table is loaded with a single grouped query once per shop and
+    group set and reloaded after `CgpPrice` objects of the shop are
+    changed (in any process, since the table is versioned with the
+    `shuup.core.cache` version of the shop's price table namespace).
+
+    :type shop: shuup.core.models.Shop
+    :type group_ids: frozenset[int]
+    :return: Price values by product id
+    :rtype: dict[int, decimal.Decimal]
+    """
+    namespace = _get_price_table_namespace(shop.pk)
+    version = cache.get_version(namespace)
+    if version is None:
+        cache.bump_version(namespace)
+        version = cache.get_version(namespace)
+
+    key = (shop.pk, group_ids)
+    (table_version, table) = _price_tables.get(key, (None, None))
+    if table is None or table_version != version:
+        table = (_get_cheapest_prices(CgpPrice.objects.filter(shop=shop, group__in=group_ids)) if group_ids else {})
+        with _price_tables_lock:
+            _price_tables[key] = (version, table)
+    return table
+
+
+def bump_price_table(shop_id):
+    namespace = _get_price_table_namespace(shop_id)
+    cache.bump_version(namespace)
+    with _price_tables_lock:
+        for key in [key for key in _price_tables if key[0] == shop_id]:
+            del _price_tables[key]
+
+
+def bump_price_table_signal_handler(sender, instance, **kwargs):
+    bump_price_table(instance.shop_id)
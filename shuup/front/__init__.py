@@ -63,6 +63,73 @@ class ShuupFrontAppConfig(AppConfig):
         # connect signals
         import shuup.front.notify_events  # noqa: F401
 
+        from django.db.models.signals import (
+            m2m_changed, post_delete, post_save, pre_delete
+        )
+        from shuup.core.models import (
+            CompanyContact, ContactGroup, PersonContact, Shop
+        )
+        from shuup.front.middleware import (
+            bump_company_contacts_signal_handler,
+            bump_company_members_signal_handler,
+            bump_group_members_signal_handler,
+            bump_person_contacts_signal_handler, bump_shop_cache_signal_handler,
+            remember_company_members_signal_handler
+        )
+        post_save.connect(
+            bump_shop_cache_signal_handler, sender=Shop, dispatch_uid="front:bump_shop_cache_on_save")
+        post_delete.connect(
+            bump_shop_cache_signal_handler, sender=Shop, dispatch_uid="front:bump_shop_cache_on_delete")
+        post_save.connect(
+            bump_person_contacts_signal_handler, sender=PersonContact,
+            dispatch_uid="front:bump_person_contacts_on_save")
+        post_delete.connect(
+            bump_person_contacts_signal_handler, sender=PersonContact,
+            dispatch_uid="front:bump_person_contacts_on_delete")
+        post_save.connect(
+            bump_company_contacts_signal_handler, sender=CompanyContact,
+            dispatch_uid="front:bump_company_contacts")
+        pre_delete.connect(
+            remember_company_members_signal_handler, sender=CompanyContact,
+            dispatch_uid="front:remember_company_members")
+        post_delete.connect(
+            bump_company_contacts_signal_handler, sender=CompanyContact,
+            dispatch_uid="front:bump_company_contacts_on_delete")
+        m2m_changed.connect(
+            bump_company_members_signal_handler, sender=CompanyContact.members.through,
+            dispatch_uid="front:bump_company_members")
+        m2m_changed.connect(
+            bump_group_members_signal_handler, sender=ContactGroup.members.through,
+            dispatch_uid="front:bump_group_members")
+
+        from shuup.core.models import (
+            GroupAvailabilityBehaviorComponent, PaymentMethod, Product,
+            ShippingMethod, ShopProduct
+        )
+        from shuup.core.signals import objects_bulk_updated
+        from shuup.front.basket.objects import (
+            bump_basket_services_signal_handler, get_basket_services_models
+        )
+        for model in get_basket_services_models():
+            post_save.connect(
+                bump_basket_services_signal_handler, sender=model,
+                dispatch_uid="front:bump_basket_services_on_save:%s" % model._meta.label_lower)
+            post_delete.connect(
+                bump_basket_services_signal_handler, sender=model,
+                dispatch_uid="front:bump_basket_services_on_delete:%s" % model._meta.label_lower)
+        for through in (
+            ShippingMethod.behavior_components.through, PaymentMethod.behavior_components.through,
+            ShopProduct.shipping_methods.through, ShopProduct.payment_methods.through,
+            GroupAvailabilityBehaviorComponent.groups.through
+        ):
+            m2m_changed.connect(
+                bump_basket_services_signal_handler, sender=through,
+                dispatch_uid="front:bump_basket_services:%s" % through._meta.model_name)
+        for model in (Product, ShopProduct):
+            objects_bulk_updated.connect(
+                bump_basket_services_signal_handler, sender=model,
+                dispatch_uid="front:bump_basket_services_bulk:%s" % model._meta.model_name)
+
         validate_templates_configuration()
 
 
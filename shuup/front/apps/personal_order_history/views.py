@@ -5,11 +5,12 @@
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
 import django.views.generic
+from django.contrib import messages
 from django.core.urlresolvers import reverse
 from django.http import HttpResponseRedirect
 from django.views.generic import View
 
-from shuup.core.models import Order, Supplier
+from shuup.core.models import Order
 from shuup.front.views.dashboard import DashboardViewMixin
 
 
@@ -39,13 +40,12 @@ class ReorderView(View):
         except Order.DoesNotExist:
             return HttpResponseRedirect(reverse("shuup:show-order", kwargs=kwargs))
 
-        supplier = Supplier.objects.first()
-        for line in order.lines.products():
-            request.basket.add_product(
-                supplier=supplier,
-                shop=request.shop,
-                product=line.product,
-                quantity=line.quantity
-            )
+        added_lines, errors = request.basket.add_products([
+            {"product_id": product_id, "supplier_id": supplier_id, "quantity": quantity}
+            for (product_id, supplier_id, quantity)
+            in order.lines.products().values_list("product_id", "supplier_id", "quantity")
+        ])
+        for (line, message) in errors:
+            messages.warning(request, message)
 
         return HttpResponseRedirect(reverse("shuup:basket"))
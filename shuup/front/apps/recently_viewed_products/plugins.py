@@ -4,13 +4,93 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
+import hashlib
+
 from django.conf import settings
+from django.utils.encoding import force_bytes
+from django.utils.translation import get_language
 from django.utils.translation import ugettext_lazy as _
 
+from shuup.core import cache
 from shuup.core.models import Product
 from shuup.xtheme import TemplatedPlugin
+from shuup.xtheme.plugins._base import _get_cache_tag_namespace
 from shuup.xtheme.resources import add_resource
 
+#: Maximum number of recently viewed products shown (and tracked by `lib.js`)
+MAX_PRODUCTS = 5
+
+RECENTLY_VIEWED_PRODUCTS_NAMESPACE = "recently_viewed_products"
+
+
+def get_recently_viewed_product_ids(request):
+    """
+    Get the ids of the recently viewed products from the request cookie.
+
+    The ids are deduplicated and bounded to `MAX_PRODUCTS`; malformed ids are ignored.
+
+    :type request: django.http.HttpRequest
+    :rtype: list[int]
+    """
+    product_ids = []
+    for product_id in request.COOKIES.get("rvp", "").split(","):
+        try:
+            product_id = int(product_id)
+        except ValueError:
+            continue
+        if product_id not in product_ids:
+            product_ids.append(product_id)
+        if len(product_ids) >= MAX_PRODUCTS:
+            break
+    return product_ids
+
+
+def _get_visibility_key(customer):
+    # Product visibility only depends on these (see `ProductQuerySet._visible`)
+    if customer is None or customer.is_anonymous:
+        return "anonymous"
+    if customer.is_all_seeing:
+        return "all"
+    return "groups-" + "-".join(str(group_id) for group_id in sorted(customer.get_group_ids()))
+
+
+def get_recently_viewed_products(shop, customer, product_ids):
+    """
+    Get the rendering data of the visible products of the given ids.
+
+    The result is cached by shop, language, visibility of the customer
+    (anonymous, all seeing or their customer groups) and the ids, and
+    invalidated along with the xtheme plugins tagged with ``products``.
+    The product data is loaded with two queries on a cache miss.
+
+    :type shop: shuup.core.models.Shop
+    :type customer: shuup.core.models.Contact|None
+    :type product_ids: list[int]
+    :return: List of dicts of `pk`, `slug` and `name` in the order of the ids
+    :rtype: list[dict]
+    """
+    if not product_ids:
+        return []
+    key = "%s:%s:%s:%s:%s" % (
+        RECENTLY_VIEWED_PRODUCTS_NAMESPACE, shop.pk, get_language(), _get_visibility_key(customer),
+        hashlib.md5(force_bytes(",".join(str(product_id) for product_id in product_ids))).hexdigest()
+    )
+    # The version of the tag is shared with (and memoized for) the other product plugins
+    version = (cache.get_version(_get_cache_tag_namespace("products")) or "0")
+    products = cache.get(key, version=version)
+    if products is not None:
+        return products
+
+    queryset = Product.objects.listed(shop=shop, customer=customer).filter(
+        id__in=product_ids).prefetch_related("translations")
+    products_by_id = dict(
+        (product.pk, {"pk": product.pk, "slug": product.slug, "name": product.name})
+        for product in queryset
+    )
+    products = [products_by_id[product_id] for product_id in product_ids if product_id in products_by_id]
+    cache.set(key, products, version=version)
+    return products
+
 
 class RecentlyViewedProductsPlugin(TemplatedPlugin):
     identifier = "recently_viewed_products"
@@ -20,11 +100,8 @@ class RecentlyViewedProductsPlugin(TemplatedPlugin):
     def get_context_data(self, context):
         context = super(RecentlyViewedProductsPlugin, self).get_context_data(context)
         request = context["request"]
-        product_ids = [int(pid) for pid in request.COOKIES.get("rvp", "").split(",") if pid != ""]
-        context["products"] = sorted(Product.objects.listed(
-            customer=request.customer,
-            shop=request.shop
-        ).filter(id__in=product_ids), key=lambda p: product_ids.index(p.pk))
+        context["products"] = get_recently_viewed_products(
+            request.shop, request.customer, get_recently_viewed_product_ids(request))
         return context
 
 
@@ -12,8 +12,7 @@ from django.utils.translation import ugettext_lazy as _
 from django.views.generic import DetailView, ListView, View
 from django.views.generic.detail import SingleObjectMixin
 
-from shuup.core.excs import ProductNotOrderableProblem
-from shuup.core.models import OrderLineType, Product
+from shuup.core.models import OrderLineType
 from shuup.core.utils.users import real_user_or_none
 from shuup.front.models import StoredBasket
 from shuup.front.views.dashboard import DashboardViewMixin
@@ -90,48 +89,17 @@ class CartAddAllProductsView(CartViewMixin, SingleObjectMixin, View):
     def get_object(self):
         return get_object_or_404(self.get_queryset(), pk=self.kwargs.get("pk"))
 
-    def _get_supplier(self, shop_product, supplier_id):
-        if supplier_id:
-            supplier = shop_product.suppliers.filter(pk=supplier_id).first()
-        else:
-            supplier = shop_product.suppliers.first()
-        return supplier
-
     @atomic
     def post(self, request, *args, **kwargs):
         cart = self.get_object()
-        basket = request.basket
-        product_ids_to_quantities = basket.get_product_ids_and_quantities()
-        errors = []
-        quantity_added = 0
-        for line in cart.data.get('lines', []):
-            if line.get("type", None) != OrderLineType.PRODUCT:
-                continue
-            product = Product.objects.get(id=line.get("product_id", None))
-            shop_product = product.get_shop_instance(shop=request.shop)
-            if not shop_product:
-                errors.append({"product": line.text, "message": _("Product not available in this shop")})
-                continue
-            supplier = self._get_supplier(shop_product, line.get("supplier_id"))
-            if not supplier:
-                errors.append({"product": line.text, "message": _("Invalid supplier")})
-                continue
-
-            try:
-                quantity = line.get("quantity", 0)
-                quantity_added += quantity
-                product_quantity = quantity + product_ids_to_quantities.get(line["product_id"], 0)
-                shop_product.raise_if_not_orderable(
-                    supplier=supplier,
-                    quantity=product_quantity,
-                    customer=request.customer)
-                basket.add_product(
-                    supplier=supplier,
-                    shop=request.shop,
-                    product=product,
-                    quantity=quantity)
-            except ProductNotOrderableProblem as e:
-                errors.append({"product": line["text"], "message": force_text(e.message)})
+        lines = [
+            line for line in cart.data.get('lines', [])
+            if line.get("type", None) == OrderLineType.PRODUCT and line.get("product_id")
+        ]
+        added_lines, line_errors = request.basket.add_products(lines)
+        errors = [{"product": line.get("text"), "message": message} for (line, message) in line_errors]
+        failed_lines = set(id(line) for (line, message) in line_errors)
+        quantity_added = sum(line.get("quantity", 0) for line in lines if id(line) not in failed_lines)
         return JsonResponse({
             "errors": errors,
             "success": force_text(_("%d product(s) added to cart" % quantity_added))
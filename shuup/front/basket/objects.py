@@ -7,22 +7,70 @@
 # LICENSE file in the root directory of this source tree.
 from __future__ import unicode_literals
 
+import hashlib
+import json
 import random
 from collections import Counter
 from decimal import Decimal
 
 import six
+from django.apps import apps
+from django.conf import settings
 from django.contrib import messages
 from django.core.exceptions import ValidationError
+from django.forms.models import model_to_dict
+from django.utils.encoding import force_bytes, force_text
 from django.utils.translation import ugettext_lazy as _
 
-from shuup.core.models import OrderLineType, PaymentMethod, ShippingMethod
+from shuup.core import cache
+from shuup.core.excs import ProductNotOrderableProblem
+from shuup.core.models import (
+    OrderLineType, PaymentMethod, Product, ServiceBehaviorComponent,
+    ServiceProvider, ShippingMethod, ShopProduct, WeightBasedPriceRange
+)
+from shuup.core.models._service_base import prefetch_behavior_components
 from shuup.core.order_creator import OrderSource, SourceLine
 from shuup.core.order_creator._source import LineSource
 from shuup.front.basket.storage import BasketCompatibilityError, get_storage
 from shuup.utils.numbers import parse_decimal_string
 from shuup.utils.objects import compare_partial_dicts
 
+BASKET_SERVICES_NAMESPACE = "basket_services"
+
+
+def bump_basket_services_cache():
+    """
+    Invalidate the cached available services of all baskets.
+    """
+    cache.bump_version(BASKET_SERVICES_NAMESPACE)
+
+
+#: Models affecting the available services of baskets when saved or deleted
+BASKET_SERVICES_MODELS = (
+    PaymentMethod, Product, ServiceBehaviorComponent, ServiceProvider,
+    ShippingMethod, ShopProduct, WeightBasedPriceRange
+)
+
+
+def get_basket_services_models():
+    """
+    Get the concrete models affecting the available services of baskets.
+
+    The services, providers and components are polymorphic (i.e. saved
+    as their subclasses), so the subclasses of `BASKET_SERVICES_MODELS`
+    in all of the installed apps are included.
+
+    :rtype: list[type]
+    """
+    return [
+        model for model in apps.get_models()
+        if issubclass(model, BASKET_SERVICES_MODELS) and not model._meta.abstract
+    ]
+
+
+def bump_basket_services_signal_handler(sender, **kwargs):
+    bump_basket_services_cache()
+
 
 class BasketLine(SourceLine):
     def __init__(self, source=None, **kwargs):
@@ -97,6 +145,7 @@ class BaseBasket(OrderSource):
         self._orderable_lines_cache = None
         self._unorderable_lines_cache = None
         self._lines_cached = False
+        self._available_services_cache = {}
         self.customer = getattr(request, "customer", None)
         self.orderer = getattr(request, "person", None)
         self.creator = getattr(request, "user", None)
@@ -154,6 +203,10 @@ class BaseBasket(OrderSource):
         self._data = None
         self.dirty = False
 
+    def uncache(self):
+        super(BaseBasket, self).uncache()
+        self._lines_cached = False
+
     def clear_all(self):
         """
         Clear all data for this basket.
@@ -364,6 +417,110 @@ class BaseBasket(OrderSource):
 
         return self.update_line(data, quantity=new_quantity, **extra)
 
+    def add_products(self, lines):
+        """
+        Add multiple products into the basket at once.
+
+        The shop products and their suppliers are fetched in bulk and the
+        orderability of each product is checked against its total quantity
+        in the basket before any of the lines are added.  The lines are
+        then added into the basket data in one go, so the basket is marked
+        dirty (and its cached lines cleared) only once.
+
+        :param lines: Line data dicts with `product_id`, `quantity` and
+                      optionally `supplier_id` keys
+        :type lines: Iterable[dict]
+        :return: The added lines and (line data, error message) pairs of
+                 the lines that could not be added
+        :rtype: tuple[list[BasketLine], list[tuple[dict, str]]]
+        """
+        (to_add, errors) = self._get_lines_for_addition(list(lines))
+        (data_lines, added_lines) = self._merge_lines_for_addition(to_add, errors)
+        if added_lines:
+            self._data_lines = data_lines
+        return (added_lines, errors)
+
+    def _get_lines_for_addition(self, lines):
+        """
+        Validate line data dicts for `add_products`.
+
+        :return: (line data, shop product, supplier, quantity) tuples of
+                 the orderable lines and (line data, error message) pairs
+                 of the rest
+        :rtype: tuple[list[tuple], list[tuple[dict, str]]]
+        """
+        shop_products = dict(
+            (shop_product.product_id, shop_product) for shop_product in (
+                ShopProduct.objects.filter(shop=self.shop, product_id__in=set(line["product_id"] for line in lines))
+                .with_orderability_data()
+            )
+        )
+        quantities = Counter(self.get_product_ids_and_quantities())
+        customer = self.request.customer
+        to_add = []
+        errors = []
+        for line in lines:
+            quantity = parse_decimal_string(line.get("quantity", 0))
+            if quantity <= 0:
+                continue
+            shop_product = shop_products.get(line["product_id"])
+            if not shop_product:
+                errors.append((line, force_text(_("Product not available in this shop"))))
+                continue
+            supplier = self._get_supplier_for_addition(shop_product, line.get("supplier_id"))
+            if not supplier:
+                errors.append((line, force_text(_("Invalid supplier"))))
+                continue
+            try:
+                shop_product.raise_if_not_orderable(
+                    supplier=supplier, customer=customer, quantity=(quantities[shop_product.product_id] + quantity))
+            except ProductNotOrderableProblem as exc:
+                errors.append((line, force_text(exc.message)))
+                continue
+            quantities[shop_product.product_id] += quantity
+            to_add.append((line, shop_product, supplier, quantity))
+        return (to_add, errors)
+
+    def _merge_lines_for_addition(self, to_add, errors):
+        """
+        Merge validated lines of `add_products` into a copy of the basket data lines.
+
+        Lines that can't be initialized are appended into `errors`.
+
+        :return: The new data lines and the added lines
+        :rtype: tuple[list[dict], list[BasketLine]]
+        """
+        data_lines = list(self._data_lines)
+        added_lines = []
+        for (line, shop_product, supplier, quantity) in to_add:
+            product = shop_product.product
+            data = None
+            for data_line in data_lines:
+                if self._compare_line_for_addition(data_line, product, supplier, self.shop, {}):
+                    data = data_line
+                    break
+            if not data:
+                try:
+                    data = self._initialize_product_line_data(product=product, supplier=supplier, shop=self.shop)
+                except ValueError as exc:
+                    errors.append((line, force_text(exc)))
+                    continue
+            basket_line = BasketLine.from_dict(self, data)
+            basket_line.set_quantity(data["quantity"] + quantity)
+            basket_line.cache_info(self.request)
+            new_data = basket_line.to_dict()
+            if data in data_lines:
+                data_lines[data_lines.index(data)] = new_data
+            else:
+                data_lines.append(new_data)
+            added_lines.append(basket_line)
+        return (data_lines, added_lines)
+
+    def _get_supplier_for_addition(self, shop_product, supplier_id=None):
+        if supplier_id:
+            return next((supplier for supplier in shop_product.suppliers.all() if supplier.pk == supplier_id), None)
+        return shop_product._get_first_supplier()
+
     def update_line(self, data_line, **kwargs):
         line = BasketLine.from_dict(self, data_line)
         new_quantity = kwargs.pop("quantity", None)
@@ -455,11 +612,7 @@ class BaseBasket(OrderSource):
 
         :rtype: list[ShippingMethod]
         """
-        return [
-            m for m
-            in ShippingMethod.objects.available(shop=self.shop, products=self.product_ids)
-            if m.is_available_for(self)
-        ]
+        return self._get_available_services(ShippingMethod)
 
     def get_available_payment_methods(self):
         """
@@ -467,8 +620,52 @@ class BaseBasket(OrderSource):
 
         :rtype: list[PaymentMethod]
         """
-        return [
-            m for m
-            in PaymentMethod.objects.available(shop=self.shop, products=self.product_ids)
-            if m.is_available_for(self)
-        ]
+        return self._get_available_services(PaymentMethod)
+
+    def _get_services_cache_key(self, service_model):
+        state = {
+            "data": self._load(),
+            "customer": getattr(self.customer, "pk", None),
+            "customer_groups": (sorted(self.customer.get_group_ids()) if getattr(self.customer, "pk", None) else []),
+            "orderer": getattr(self.orderer, "pk", None),
+            "creator": getattr(self.creator, "pk", None),
+            "shipping_address": (model_to_dict(self.shipping_address) if self.shipping_address else None),
+            "billing_address": (model_to_dict(self.billing_address) if self.billing_address else None),
+        }
+        basket_hash = hashlib.sha1(force_bytes(json.dumps(state, sort_keys=True, default=force_text))).hexdigest()
+        return "%s:%s:%s:%s" % (BASKET_SERVICES_NAMESPACE, service_model._meta.model_name, self.shop.pk, basket_hash)
+
+    def _get_available_services(self, service_model):
+        """
+        Get the available services of the given model for this basket.
+
+        The services are memoized on the basket and cached for
+        `SHUUP_BASKET_SERVICES_CACHE_TIMEOUT` seconds by a hash of the
+        basket's contents, so repeated calls (e.g. by the methods phase
+        and the basket validation) do not recompute the availability.
+        The behavior components of the services are loaded in a batch.
+
+        :type service_model: type[shuup.core.models.Service]
+        :rtype: list[shuup.core.models.Service]
+        """
+        key = self._get_services_cache_key(service_model)
+        # Services changed within this process bump the version right away
+        memo_key = (cache.get_version(BASKET_SERVICES_NAMESPACE), key)
+        services = self._available_services_cache.get(memo_key)
+        if services is not None:
+            return services
+
+        timeout = settings.SHUUP_BASKET_SERVICES_CACHE_TIMEOUT
+        service_ids = (cache.get(key) if timeout else None)
+        if service_ids is None:
+            services = prefetch_behavior_components(
+                service_model.objects.available(shop=self.shop, products=self.product_ids))
+            services = [service for service in services if service.is_available_for(self)]
+            if timeout:
+                cache.set(key, [service.pk for service in services], timeout=timeout)
+        else:
+            services_by_id = service_model.objects.in_bulk(service_ids) if service_ids else {}
+            services = prefetch_behavior_components(
+                services_by_id[service_id] for service_id in service_ids if service_id in services_by_id)
+        self._available_services_cache[memo_key] = services
+        return services
@@ -8,13 +8,16 @@
 from __future__ import unicode_literals
 
 import abc
+import time
 
 import six
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
+from shuup.core import cache
 from shuup.core.utils.users import real_user_or_none
 from shuup.front.models import StoredBasket
+from shuup.front.models.stored_basket import generate_key
 from shuup.utils.importing import cached_load
 
 
@@ -212,6 +215,120 @@ class DatabaseBasketStorage(BasketStorage):
         return stored_basket
 
 
+class CachedDatabaseBasketStorage(DatabaseBasketStorage):
+    """
+    Basket storage keeping a hot copy of the basket in the cache.
+
+    Baskets are loaded from and saved into the cache; the database copy
+    (a `StoredBasket` with its summary totals, which require computing
+    the basket lines) is written behind.  Changes are coalesced into at
+    most one database write per `SHUUP_BASKET_STORAGE_WRITE_BEHIND_DELAY`
+    seconds per basket, done on the first save or load of the basket
+    after the delay, so the changes of a basket that has since been idle
+    are written the next time the basket is used.  The basket is always
+    written into the database when it is finalized (i.e. on checkout).
+
+    Changes not yet written into the database are lost if the cached
+    copy is evicted before they are written.
+    """
+
+    def _get_cache_key_session_key(self, basket):
+        return "basket_%s_cache_key" % basket.basket_name
+
+    def _get_cache_key(self, basket, create=False):
+        session = basket.request.session
+        session_key = self._get_cache_key_session_key(basket)
+        token = session.get(session_key)
+        if not token and create:
+            token = session[session_key] = generate_key()
+        return ("basket_storage:%s" % token if token else None)
+
+    def _get_entry(self, basket):
+        cache_key = self._get_cache_key(basket)
+        return (cache.get(cache_key) if cache_key else None)
+
+    def _set_entry(self, basket, entry):
+        cache.set(self._get_cache_key(basket, create=True), entry, timeout=settings.SHUUP_BASKET_STORAGE_CACHE_TIMEOUT)
+
+    def _get_entry_from_database(self, basket):
+        stored_basket = self._get_stored_basket(basket)
+        if not stored_basket.pk:
+            return None
+        return {
+            "stored_basket": DictStoredBasket(
+                id=stored_basket.pk,
+                shop_id=stored_basket.shop_id,
+                currency=stored_basket.currency,
+                prices_include_tax=stored_basket.prices_include_tax,
+                data=stored_basket.data,
+            ).as_dict(),
+            "dirty_since": None,
+        }
+
+    def _is_stale(self, entry, now):
+        dirty_since = entry["dirty_since"]
+        return bool(dirty_since and now - dirty_since >= settings.SHUUP_BASKET_STORAGE_WRITE_BEHIND_DELAY)
+
+    def _load_stored_basket(self, basket):
+        entry = self._get_entry(basket)
+        if entry is None:
+            entry = self._get_entry_from_database(basket)
+            if entry is None:
+                return None
+            self._set_entry(basket, entry)
+        elif self._is_stale(entry, time.time()):
+            # The basket has been idle since its last unwritten changes; write them now.
+            # The entry is marked clean first, since computing the totals loads the basket again.
+            entry["dirty_since"] = None
+            self._set_entry(basket, entry)
+            self.persist(basket, entry["stored_basket"]["data"])
+            basket.uncache()
+        return DictStoredBasket.from_dict(entry["stored_basket"])
+
+    def save(self, basket, data):
+        """
+        :type basket: shuup.front.basket.objects.BaseBasket
+        """
+        entry = (self._get_entry(basket) or {"dirty_since": None})
+        entry["stored_basket"] = DictStoredBasket.from_basket_and_data(basket, data).as_dict()
+        now = time.time()
+        entry["dirty_since"] = (entry["dirty_since"] or now)
+        if self._is_stale(entry, now):
+            self.persist(basket, data)
+            entry["dirty_since"] = None
+        self._set_entry(basket, entry)
+
+    def persist(self, basket, data=None):
+        """
+        Write the basket into the database.
+
+        :type basket: shuup.front.basket.objects.BaseBasket
+        :param data: Basket data (defaults to the cached data)
+        :type data: dict|None
+        """
+        if data is None:
+            entry = self._get_entry(basket)
+            if not (entry and entry["dirty_since"]):
+                return
+            data = entry["stored_basket"]["data"]
+        super(CachedDatabaseBasketStorage, self).save(basket, data)
+
+    def delete(self, basket):
+        self._clear_cache(basket)
+        super(CachedDatabaseBasketStorage, self).delete(basket)
+
+    def finalize(self, basket):
+        self.persist(basket)
+        self._clear_cache(basket)
+        super(CachedDatabaseBasketStorage, self).finalize(basket)
+
+    def _clear_cache(self, basket):
+        cache_key = self._get_cache_key(basket)
+        if cache_key:
+            cache.set(cache_key, None)
+        basket.request.session.pop(self._get_cache_key_session_key(basket), None)
+
+
 def _price_units_diff(x, y):
     diff = []
     if x.currency != y.currency:
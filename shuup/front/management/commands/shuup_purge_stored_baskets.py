@@ -0,0 +1,29 @@
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Purge stored baskets older than their retention period.
+
+Abandoned baskets are summarized into the daily abandoned basket
+summaries before they are deleted.
+"""
+from django.core.management.base import BaseCommand
+
+from shuup.front.utils.stored_baskets import purge_all_stored_baskets
+
+
+class Command(BaseCommand):
+    help = __doc__.strip()
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size", type=int, default=None,
+            help="Number of baskets to delete per transaction")
+
+    def handle(self, *args, **options):
+        counts = purge_all_stored_baskets(chunk_size=options["chunk_size"])
+        for (state, count) in sorted(counts.items()):
+            self.stdout.write("Purged %d %s baskets" % (count, state))
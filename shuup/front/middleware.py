@@ -11,21 +11,45 @@ from django.contrib.auth import logout
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.auth.signals import user_logged_in, user_logged_out
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Q
 from django.http import HttpResponse
 from django.template import loader
 from django.utils import timezone
+from django.utils.functional import empty, SimpleLazyObject
 from django.utils.translation import ugettext_lazy as _
 
+from shuup.core import cache
 from shuup.core.middleware import ExceptionMiddleware
-from shuup.core.models import (
-    Contact, get_company_contact, get_person_contact, Shop
-)
-from shuup.front.basket import get_basket
+from shuup.core.models import Contact, get_person_contact, PersonContact, Shop
+from shuup.utils.importing import cached_load
 
 __all__ = ["ProblemMiddleware", "ShuupFrontMiddleware"]
 
 ProblemMiddleware = ExceptionMiddleware  # This class is only an alias for ExceptionMiddleware.
 
+SHOP_CACHE_KEY = "front_shop:first"
+
+
+def get_request_contacts_cache_key(user_id):
+    """
+    Get the cache key for the person and company contacts resolved for a user.
+
+    The key lives in a per-user namespace bumped by `bump_request_contacts`.
+
+    :type user_id: int
+    :rtype: str
+    """
+    return "front_request_contacts_%s:contacts" % user_id
+
+
+def bump_request_contacts(user_id):
+    if user_id:
+        cache.bump_version(get_request_contacts_cache_key(user_id))
+
+
+def _is_evaluated(lazy_object):
+    return not (isinstance(lazy_object, SimpleLazyObject) and lazy_object._wrapped is empty)
+
 
 class ShuupFrontMiddleware(object):
     """
@@ -62,6 +86,11 @@ class ShuupFrontMiddleware(object):
 
       ``request.basket`` : :class:`shuup.front.basket.objects.BaseBasket`
           Shopping basket in use.
+
+    The shop and the contacts of the user are resolved through
+    versioned caches.  The basket and the price display options are
+    lazy and only loaded when they are first used, so requests not
+    touching them run no queries in the middleware.
     """
 
     def process_request(self, request):
@@ -74,12 +103,36 @@ class ShuupFrontMiddleware(object):
 
     def _set_shop(self, request):
         # TODO: Not the best logic :)
-        request.shop = Shop.objects.first()
+        shop = cache.get(SHOP_CACHE_KEY)
+        if shop is None:
+            shop = Shop.objects.first()
+            if shop:
+                cache.set(SHOP_CACHE_KEY, shop, settings.SHUUP_FRONT_REQUEST_CACHE_TIMEOUT)
+        request.shop = shop
         if not request.shop:
             raise ImproperlyConfigured("No shop!")
 
+    def _get_contacts(self, user):
+        """
+        Get the person and company contacts of the given user.
+
+        :return: person contact and company contact (or None)
+        :rtype: (shuup.core.models.Contact, shuup.core.models.CompanyContact|None)
+        """
+        if not user or user.is_anonymous():
+            return (get_person_contact(None), None)
+
+        cache_key = get_request_contacts_cache_key(user.pk)
+        contacts = cache.get(cache_key)
+        if contacts is None:
+            person = get_person_contact(user)
+            company = person.company_memberships.filter(is_active=True).first()
+            contacts = (person, company)
+            cache.set(cache_key, contacts, settings.SHUUP_FRONT_REQUEST_CACHE_TIMEOUT)
+        return contacts
+
     def _set_person(self, request):
-        request.person = get_person_contact(request.user)
+        request.person, request._company_contact = self._get_contacts(request.user)
         if not request.person.is_active:
             messages.add_message(request, messages.INFO, _("Logged out since this account is inactive."))
             logout(request)
@@ -87,15 +140,19 @@ class ShuupFrontMiddleware(object):
             # method via a signal and that already sets request.person
             # to anonymous, but set it explicitly too, just to be sure
             request.person = get_person_contact(None)
+            request._company_contact = None
 
     def _set_customer(self, request):
-        company = get_company_contact(request.user)
+        company = request._company_contact
         request.customer = (company or request.person)
         request.is_company_member = bool(company)
         request.customer_groups = (company or request.person).groups.all()
 
     def _set_basket(self, request):
-        request.basket = get_basket(request)
+        if getattr(request, "basket", None) is not None:  # E.g. refreshing on login, keep the loaded basket
+            return
+        basket_class = cached_load("SHUUP_BASKET_CLASS_SPEC")
+        request.basket = SimpleLazyObject(lambda: basket_class(request, basket_name="basket"))
 
     def _set_timezone(self, request):
         if request.person.timezone:
@@ -105,11 +162,12 @@ class ShuupFrontMiddleware(object):
     def _set_price_display_options(self, request):
         customer = request.customer
         assert isinstance(customer, Contact)
-        customer.get_price_display_options().set_for_request(request)
+        request.price_display_options = SimpleLazyObject(customer.get_price_display_options)
 
     def process_response(self, request, response):
-        if hasattr(request, "basket") and request.basket.dirty:
-            request.basket.save()
+        basket = getattr(request, "basket", None)
+        if basket is not None and _is_evaluated(basket) and basket.dirty:
+            basket.save()
 
         return response
 
@@ -167,3 +225,62 @@ if (
 ):
     user_logged_in.connect(ShuupFrontMiddleware.refresh_on_user_change, dispatch_uid="shuup_front_refresh_on_login")
     user_logged_out.connect(ShuupFrontMiddleware.refresh_on_logout, dispatch_uid="shuup_front_refresh_on_logout")
+
+
+def bump_shop_cache_signal_handler(sender, instance, **kwargs):
+    cache.bump_version(SHOP_CACHE_KEY)
+
+
+def bump_person_contacts_signal_handler(sender, instance, **kwargs):
+    bump_request_contacts(instance.user_id)
+
+
+def _get_member_user_ids(company):
+    return list(
+        PersonContact.objects.filter(company_memberships=company).exclude(user=None).values_list("user_id", flat=True))
+
+
+def _bump_contacts(contact_ids):
+    # Bump the users of the given person contacts and of the members of the given companies
+    user_ids = PersonContact.objects.filter(
+        Q(pk__in=contact_ids) | Q(company_memberships__in=contact_ids)
+    ).exclude(user=None).values_list("user_id", flat=True).distinct()
+    for user_id in user_ids:
+        bump_request_contacts(user_id)
+
+
+def remember_company_members_signal_handler(sender, instance, **kwargs):
+    # The memberships are gone by the time `post_delete` is sent
+    if instance.pk:
+        instance._deleted_member_user_ids = _get_member_user_ids(instance)
+
+
+def bump_company_contacts_signal_handler(sender, instance, **kwargs):
+    if not instance.pk:
+        return
+    user_ids = getattr(instance, "_deleted_member_user_ids", None)
+    for user_id in (user_ids if user_ids is not None else _get_member_user_ids(instance)):
+        bump_request_contacts(user_id)
+
+
+def _get_changed_contact_ids(instance, action, pk_set, reverse):
+    if reverse:  # `instance` is the contact
+        return [instance.pk]
+    if action == "pre_clear":
+        return list(instance.members.values_list("pk", flat=True))
+    return list(pk_set or ())
+
+
+def bump_company_members_signal_handler(sender, instance, action, pk_set, reverse, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    contact_ids = _get_changed_contact_ids(instance, action, pk_set, reverse)
+    user_ids = PersonContact.objects.filter(pk__in=contact_ids).values_list("user_id", flat=True)
+    for user_id in user_ids:
+        bump_request_contacts(user_id)
+
+
+def bump_group_members_signal_handler(sender, instance, action, pk_set, reverse, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    _bump_contacts(_get_changed_contact_ids(instance, action, pk_set, reverse))
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import shuup.core.fields
+import shuup.utils.properties
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shuup_front', '0002_stored_basket_model_name_translatable'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AbandonedBasketSummary',
+            fields=[
+                ('id', models.AutoField(serialize=False, verbose_name='ID', auto_created=True, primary_key=True)),
+                ('date', models.DateField(verbose_name='date', db_index=True)),
+                ('anonymous', models.BooleanField(verbose_name='anonymous', default=False)),
+                ('currency', shuup.core.fields.CurrencyField(max_length=4, verbose_name='currency')),
+                ('prices_include_tax', models.BooleanField(verbose_name='prices include tax')),
+                ('basket_count', models.IntegerField(default=0, verbose_name='basket count')),
+                ('product_count', models.IntegerField(default=0, verbose_name='product count')),
+                ('taxless_total_price_value', shuup.core.fields.MoneyValueField(verbose_name='taxless total price', decimal_places=9, default=0, max_digits=36)),
+                ('taxful_total_price_value', shuup.core.fields.MoneyValueField(verbose_name='taxful total price', decimal_places=9, default=0, max_digits=36)),
+                ('shop', models.ForeignKey(verbose_name='shop', to='shuup.Shop', on_delete=django.db.models.deletion.CASCADE)),
+            ],
+            options={
+                'verbose_name': 'abandoned basket summary',
+                'verbose_name_plural': 'abandoned basket summaries',
+            },
+            bases=(shuup.utils.properties.MoneyPropped, models.Model),
+        ),
+        migrations.AlterUniqueTogether(
+            name='abandonedbasketsummary',
+            unique_together=set([('shop', 'date', 'anonymous', 'currency', 'prices_include_tax')]),
+        ),
+    ]
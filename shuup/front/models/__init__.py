@@ -6,6 +6,6 @@
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
 
-from .stored_basket import StoredBasket
+from .stored_basket import AbandonedBasketSummary, StoredBasket
 
-__all__ = ["StoredBasket"]
+__all__ = ["AbandonedBasketSummary", "StoredBasket"]
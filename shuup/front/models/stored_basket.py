@@ -72,3 +72,32 @@ class StoredBasket(MoneyPropped, models.Model):
         app_label = "shuup_front"
         verbose_name = _('stored basket')
         verbose_name_plural = _('stored baskets')
+
+
+class AbandonedBasketSummary(MoneyPropped, models.Model):
+    """
+    Daily summary of abandoned stored baskets.
+
+    Abandoned baskets are summarized into these rows (by the day of their
+    last update) before they are purged.
+    """
+    shop = models.ForeignKey(Shop, on_delete=models.CASCADE, verbose_name=_('shop'))
+    date = models.DateField(db_index=True, verbose_name=_('date'))
+    anonymous = models.BooleanField(default=False, verbose_name=_('anonymous'))
+    currency = CurrencyField(verbose_name=_('currency'))
+    prices_include_tax = models.BooleanField(verbose_name=_('prices include tax'))
+
+    basket_count = models.IntegerField(default=0, verbose_name=_('basket count'))
+    product_count = models.IntegerField(default=0, verbose_name=_('product count'))
+
+    taxful_total_price = TaxfulPriceProperty('taxful_total_price_value', 'currency')
+    taxless_total_price = TaxlessPriceProperty('taxless_total_price_value', 'currency')
+
+    taxless_total_price_value = MoneyValueField(default=0, verbose_name=_('taxless total price'))
+    taxful_total_price_value = MoneyValueField(default=0, verbose_name=_('taxful total price'))
+
+    class Meta:
+        app_label = "shuup_front"
+        unique_together = [("shop", "date", "anonymous", "currency", "prices_include_tax")]
+        verbose_name = _('abandoned basket summary')
+        verbose_name_plural = _('abandoned basket summaries')
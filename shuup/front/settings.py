@@ -40,12 +40,61 @@ SHUUP_BASKET_CLASS_SPEC = (
 #: The spec string defining which basket storage class to use for the frontend.
 #:
 #: Basket storages are responsible for persisting visitor basket state, whether
-#: in the database (DatabaseBasketStorage) or directly in the session
-#: (DirectSessionBasketStorage).  Custom storage backends could use caches, flat
+#: in the database (DatabaseBasketStorage), in the cache and written behind into
+#: the database (CachedDatabaseBasketStorage) or directly in the session
+#: (DirectSessionBasketStorage).  Custom storage backends could use flat
 #: files, etc. if required.
 SHUUP_BASKET_STORAGE_CLASS_SPEC = (
     "shuup.front.basket.storage:DatabaseBasketStorage")
 
+#: Number of seconds the changes of a basket are kept only in the cache
+#: before they are written into the database, when using the
+#: ``CachedDatabaseBasketStorage`` basket storage.
+#:
+#: The changes are written on the first save or load of the basket after
+#: the delay (and always when the basket is finalized), so the database is
+#: written at most once per delay per basket.
+SHUUP_BASKET_STORAGE_WRITE_BEHIND_DELAY = 5 * 60
+
+#: Number of seconds the ``CachedDatabaseBasketStorage`` basket storage
+#: keeps the baskets in the cache.
+SHUUP_BASKET_STORAGE_CACHE_TIMEOUT = 24 * 60 * 60
+
+#: Number of seconds the available shipping and payment methods of a
+#: basket are cached by a hash of the basket's contents.
+#:
+#: The cached methods are invalidated when services, their behavior
+#: components, service providers, products or shop products are saved.
+#: Set to 0 to only memoize the methods on the basket object.
+SHUUP_BASKET_SERVICES_CACHE_TIMEOUT = 5 * 60
+
+#: Number of seconds the front middleware caches the shop and the
+#: contacts of the users for.
+#:
+#: The cached objects are invalidated when they, the company memberships
+#: or the contact group memberships are changed, so the timeout only
+#: limits the staleness caused by changes made without signals (such as
+#: queryset updates).
+SHUUP_FRONT_REQUEST_CACHE_TIMEOUT = 5 * 60
+
+#: Number of days stored baskets are kept after their last update, by state.
+#:
+#: The ``shuup_purge_stored_baskets`` management command deletes the older
+#: baskets.  The states are ``finished`` (converted into orders),
+#: ``persistent`` (saved carts), ``anonymous`` and ``customer`` (other
+#: baskets without and with a customer).  Baskets of states set to None are
+#: kept forever.  Anonymous and customer baskets are summarized into daily
+#: abandoned basket summaries before they are deleted.
+SHUUP_STORED_BASKET_RETENTION_DAYS = {
+    "finished": 30,
+    "persistent": None,
+    "anonymous": 30,
+    "customer": 90,
+}
+
+#: Number of stored baskets deleted per transaction when purging stored baskets.
+SHUUP_STORED_BASKET_PURGE_CHUNK_SIZE = 1000
+
 #: Spec string for the Django CBV (or an API-compliant class) for the checkout view.
 #:
 #: This is used to customize the behavior of the checkout process; most likely to
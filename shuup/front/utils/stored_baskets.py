@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Purging of old stored baskets.
+
+Stored baskets are purged by their state (see `BASKET_STATES`) once they
+have not been updated for the number of days configured for the state in
+`SHUUP_STORED_BASKET_RETENTION_DAYS`.  Abandoned baskets are summarized
+into daily `AbandonedBasketSummary` rows before they are deleted.
+"""
+from __future__ import unicode_literals
+
+import datetime
+from collections import defaultdict
+from decimal import Decimal
+
+from django.conf import settings
+from django.db.models import Q
+from django.db.transaction import atomic
+from django.utils import timezone
+
+from shuup.front.models import AbandonedBasketSummary, StoredBasket
+
+#: Stored basket states by their retention settings key
+BASKET_STATES = {
+    "finished": Q(finished=True),
+    "persistent": Q(finished=False, persistent=True, deleted=False),
+    "anonymous": Q(finished=False, customer=None) & ~Q(persistent=True, deleted=False),
+    "customer": Q(finished=False, customer__isnull=False) & ~Q(persistent=True, deleted=False),
+}
+
+
+def _get_date(value):
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.date()
+
+
+def _summarize_abandoned_baskets(basket_ids):
+    totals = defaultdict(lambda: [0, 0, Decimal(0), Decimal(0)])
+    values = StoredBasket.objects.filter(pk__in=basket_ids).values_list(
+        "shop_id", "updated_on", "customer_id", "currency", "prices_include_tax",
+        "product_count", "taxful_total_price_value", "taxless_total_price_value")
+    for (shop_id, updated_on, customer_id, currency, prices_include_tax,
+         product_count, taxful_total_price_value, taxless_total_price_value) in values:
+        key = (shop_id, _get_date(updated_on), (customer_id is None), currency, prices_include_tax)
+        total = totals[key]
+        total[0] += 1
+        total[1] += (product_count or 0)
+        total[2] += (taxful_total_price_value or 0)
+        total[3] += (taxless_total_price_value or 0)
+
+    for ((shop_id, date, anonymous, currency, prices_include_tax), total) in totals.items():
+        summary, created = AbandonedBasketSummary.objects.select_for_update().get_or_create(
+            shop_id=shop_id, date=date, anonymous=anonymous,
+            currency=currency, prices_include_tax=prices_include_tax)
+        summary.basket_count += total[0]
+        summary.product_count += total[1]
+        summary.taxful_total_price_value += total[2]
+        summary.taxless_total_price_value += total[3]
+        summary.save()
+
+
+def purge_stored_baskets(state, retention_days, now=None, chunk_size=None):
+    """
+    Purge the stored baskets of a state not updated within the retention period.
+
+    The baskets are deleted in chunks of ids, each chunk in a transaction
+    of its own.  The chunks are selected by the (indexed) update time and
+    primary key, so every chunk is an index range scan.
+
+    :param state: Basket state (a key of `BASKET_STATES`)
+    :type state: str
+    :param retention_days: Number of days to keep the baskets for
+    :type retention_days: int
+    :param now: Current time (defaults to now)
+    :type now: datetime.datetime|None
+    :param chunk_size: Number of baskets per chunk (defaults to `SHUUP_STORED_BASKET_PURGE_CHUNK_SIZE`)
+    :type chunk_size: int|None
+    :return: Number of purged baskets
+    :rtype: int
+    """
+    cutoff = (now or timezone.now()) - datetime.timedelta(days=retention_days)
+    chunk_size = (chunk_size or settings.SHUUP_STORED_BASKET_PURGE_CHUNK_SIZE)
+    queryset = StoredBasket.objects.filter(BASKET_STATES[state], updated_on__lt=cutoff).order_by("pk")
+    summarize = (state in ("anonymous", "customer"))
+    count = 0
+    last_id = 0
+    while True:
+        basket_ids = list(queryset.filter(pk__gt=last_id).values_list("pk", flat=True)[:chunk_size])
+        if not basket_ids:
+            break
+        with atomic():
+            if summarize:
+                _summarize_abandoned_baskets(basket_ids)
+            StoredBasket.products.through.objects.filter(storedbasket_id__in=basket_ids).delete()
+            StoredBasket.objects.filter(pk__in=basket_ids).delete()
+        count += len(basket_ids)
+        last_id = basket_ids[-1]
+    return count
+
+
+def purge_all_stored_baskets(now=None, chunk_size=None):
+    """
+    Purge the stored baskets of all states with a retention period.
+
+    :return: Number of purged baskets by state
+    :rtype: dict[str, int]
+    """
+    counts = {}
+    for (state, retention_days) in sorted(settings.SHUUP_STORED_BASKET_RETENTION_DAYS.items()):
+        if retention_days is not None:
+            counts[state] = purge_stored_baskets(state, retention_days, now=now, chunk_size=chunk_size)
+    return counts
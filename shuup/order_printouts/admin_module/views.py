@@ -18,17 +18,19 @@ from shuup.utils.pdf import html_to_pdf, render_html_to_pdf
 
 from .forms import PrintoutsEmailForm
 
+STYLESHEET_PATHS = ["order_printouts/css/extra.css"]
+
 
 def get_delivery_pdf(request, shipment_pk):
     shipment = Shipment.objects.get(pk=shipment_pk)
     html = _get_delivery_html(request, shipment.order, shipment)
-    return render_html_to_pdf(html, stylesheet_paths=["order_printouts/css/extra.css"])
+    return render_html_to_pdf(html, stylesheet_paths=STYLESHEET_PATHS)
 
 
 def get_confirmation_pdf(request, order_pk):
     order = Order.objects.get(pk=order_pk)
     html = _get_confirmation_html(request, order)
-    return render_html_to_pdf(html, stylesheet_paths=["order_printouts/css/extra.css"])
+    return render_html_to_pdf(html, stylesheet_paths=STYLESHEET_PATHS)
 
 
 def get_delivery_html(request, shipment_pk):
@@ -117,6 +119,6 @@ def _get_footer_information(shop):
 
 def _send_printouts_email(recipients, subject, body, html, attachment_filename):
     email = EmailMessage(subject=subject, body=body, to=recipients)
-    pdf = html_to_pdf(html, stylesheet_paths=["order_printouts/css/extra.css"])
+    pdf = html_to_pdf(html, stylesheet_paths=STYLESHEET_PATHS)
     email.attach(attachment_filename, pdf, mimetype="application/pdf")
     email.send()
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Batch rendering of order printouts.
+
+The HTML of the printouts is rendered in the calling process (it needs
+the database), after which the PDFs are rendered (optionally in a pool
+of `SHUUP_ORDER_PRINTOUTS_BATCH_PROCESSES` worker processes) and written
+into a ZIP archive as they are finished.  The archive is either
+streamed to the response or written into a file (e.g. by a background
+job).
+"""
+from __future__ import unicode_literals
+
+import multiprocessing
+import zipfile
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils.encoding import force_bytes, force_text
+
+from shuup.core.models import Order, Shipment
+from shuup.order_printouts.admin_module.views import (
+    _get_confirmation_html, _get_delivery_html, STYLESHEET_PATHS
+)
+from shuup.utils.pdf import fetch_resources, html_to_pdf, load_stylesheets
+
+ERRORS_FILENAME = "errors.txt"
+
+
+class _ZipStream(object):
+    """
+    Write-only file-like object collecting the data written by `ZipFile`.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data):
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _get_error_message(exc):
+    return force_text(exc.message if hasattr(exc, "message") else exc)
+
+
+def get_confirmation_documents(request, order_ids):
+    """
+    Render the confirmation printout HTML for the given orders.
+
+    :return: List of (filename, html) documents and list of error messages
+    :rtype: tuple[list[tuple[str, str]], list[str]]
+    """
+    orders = Order.objects.select_related("shop").in_bulk(order_ids)
+    documents = []
+    errors = []
+    for order_id in order_ids:
+        try:
+            html = _get_confirmation_html(request, orders[order_id])
+        except Exception as exc:
+            errors.append(_get_error_message(exc))
+            continue
+        documents.append(("order_%d_confirmation.pdf" % order_id, html))
+    return (documents, errors)
+
+
+def get_delivery_documents(request, shipment_ids):
+    """
+    Render the delivery printout HTML for the given shipments.
+
+    :return: List of (filename, html) documents and list of error messages
+    :rtype: tuple[list[tuple[str, str]], list[str]]
+    """
+    shipments = Shipment.objects.select_related("order", "order__shop").in_bulk(shipment_ids)
+    documents = []
+    errors = []
+    for shipment_id in shipment_ids:
+        try:
+            shipment = shipments[shipment_id]
+            html = _get_delivery_html(request, shipment.order, shipment)
+        except Exception as exc:
+            errors.append(_get_error_message(exc))
+            continue
+        documents.append(("shipment_%d_delivery.pdf" % shipment_id, html))
+    return (documents, errors)
+
+
+def _get_task(filename, html, resources):
+    try:
+        return (filename, html, fetch_resources(html, resources), None)
+    except Exception as exc:
+        return (filename, None, None, _get_error_message(exc))
+
+
+def _render_pdf(task):
+    (filename, html, resources, error) = task
+    if error:
+        return (filename, None, error)
+    try:
+        return (filename, html_to_pdf(html, stylesheet_paths=STYLESHEET_PATHS, resources=resources), None)
+    except Exception as exc:
+        return (filename, None, _get_error_message(exc))
+
+
+def render_pdfs(documents, processes=None):
+    """
+    Render the given HTML documents into PDFs.
+
+    Resources (such as shop logos) are fetched in the calling process, so
+    the worker processes never touch the database.  The results are
+    yielded in the order of the documents; a document whose resources
+    or PDF could not be rendered yields an error message instead.
+
+    The PDFs are rendered in the calling process when there are less
+    than two documents or the calling process is daemonic (e.g. a Celery
+    worker), since daemonic processes are not allowed to have children.
+
+    :param documents: List of (filename, html) documents
+    :type documents: list[tuple[str, str]]
+    :param processes: Number of worker processes (defaults to `SHUUP_ORDER_PRINTOUTS_BATCH_PROCESSES`)
+    :type processes: int|None
+    :return: Iterable of (filename, pdf data, error message) tuples
+    :rtype: Iterable[tuple[str, bytes|None, str|None]]
+    """
+    load_stylesheets(STYLESHEET_PATHS)  # Parse once, inherited by the workers
+    resources = {}
+    tasks = [_get_task(filename, html, resources) for (filename, html) in documents]
+    if processes is None:
+        processes = settings.SHUUP_ORDER_PRINTOUTS_BATCH_PROCESSES
+    processes = min(processes, len(tasks))
+    if processes < 2 or multiprocessing.current_process().daemon:
+        for task in tasks:
+            yield _render_pdf(task)
+        return
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        for result in pool.imap(_render_pdf, tasks):
+            yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def iter_pdf_zip(documents, errors=(), processes=None):
+    """
+    Render the given documents into PDFs and yield a ZIP archive of them in chunks.
+
+    Error messages (both the given ones and the ones of the failed
+    renders) are written into an `errors.txt` file in the archive.
+
+    :param documents: List of (filename, html) documents
+    :type documents: list[tuple[str, str]]
+    :param errors: Error messages of documents that could not be rendered
+    :type errors: Iterable[str]
+    :rtype: Iterable[bytes]
+    """
+    errors = list(errors)
+    stream = _ZipStream()
+    archive = zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED)
+    for (filename, pdf, error) in render_pdfs(documents, processes=processes):
+        if error:
+            errors.append(error)
+            continue
+        archive.writestr(filename, pdf)
+        yield stream.pop()
+    if errors:
+        archive.writestr(ERRORS_FILENAME, force_bytes("\n".join(errors)))
+    archive.close()
+    yield stream.pop()
+
+
+def write_pdf_zip(documents, fileobj, errors=(), processes=None):
+    """
+    Write a ZIP archive of PDFs of the given documents into a file.
+
+    :param documents: List of (filename, html) documents
+    :type documents: list[tuple[str, str]]
+    :param fileobj: File-like object to write the archive into
+    """
+    for chunk in iter_pdf_zip(documents, errors, processes=processes):
+        fileobj.write(chunk)
+
+
+def get_pdf_zip_response(documents, filename, errors=()):
+    """
+    Get a response streaming a ZIP archive of PDFs of the given documents.
+
+    :param documents: List of (filename, html) documents
+    :type documents: list[tuple[str, str]]
+    :param filename: Filename of the archive
+    :type filename: str
+    :rtype: django.http.StreamingHttpResponse
+    """
+    response = StreamingHttpResponse(iter_pdf_zip(documents, errors), content_type="application/zip")
+    response["Content-Disposition"] = "attachment; filename=%s" % filename
+    return response
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Settings of Shuup Order Printouts.
+
+See :ref:`apps-settings` (in :obj:`shuup.apps`) for general information
+about the Shuup settings system.  Especially, when inventing settings of
+your own, the :ref:`apps-naming-settings` section is an important read.
+"""
+from __future__ import unicode_literals
+
+#: Number of worker processes used to render the PDFs of printout
+#: batches (e.g. the order list PDF mass actions).  Set to 0 to render
+#: the PDFs serially in the calling process.
+#:
+#: The pool is forked for every batch, which is why this is off by
+#: default: forking web server processes in the middle of a request is
+#: best avoided.  Daemonic processes (such as Celery workers) always
+#: render the PDFs serially.
+#:
+SHUUP_ORDER_PRINTOUTS_BATCH_PROCESSES = 0
@@ -11,6 +11,9 @@ import shuup.apps
 class AppConfig(shuup.apps.AppConfig):
     name = "shuup.regions"
     provides = {
+        "front_urls": [
+            "shuup.regions.urls:urlpatterns",
+        ],
         "xtheme_resource_injection": [
             "shuup.regions.resources:add_front_resources",
         ],
@@ -5,8 +5,12 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
+import hashlib
 import json
 
+from django.core.urlresolvers import NoReverseMatch, reverse
+from django.utils.encoding import force_bytes
+
 from shuup.xtheme.resources import add_resource, InlineScriptResource
 
 from .data import regions_data
@@ -92,9 +96,43 @@ $(function(){
 """
 
 
+_regions_script = None
+
+
+def get_regions_script():
+    """
+    Get the script defining the region data and the region changer functions.
+
+    The script is serialized once per process.
+
+    :return: Script and its content hash
+    :rtype: tuple[str, str]
+    """
+    global _regions_script
+    if _regions_script is None:
+        script = (REGIONS % {"regions": json.dumps(regions_data, sort_keys=True)}) + REGION_CHANGER_JS
+        _regions_script = (script, hashlib.md5(force_bytes(script)).hexdigest()[:12])
+    return _regions_script
+
+
+def add_regions_script(context, placement="body_end"):
+    """
+    Add the region data script into the given context.
+
+    The script is added as a content-hashed URL, so browsers may cache
+    it for good.  If the regions URL isn't configured (i.e. the front
+    URLs aren't included), the script is inlined instead.
+    """
+    (script, script_hash) = get_regions_script()
+    try:
+        resource = reverse("shuup:regions", kwargs={"hash": script_hash})
+    except NoReverseMatch:
+        resource = InlineScriptResource(script)
+    add_resource(context, placement, resource)
+
+
 def add_resources(context, placement="body_end", fields=None):
-    add_resource(context, placement, InlineScriptResource(REGIONS % {"regions": json.dumps(regions_data)}))
-    add_resource(context, placement, InlineScriptResource(REGION_CHANGER_JS))
+    add_regions_script(context, placement)
     for function_name, field in fields or []:
         add_resource(
             context,
@@ -126,8 +164,8 @@ def add_front_resources(context, content):
             ]
         )
     elif view_name == "OrderEditView":  # For admin order editor only regions is enough
-        add_resource(context, "body_end", InlineScriptResource(REGIONS % {"regions": json.dumps(regions_data)}))
+        add_regions_script(context)
     elif view_name in ["AddressBookEditView"]:
         add_resources(context, fields=[("initializeRegion", "#id_address")])
     elif view_name in ["WizardView"]:
-        add_resource(context, "body_end", InlineScriptResource(REGIONS % {"regions": json.dumps(regions_data)}))
+        add_regions_script(context)
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+from django.conf.urls import url
+
+from . import views
+
+urlpatterns = [
+    url(r'^regions/(?P<hash>[0-9a-f]+)\.js$', views.regions_script, name='regions'),
+]
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+from django.core.urlresolvers import reverse
+from django.http import HttpResponse, HttpResponseRedirect
+from django.utils.cache import patch_cache_control
+
+from shuup.core.utils.maintenance import maintenance_mode_exempt
+
+from .resources import get_regions_script
+
+#: Max age of the content-hashed region script responses (one year)
+REGIONS_SCRIPT_MAX_AGE = 365 * 24 * 60 * 60
+
+
+@maintenance_mode_exempt
+def regions_script(request, hash):
+    """
+    Serve the region data script.
+
+    Requests for outdated hashes are redirected to the current script.
+    The script is served in maintenance mode too, since it is cached
+    publicly and needed by the pages that are still available (e.g.
+    the login and password recovery forms).
+    """
+    (script, script_hash) = get_regions_script()
+    if hash != script_hash:
+        return HttpResponseRedirect(reverse("shuup:regions", kwargs={"hash": script_hash}))
+    response = HttpResponse(script, content_type="application/javascript; charset=utf-8")
+    patch_cache_control(response, public=True, max_age=REGIONS_SCRIPT_MAX_AGE)
+    return response
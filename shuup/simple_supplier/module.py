@@ -6,12 +6,14 @@
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
 from django.conf import settings
+from django.db.models import Max
 
 from shuup.core.models import Product, StockBehavior
 from shuup.core.stocks import ProductStockStatus
 from shuup.core.suppliers import BaseSupplierModule
 from shuup.core.suppliers.enums import StockAdjustmentType
-from shuup.simple_supplier.utils import get_current_stock_value
+from shuup.core.utils.stock_updates import schedule_stock_update
+from shuup.simple_supplier.utils import get_current_stock_values
 
 from .models import StockAdjustment, StockCount
 
@@ -49,27 +51,57 @@ class SimpleSupplierModule(BaseSupplierModule):
             created_by=created_by,
             type=type
         )
-        self.update_stock(product_id)
+        schedule_stock_update(self.supplier, product_id)
         return adjustment
 
     def update_stock(self, product_id):
+        self.update_stocks([product_id])
+
+    def update_stocks(self, product_ids):
         supplier_id = self.supplier.pk
+        product_ids = set(int(product_id) for product_id in product_ids)
+        if not product_ids:
+            return
         # TODO: Consider whether this should be done without a cache table
-        values = get_current_stock_value(supplier_id=supplier_id, product_id=product_id)
-        sv, _ = StockCount.objects.get_or_create(supplier_id=supplier_id, product_id=product_id)
-        sv.logical_count = values["logical_count"]
-        sv.physical_count = values["physical_count"]
-        latest_event = (
-            StockAdjustment.objects
-            .filter(supplier=supplier_id, product=product_id, type=StockAdjustmentType.INVENTORY)
-            .last())
-        if latest_event:
-            sv.stock_value_value = latest_event.purchase_price_value * sv.logical_count
+        values = get_current_stock_values(supplier_id=supplier_id, product_ids=product_ids)
+        stock_counts = self._get_stock_counts(product_ids)
+        latest_purchase_prices = dict(
+            StockAdjustment.objects.filter(pk__in=(
+                StockAdjustment.objects
+                .filter(supplier=supplier_id, product__in=product_ids, type=StockAdjustmentType.INVENTORY)
+                .order_by().values("product_id").annotate(latest_id=Max("id")).values_list("latest_id", flat=True)
+            )).values_list("product_id", "purchase_price_value")
+        )
 
-        if "shuup.notify" in settings.INSTALLED_APPS:
+        alert_product_ids = []
+        for product_id in product_ids:
+            sv = stock_counts[product_id]
+            sv.logical_count = values[product_id]["logical_count"]
+            sv.physical_count = values[product_id]["physical_count"]
+            if product_id in latest_purchase_prices:
+                sv.stock_value_value = latest_purchase_prices[product_id] * sv.logical_count
             if sv.alert_limit and sv.physical_count < sv.alert_limit:
-                product = Product.objects.filter(id=product_id).first()
-                if product and product.stock_behavior == StockBehavior.STOCKED:
-                    from .notify_events import AlertLimitReached
-                    AlertLimitReached(supplier=self.supplier, product=product).run()
-        sv.save(update_fields=("logical_count", "physical_count", "stock_value_value"))
+                alert_product_ids.append(product_id)
+            sv.save(update_fields=("logical_count", "physical_count", "stock_value_value"))
+
+        if alert_product_ids and "shuup.notify" in settings.INSTALLED_APPS:
+            from .notify_events import AlertLimitReached
+            for product in Product.objects.filter(id__in=alert_product_ids, stock_behavior=StockBehavior.STOCKED):
+                AlertLimitReached(supplier=self.supplier, product=product).run()
+
+    def _get_stock_counts(self, product_ids):
+        supplier_id = self.supplier.pk
+        stock_counts = {
+            stock_count.product_id: stock_count
+            for stock_count in StockCount.objects.filter(supplier_id=supplier_id, product_id__in=product_ids)
+        }
+        missing_ids = set(product_ids) - set(stock_counts)
+        if missing_ids:
+            StockCount.objects.bulk_create([
+                StockCount(supplier_id=supplier_id, product_id=product_id) for product_id in missing_ids
+            ])
+            stock_counts.update(
+                (stock_count.product_id, stock_count)
+                for stock_count in StockCount.objects.filter(supplier_id=supplier_id, product_id__in=missing_ids)
+            )
+        return stock_counts
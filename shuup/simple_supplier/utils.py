@@ -39,38 +39,62 @@ def get_current_stock_value(supplier_id, product_id):
     :return: logical and physical count for product
     :rtype: dict
     """
+    return get_current_stock_values(supplier_id, [product_id])[int(product_id)]
+
+
+def _get_totals_by_product(queryset, field="quantity"):
+    return dict(
+        queryset.order_by().values("product_id").annotate(total=Sum(field)).values_list("product_id", "total")
+    )
+
+
+def get_current_stock_values(supplier_id, product_ids):
+    """
+    Count stock values for the given products of a supplier.
+
+    See `get_current_stock_value` for the counts.  The values of all
+    of the products are counted with a fixed number of grouped queries.
+
+    :param supplier_id: supplier_id to count stock values for
+    :param product_ids: product ids to count stock values for
+    :type product_ids: Iterable[int]
+    :return: logical and physical counts by product id
+    :rtype: dict[int, dict]
+    """
     # TODO: Consider whether this should be done with an SQL view
-    events = (
-        StockAdjustment.objects
-        .filter(supplier_id=supplier_id, product_id=product_id)
-        .exclude(type=StockAdjustmentType.RESTOCK_LOGICAL)
-        .aggregate(total=Sum("delta"))["total"] or 0)
-    products_bought = (
+    product_ids = [int(product_id) for product_id in product_ids]
+    adjustments = StockAdjustment.objects.filter(supplier_id=supplier_id, product_id__in=product_ids)
+    events = _get_totals_by_product(adjustments.exclude(type=StockAdjustmentType.RESTOCK_LOGICAL), "delta")
+    products_bought = _get_totals_by_product(
         OrderLine.objects
-        .filter(supplier_id=supplier_id, product_id=product_id)
+        .filter(supplier_id=supplier_id, product_id__in=product_ids)
         .exclude(
             Q(order__status__role=OrderStatusRole.CANCELED) |
-            Q(type=OrderLineType.REFUND))
-        .aggregate(total=Sum("quantity"))["total"] or 0)
-    products_refunded_before_shipment = (
-        StockAdjustment.objects
-        .filter(supplier_id=supplier_id, product_id=product_id, type=StockAdjustmentType.RESTOCK_LOGICAL)
-        .aggregate(total=Sum("delta"))["total"] or 0)
-    products_sent = (
+            Q(type=OrderLineType.REFUND)))
+    products_refunded_before_shipment = _get_totals_by_product(
+        adjustments.filter(type=StockAdjustmentType.RESTOCK_LOGICAL), "delta")
+    products_sent = _get_totals_by_product(
         ShipmentProduct.objects
-        .filter(shipment__supplier=supplier_id, shipment__type=ShipmentType.OUT, product_id=product_id)
-        .exclude(shipment__status=ShipmentStatus.DELETED)
-        .aggregate(total=Sum("quantity"))["total"] or 0)
-    pending_incoming_shipments = (
+        .filter(shipment__supplier=supplier_id, shipment__type=ShipmentType.OUT, product_id__in=product_ids)
+        .exclude(shipment__status=ShipmentStatus.DELETED))
+    pending_incoming_shipments = _get_totals_by_product(
         ShipmentProduct.objects
-        .filter(shipment__supplier=supplier_id, shipment__type=ShipmentType.IN, product_id=product_id)
-        .exclude(shipment__status__in=[ShipmentStatus.DELETED, ShipmentStatus.RECEIVED])
-        .aggregate(total=Sum("quantity"))["total"] or 0)
-
-    return {
-        "logical_count": events - products_bought + products_refunded_before_shipment + pending_incoming_shipments,
-        "physical_count": events - products_sent
-    }
+        .filter(shipment__supplier=supplier_id, shipment__type=ShipmentType.IN, product_id__in=product_ids)
+        .exclude(shipment__status__in=[ShipmentStatus.DELETED, ShipmentStatus.RECEIVED]))
+
+    values = {}
+    for product_id in product_ids:
+        product_events = (events.get(product_id) or 0)
+        values[product_id] = {
+            "logical_count": (
+                product_events -
+                (products_bought.get(product_id) or 0) +
+                (products_refunded_before_shipment.get(product_id) or 0) +
+                (pending_incoming_shipments.get(product_id) or 0)
+            ),
+            "physical_count": product_events - (products_sent.get(product_id) or 0)
+        }
+    return values
 
 
 def get_stock_information_div_id(supplier, product):
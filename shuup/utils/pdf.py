@@ -6,6 +6,7 @@
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
 import os
+import re
 
 from django.conf import settings
 from django.http import HttpResponse
@@ -20,6 +21,11 @@ try:
 except ImportError:
     weasyprint = None
 
+_LOGO_URL_RE = re.compile(r"""["'(](logo:[^"')]+)""")
+
+#: Parsed stylesheets by their static path
+_stylesheets = {}
+
 
 def _fetch_static_resource_str(resource_file):
     resource_path = os.path.realpath(os.path.join(settings.STATIC_ROOT, resource_file))
@@ -45,18 +51,74 @@ def _custom_url_fetcher(url):
     raise ValueError("Possible file system traversal shenanigan detected with %(path)s" % {"path": url})
 
 
-def render_html_to_pdf(html, stylesheet_paths=[]):
-    return wrap_pdf_in_response(html_to_pdf(html, stylesheet_paths))
+def _get_url_fetcher(resources):
+    if not resources:
+        return _custom_url_fetcher
+
+    def fetch(url):
+        if url in resources:
+            return {"string": resources[url], "mime_type": "image/jpg"}
+        return _custom_url_fetcher(url)
+    return fetch
+
+
+def _get_stylesheet(stylesheet_path):
+    stylesheet = _stylesheets.get(stylesheet_path)
+    if stylesheet is None:
+        stylesheet = weasyprint.CSS(string=_fetch_static_resource_str(stylesheet_path))
+        if not settings.DEBUG:  # Allow editing the stylesheets while developing
+            _stylesheets[stylesheet_path] = stylesheet
+    return stylesheet
+
+
+def load_stylesheets(stylesheet_paths):
+    """
+    Get the parsed stylesheets for the given static paths.
+
+    Parsed stylesheets are cached for the lifetime of the process
+    (unless `DEBUG` is on).
+
+    :type stylesheet_paths: Iterable[str]
+    :rtype: list[weasyprint.CSS]
+    """
+    ensure_pdf_rendering_available()
+    return [_get_stylesheet(stylesheet_path) for stylesheet_path in stylesheet_paths]
 
 
-def html_to_pdf(html, stylesheet_paths=[]):
+def fetch_resources(html, resources=None):
+    """
+    Fetch the custom (e.g. shop logo) resources referenced by the HTML.
+
+    The returned mapping can be passed to `html_to_pdf` so the PDF can be
+    rendered without touching the database or file storages, e.g. in
+    another process.  Already fetched resources are not fetched again.
+
+    :type html: str
+    :param resources: Already fetched resources by URL
+    :type resources: dict[str, bytes]|None
+    :return: Resource contents by URL
+    :rtype: dict[str, bytes]
+    """
+    resources = ({} if resources is None else resources)
+    for url in set(_LOGO_URL_RE.findall(html)):
+        if url not in resources:
+            resources[url] = _custom_url_fetcher(url)["file_obj"].read()
+    return resources
+
+
+def ensure_pdf_rendering_available():
     if not weasyprint:
         raise Problem(_("Could not create PDF since Weasyprint is not available. Please contact support."))
-    stylesheets = []
-    for stylesheet_path in stylesheet_paths:
-        stylesheets.append(weasyprint.CSS(string=_fetch_static_resource_str(stylesheet_path)))
+
+
+def render_html_to_pdf(html, stylesheet_paths=[]):
+    return wrap_pdf_in_response(html_to_pdf(html, stylesheet_paths))
+
+
+def html_to_pdf(html, stylesheet_paths=[], resources=None):
+    stylesheets = load_stylesheets(stylesheet_paths)
     return weasyprint.HTML(
-        string=html, url_fetcher=_custom_url_fetcher
+        string=html, url_fetcher=_get_url_fetcher(resources)
     ).write_pdf(
         stylesheets=stylesheets
     )
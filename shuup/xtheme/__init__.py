@@ -49,6 +49,18 @@ class XThemeAppConfig(AppConfig):
         ]
     }
 
+    def ready(self):
+        from django.apps import apps
+        from filer.models import File
+        from shuup.core.models import Category, Product, ShopProduct
+        from shuup.xtheme.plugins._base import connect_plugin_cache_tag
+        connect_plugin_cache_tag("products", Product)
+        connect_plugin_cache_tag("products", ShopProduct)
+        connect_plugin_cache_tag("categories", Category)
+        for model in apps.get_models():
+            if issubclass(model, File):  # Filer images are saved as their (polymorphic) subclasses
+                connect_plugin_cache_tag("images", model)
+
 
 default_app_config = "shuup.xtheme.XThemeAppConfig"
 
@@ -10,7 +10,10 @@ from __future__ import unicode_literals
 import sys
 
 import six
+from django.conf import settings
+from jinja2.bccache import FileSystemBytecodeCache
 from jinja2.environment import Environment, Template
+from jinja2.exceptions import TemplateNotFound
 from jinja2.utils import concat, internalcode
 
 from shuup.apps.provides import get_provide_objects
@@ -51,6 +54,12 @@ class XthemeTemplate(Template):
         return content
 
 
+def _get_bytecode_cache():
+    if not settings.SHUUP_ENABLE_TEMPLATE_BYTECODE_CACHE:
+        return None
+    return FileSystemBytecodeCache(settings.SHUUP_TEMPLATE_BYTECODE_CACHE_DIR, "__shuup_xtheme_%s.cache")
+
+
 class XthemeEnvironment(Environment):
     """
     Overrides the usual template class and allows dynamic switching of Xthemes.
@@ -66,6 +75,13 @@ class XthemeEnvironment(Environment):
 
     template_class = XthemeTemplate
 
+    def __init__(self, *args, **kwargs):
+        if kwargs.get("bytecode_cache") is None:
+            kwargs["bytecode_cache"] = _get_bytecode_cache()
+        super(XthemeEnvironment, self).__init__(*args, **kwargs)
+        #: Names of the templates selected from lists of template names by (names, parent)
+        self._selected_template_names = {}
+
     def get_template(self, name, parent=None, globals=None):
         """
         Load a template from the loader.  If a loader is configured this
@@ -105,7 +121,22 @@ class XthemeEnvironment(Environment):
             return super(XthemeEnvironment, self).get_template(template_name_or_list, parent, globals)
         elif isinstance(template_name_or_list, Template):
             return template_name_or_list
-        return super(XthemeEnvironment, self).select_template(template_name_or_list, parent, globals)
+        if self.auto_reload:  # Templates may appear at any time, so look them all up
+            return super(XthemeEnvironment, self).select_template(template_name_or_list, parent, globals)
+
+        # Memoize the selected name to avoid probing the loaders for the missing (themed) templates every time.
+        # The selected template itself is still looked up from the loader (Jinja uses its source path
+        # as the template cache key), but that is a single lookup instead of one per theme directory.
+        key = (tuple(template_name_or_list), parent)
+        selected_name = self._selected_template_names.get(key)
+        if selected_name is not None:
+            try:
+                return super(XthemeEnvironment, self).get_template(selected_name, None, globals)
+            except TemplateNotFound:
+                self._selected_template_names.pop(key, None)
+        template = super(XthemeEnvironment, self).select_template(template_name_or_list, parent, globals)
+        self._selected_template_names[key] = template.name
+        return template
 
     def _get_themed_template_names(self, name):
         """
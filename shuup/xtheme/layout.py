@@ -10,6 +10,7 @@ from __future__ import unicode_literals
 from django.utils.encoding import force_text
 from django.utils.safestring import mark_safe
 
+from shuup.core import cache
 from shuup.xtheme.plugins._base import Plugin
 
 
@@ -58,6 +59,25 @@ class LayoutCell(object):
         plugin_class = self.plugin_class
         return getattr(plugin_class, "name", "None")
 
+    @property
+    def cacheable(self):
+        """
+        Whether the rendered contents of this cell can be cached along with the whole placeholder.
+
+        Empty cells are always cacheable. Plugins with cache tags or a custom
+        cache timeout are only cached on the cell level.
+
+        :rtype: bool
+        """
+        if not self.plugin_identifier:
+            return True
+        plugin_class = self.plugin_class
+        return bool(
+            getattr(plugin_class, "cacheable", False) and
+            not plugin_class.cache_tags and
+            plugin_class.cache_timeout is None
+        )
+
     def instantiate_plugin(self):
         """
         Instantiate the plugin with the current config.
@@ -84,10 +104,16 @@ class LayoutCell(object):
         plugin_inst = self.instantiate_plugin()
         if plugin_inst is None:
             return mark_safe("<!-- %s? -->" % self.plugin_identifier)
-        if plugin_inst.is_context_valid(context=context):
-            return plugin_inst.render(context=context)
-        else:
+        if not plugin_inst.is_context_valid(context=context):
             return ""
+        cache_key = plugin_inst.get_cache_key(context=context)
+        if not cache_key:
+            return plugin_inst.render(context=context)
+        content = cache.get(cache_key)
+        if content is None:
+            content = plugin_inst.render(context=context)
+            cache.set(cache_key, content, timeout=plugin_inst.cache_timeout)
+        return content
 
     @classmethod
     def unserialize(cls, theme, data):
@@ -10,8 +10,23 @@ from django.utils.translation import ugettext_lazy as _
 from enumfields import Enum
 from enumfields.fields import EnumIntegerField
 
+from shuup.core import cache
 from shuup.core.fields import TaggedJSONField
 
+VIEW_CONFIG_CACHE_NAMESPACE = "xtheme_view_config"
+
+
+def get_view_config_cache_key(*parts):
+    """
+    Get a cache key within the versioned view configuration namespace.
+
+    The namespace is bumped whenever a `SavedViewConfig` is saved or
+    deleted, so everything cached under it is invalidated on publish.
+
+    :rtype: str
+    """
+    return ":".join([VIEW_CONFIG_CACHE_NAMESPACE] + [str(part) for part in parts])
+
 
 class SavedViewConfigQuerySet(models.QuerySet):  # doccov: ignore
     def appropriate(self, theme, view_name, draft):
@@ -37,6 +52,16 @@ class SavedViewConfigQuerySet(models.QuerySet):  # doccov: ignore
         :return: SavedViewConfig (possibly not saved)
         :rtype: SavedViewConfig
         """
+        if not draft:  # The public configuration only changes on publish, so it's safe to cache
+            cache_key = get_view_config_cache_key("appropriate", theme.identifier, view_name)
+            model = cache.get(cache_key)
+            if model is None:
+                model = self._get_appropriate(theme, view_name, draft)
+                cache.set(cache_key, model)
+            return model
+        return self._get_appropriate(theme, view_name, draft)
+
+    def _get_appropriate(self, theme, view_name, draft):
         svc_kwargs = dict(
             theme_identifier=theme.identifier,
             view_name=view_name
@@ -96,6 +121,14 @@ class SavedViewConfig(models.Model):
     def draft(self):
         return self.status == SavedViewConfigStatus.CURRENT_DRAFT
 
+    def save(self, *args, **kwargs):
+        super(SavedViewConfig, self).save(*args, **kwargs)
+        cache.bump_version(VIEW_CONFIG_CACHE_NAMESPACE)
+
+    def delete(self, *args, **kwargs):
+        super(SavedViewConfig, self).delete(*args, **kwargs)
+        cache.bump_version(VIEW_CONFIG_CACHE_NAMESPACE)
+
     def publish(self):
         if not self.draft:
             raise ValueError("Unable to publish a non-draft view configuration")
@@ -7,13 +7,20 @@
 # LICENSE file in the root directory of this source tree.
 from __future__ import unicode_literals
 
+import hashlib
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.template.loader import get_template
+from django.utils.encoding import force_bytes
 from django.utils.translation import ugettext_lazy as _
 from django.utils.translation import get_language
 
 from shuup.apps.provides import (
     get_identifier_to_object_map, get_provide_objects
 )
+from shuup.core import cache
+from shuup.core.fields.tagged_json import TaggedJSONEncoder
+from shuup.core.signals import objects_bulk_updated
 from shuup.utils.importing import load
 from shuup.utils.text import space_case
 from shuup.xtheme.plugins.consts import FALLBACK_LANGUAGE_CODE
@@ -21,6 +28,51 @@ from shuup.xtheme.plugins.forms import GenericPluginForm
 
 SENTINEL = object()
 
+PLUGIN_CACHE_NAMESPACE = "xtheme_plugin"
+
+
+def _get_cache_tag_namespace(tag):
+    return "xtheme_plugin_tag_%s" % tag
+
+
+def bump_plugin_cache_tag(tag):
+    """
+    Invalidate the cached contents of all plugins having the given cache tag.
+
+    :param tag: Cache tag
+    :type tag: str
+    """
+    cache.bump_version(_get_cache_tag_namespace(tag))
+
+
+def connect_plugin_cache_tag(tag, model):
+    """
+    Invalidate the cached contents of plugins having the given cache tag whenever a model instance
+    (or one of its translations) is saved or deleted, model instances are bulk updated or the
+    many-to-many relations of the model are changed.
+
+    :param tag: Cache tag
+    :type tag: str
+    :param model: Model class
+    :type model: class[django.db.models.Model]
+    """
+    def bump_tag(sender, **kwargs):
+        bump_plugin_cache_tag(tag)
+
+    def get_dispatch_uid(sender):
+        return "xtheme_plugin_cache_tag:%s:%s" % (tag, sender._meta.label_lower)
+
+    senders = [model]
+    if hasattr(model, "_parler_meta"):
+        senders.extend(model._parler_meta.get_all_models())
+    for sender in senders:
+        post_save.connect(bump_tag, sender=sender, weak=False, dispatch_uid=get_dispatch_uid(sender))
+        post_delete.connect(bump_tag, sender=sender, weak=False, dispatch_uid=get_dispatch_uid(sender))
+    objects_bulk_updated.connect(bump_tag, sender=model, weak=False, dispatch_uid=get_dispatch_uid(model))
+    for field in model._meta.many_to_many:
+        through = field.remote_field.through
+        m2m_changed.connect(bump_tag, sender=through, weak=False, dispatch_uid=get_dispatch_uid(through))
+
 
 class Plugin(object):
     """
@@ -35,6 +87,24 @@ class Plugin(object):
     name = _("Plugin")  # User-visible name
     editor_form_class = GenericPluginForm
 
+    #: Whether the rendered output only depends on the plugin configuration
+    #: and the request attributes in `cache_vary_on`.
+    #: Plugins adding resources to the page while rendering must not be cacheable.
+    cacheable = False
+
+    #: Configuration keys the rendered output depends on, or None for the whole configuration
+    cache_key_fields = None
+
+    #: Request attributes the rendered output varies on.
+    #: Any of "language", "shop" and "customer_groups".
+    cache_vary_on = ("language", "shop", "customer_groups")
+
+    #: Cache timeout in seconds, or None for the default cache duration
+    cache_timeout = None
+
+    #: Tags invalidating the cached output when bumped with `bump_plugin_cache_tag`
+    cache_tags = ()
+
     def __init__(self, config):
         """
         Instantiate a Plugin with the given `config` dictionary.
@@ -88,6 +158,44 @@ class Plugin(object):
         """
         return ""  # pragma: no cover
 
+    def get_cache_key(self, context):
+        """
+        Get the cache key for the rendered output of the plugin in the given context.
+
+        :param context: Rendering context
+        :type context: jinja2.runtime.Context
+        :return: Cache key or None if the output must not be cached
+        :rtype: str|None
+        """
+        if not self.cacheable:
+            return None
+
+        if self.cache_key_fields is None:
+            config = self.config
+        else:
+            config = dict((key, self.config.get(key)) for key in self.cache_key_fields)
+        parts = [
+            self.identifier,
+            hashlib.md5(force_bytes(TaggedJSONEncoder(sort_keys=True).encode(config))).hexdigest()
+        ]
+
+        request = context.get("request")
+        for vary_on in self.cache_vary_on:
+            if vary_on == "language":
+                parts.append(get_language())
+            elif vary_on == "shop":
+                shop = getattr(request, "shop", None)
+                parts.append(shop.pk if shop else "")
+            elif vary_on == "customer_groups":
+                customer = getattr(request, "customer", None)
+                group_ids = (sorted(customer.get_group_ids()) if customer is not None else [])
+                parts.append("-".join(str(group_id) for group_id in group_ids))
+
+        for tag in self.cache_tags:
+            parts.append(cache.get_version(_get_cache_tag_namespace(tag)) or "")
+
+        return ":".join([PLUGIN_CACHE_NAMESPACE] + [str(part) for part in parts])
+
     def get_editor_form_class(self):
         """
         Return the form class for editing this plugin.
@@ -60,6 +60,9 @@ class CategoryLinksPlugin(TemplatedPlugin):
         )),
         "categories",
     ]
+    cacheable = True
+    cache_key_fields = ("title", "show_all_categories", "categories")
+    cache_tags = ("categories",)
 
     def get_context_data(self, context):
         """
@@ -46,6 +46,8 @@ class ImagePlugin(TemplatedPlugin):
     identifier = "images"
     name = _("Image")
     template_name = "shuup/xtheme/plugins/image.jinja"
+    cacheable = True
+    cache_tags = ("images",)
     fields = [
         ("title", TranslatableField(label=_("Title"), required=False)),
         ("image_id", ImageIDField(label=_("Image"), required=False)),
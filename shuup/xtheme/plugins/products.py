@@ -35,6 +35,15 @@ class ProductHighlightPlugin(TemplatedPlugin):
                                               initial=True,
                                               required=False))
     ]
+    cacheable = True
+    cache_key_fields = ("title", "type", "count", "orderable_only")
+    cache_timeout = 60 * 5
+    cache_tags = ("products",)
+
+    def get_cache_key(self, context):
+        if self.config.get("type") == "random":  # Random products are supposed to change on every render
+            return None
+        return super(ProductHighlightPlugin, self).get_cache_key(context)
 
     def get_context_data(self, context):
         type = self.config.get("type", "newest")
@@ -72,6 +72,7 @@ class SocialMediaLinksPlugin(TemplatedPlugin):
     identifier = "social_media_links"
     name = _("Social Media Links")
     template_name = "shuup/xtheme/plugins/social_media_links.jinja"
+    cacheable = True
     editor_form_class = SocialMediaLinksPluginForm
     fields = [
         ("topic", TranslatableField(label=_("Topic"), required=False, initial="")),
@@ -19,6 +19,7 @@ class TextPlugin(Plugin):
     """
     identifier = "text"
     name = "Text"
+    cacheable = True
     fields = [
         ("text", TranslatableField(
             label=_("text"),
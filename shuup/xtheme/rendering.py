@@ -8,12 +8,15 @@
 from __future__ import unicode_literals
 
 from django.utils.encoding import force_text
+from django.utils.translation import get_language
 from django.utils.translation import ugettext_lazy as _
 from markupsafe import Markup
 
+from shuup.core import cache
 from shuup.core.fields.tagged_json import TaggedJSONEncoder
 from shuup.xtheme._theme import get_current_theme
 from shuup.xtheme.editing import is_edit_mode
+from shuup.xtheme.models import get_view_config_cache_key
 from shuup.xtheme.utils import get_html_attrs
 from shuup.xtheme.view_config import ViewConfig
 
@@ -115,16 +118,52 @@ class PlaceholderRenderer(object):
         :rtype: markupsafe.Markup
         """
         wrapper_start = "<div%s>" % get_html_attrs(self._get_wrapper_attrs())
-        buffer = []
-        write = buffer.append
-        self._render_layout(write)
-        content = "".join(buffer)
+        cache_key = self._get_cache_key()
+        content = (cache.get(cache_key) if cache_key else None)
+        if content is None:
+            buffer = []
+            write = buffer.append
+            self._render_layout(write)
+            content = "".join(buffer)
+            if cache_key:
+                cache.set(cache_key, content)
         return Markup("%(wrapper_start)s%(content)s%(wrapper_end)s" % {
             "wrapper_start": wrapper_start,
             "content": content,
             "wrapper_end": "</div>",
         })
 
+    def _get_cache_key(self):
+        """
+        Get the cache key for the rendered contents of this placeholder.
+
+        Only published layouts made up entirely of cacheable plugins are cached.
+        The contents are cached per language, shop and customer groups
+        and invalidated whenever a view configuration is saved.
+
+        :return: Cache key or None if the contents must not be cached
+        :rtype: str|None
+        """
+        if self.edit or not self.view_config.is_published:
+            return None
+        if not self.view_config.saved_view_config.get_layout_data(self.placeholder_name):
+            return None
+        if not all(cell.cacheable for row in self.layout for cell in row):
+            return None
+
+        request = self.context.get("request")
+        shop = getattr(request, "shop", None)
+        customer = getattr(request, "customer", None)
+        group_ids = (sorted(customer.get_group_ids()) if customer is not None else [])
+        return get_view_config_cache_key(
+            "placeholder",
+            self.view_config.saved_view_config.pk,
+            self.placeholder_name,
+            get_language(),
+            (shop.pk if shop else ""),
+            "-".join(str(group_id) for group_id in group_ids)
+        )
+
     def _get_wrapper_attrs(self):
         attrs = {
             "class": ["xt-ph", "xt-ph-edit" if self.edit else None, "xt-global-ph" if self.global_type else None],
@@ -142,11 +142,22 @@ class ResourceContainer(object):
         return "<!-- (unknown resource type: %s) -->" % escape(resource)
 
 
+#: A single pattern matching all of the locations (see `LOCATION_INFO`)
+LOCATIONS_RE = re.compile(
+    "|".join("(?P<%s>%s)" % (location, regex.pattern) for (location, (regex, placement)) in LOCATION_INFO.items()),
+    re.I
+)
+
+
 @contextfunction
 def inject_resources(context, content, clean=True):
     """
     Inject all the resources in the context's ResourceContainer into appropriate places in the content given.
 
+    The insertion points of all of the locations are found with a single
+    scan over the content (stopping as soon as every location having
+    resources is found) and the output is assembled with a single join.
+
     :param context: Rendering context
     :type context: jinja2.runtime.Context
     :param content: HTML content
@@ -160,25 +171,52 @@ def inject_resources(context, content, clean=True):
     if not rc:  # No resource container? Well, whatever.
         return content
 
-    for location_name, (regex, placement) in LOCATION_INFO.items():
-        match = regex.search(content)
-        if not match:
-            continue
-        injection = rc.render_resources(location_name, clean=clean)
-        if not injection:
-            continue
+    pending = set(location for location in LOCATION_INFO if rc.resources.get(location))
+    if not pending:
+        return content
 
-        start = match.start()
-        end = match.end()
+    insertions = []
+    for match in LOCATIONS_RE.finditer(content):
+        location = match.lastgroup
+        if location not in pending:
+            continue
+        pending.discard(location)
+        injection = rc.render_resources(location, clean=clean)
+        if injection:
+            placement = LOCATION_INFO[location][1]
+            if placement == "pre":
+                insertions.append((match.start(), injection))
+            elif placement == "post":
+                insertions.append((match.end(), injection))
+            else:  # pragma: no cover
+                raise ValueError("Unknown placement %s" % placement)
+        if not pending:
+            break
+
+    return _insert(content, insertions)
+
+
+def _insert(content, insertions):
+    """
+    Insert strings into the content at the given indices.
 
-        if placement == "pre":
-            content = content[:start] + injection + content[start:]
-        elif placement == "post":
-            content = content[:end] + injection + content[end:]
-        else:  # pragma: no cover
-            raise ValueError("Unknown placement %s" % placement)
+    :param content: HTML content
+    :type content: str
+    :param insertions: (index, string) pairs in any order
+    :type insertions: list[tuple[int, str]]
+    :rtype: str
+    """
+    if not insertions:
+        return content
 
-    return content
+    parts = []
+    position = 0
+    for (index, injection) in sorted(insertions, key=lambda insertion: insertion[0]):
+        parts.append(content[position:index])
+        parts.append(injection)
+        position = index
+    parts.append(content[position:])
+    return "".join(parts)
 
 
 def get_resource_container(context):
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+"""
+Settings of Shuup Xtheme.
+
+See :ref:`apps-settings` (in :obj:`shuup.apps`) for general information
+about the Shuup settings system.  Especially, when inventing settings of
+your own, the :ref:`apps-naming-settings` section is an important read.
+"""
+from __future__ import unicode_literals
+
+#: Whether the ``XthemeEnvironment`` caches the compiled bytecode of
+#: templates on local disk, so new worker processes don't need to
+#: compile the templates again.
+#:
+#: The cached bytecode is invalidated when the template source changes.
+#: Disabled by default; when enabling it, also set
+#: ``SHUUP_TEMPLATE_BYTECODE_CACHE_DIR`` to a directory only writable by
+#: the user running Shuup.
+SHUUP_ENABLE_TEMPLATE_BYTECODE_CACHE = False
+
+#: Directory for the template bytecode cache, or None for a directory
+#: in the system's temporary directory (specific to the current user,
+#: but shared by every project run by that user).
+SHUUP_TEMPLATE_BYTECODE_CACHE_DIR = None
@@ -7,9 +7,30 @@
 # LICENSE file in the root directory of this source tree.
 from django.utils.encoding import force_text
 
+from shuup.core import cache
 from shuup.xtheme import XTHEME_GLOBAL_VIEW_NAME
 from shuup.xtheme.layout import Layout
-from shuup.xtheme.models import SavedViewConfig
+from shuup.xtheme.models import SavedViewConfig, VIEW_CONFIG_CACHE_NAMESPACE
+
+#: Process-local cache of parsed published layouts.
+#: Keyed by (view config namespace version, saved view config id, placeholder name).
+_published_layouts = {}
+_PUBLISHED_LAYOUTS_MAX_SIZE = 1000
+
+
+def clear_published_layout_cache():
+    _published_layouts.clear()
+
+
+def _get_published_layout(theme, svc, placeholder_name, placeholder_data):
+    key = (cache.get_version(VIEW_CONFIG_CACHE_NAMESPACE), theme.identifier, svc.pk, placeholder_name)
+    layout = _published_layouts.get(key)
+    if layout is None:
+        if len(_published_layouts) >= _PUBLISHED_LAYOUTS_MAX_SIZE:
+            _published_layouts.clear()
+        layout = Layout.unserialize(theme, placeholder_data, placeholder_name=placeholder_name)
+        _published_layouts[key] = layout
+    return layout
 
 
 class ViewConfig(object):
@@ -60,6 +81,16 @@ class ViewConfig(object):
             self.draft = self._saved_view_config.draft
         return self._saved_view_config
 
+    @property
+    def is_published(self):
+        """
+        Whether the layouts of this view configuration come from a saved public configuration.
+
+        :rtype: bool
+        """
+        svc = self.saved_view_config
+        return bool(svc and svc.pk and not svc.draft)
+
     def get_placeholder_layout(self, placeholder_name, default_layout=None):
         """
         Get a Layout object for the given placeholder.
@@ -76,6 +107,9 @@ class ViewConfig(object):
         if svc:
             placeholder_data = svc.get_layout_data(placeholder_name)
             if placeholder_data:
+                if self.is_published:
+                    # Published layouts never change, so the parsed layout can be shared between requests
+                    return _get_published_layout(self.theme, svc, placeholder_name, placeholder_data)
                 return layout.unserialize(self.theme, placeholder_data, placeholder_name=placeholder_name)
         if default_layout:
             if isinstance(default_layout, Layout):
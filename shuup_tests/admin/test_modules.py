@@ -160,3 +160,54 @@ def test_url_auth(rf):
         assert not did_disallow(urls["test-auth"].callback, request)
         assert not did_disallow(urls["test-perm"].callback, request)
         assert not did_disallow(urls["test-unauth"].callback, request)
+
+
+class CachedDashboardTestModule(ATestModule):
+    dashboard_cache_timeout = 60
+    notifications_cache_timeout = 60
+    calls = 0
+
+    def get_dashboard_blocks(self, request):
+        CachedDashboardTestModule.calls += 1
+        return super(CachedDashboardTestModule, self).get_dashboard_blocks(request)
+
+
+class AsyncDashboardTestModule(ATestModule):
+    dashboard_cache_timeout = 60
+    dashboard_async = True
+
+
+def test_cached_dashboard_blocks(rf):
+    from shuup.core import cache
+    from shuup.admin.dashboard.utils import get_dashboard_blocks, get_notifications
+    cache.clear()
+    request = rf.get("/")
+    module = CachedDashboardTestModule()
+    first_blocks = get_dashboard_blocks(request, module)
+    assert [b.id for b in get_dashboard_blocks(request, module)] == [b.id for b in first_blocks]
+    assert CachedDashboardTestModule.calls == 1
+    assert [n.text for n in get_notifications(request, module)] == ["OK"]
+
+
+@pytest.mark.django_db
+def test_async_dashboard_blocks(rf, admin_user):
+    from shuup.core import cache
+    from shuup.admin.views.dashboard import DashboardBlocksView
+    from shuup.admin.dashboard.utils import get_module_key
+    cache.clear()
+    get_default_shop()
+    with replace_modules([AsyncDashboardTestModule]):
+        request = apply_request_middleware(rf.get("/"), user=admin_user)
+        blocks = DashboardView(request=request).get_context_data()["blocks"]
+        assert [b.type for b in blocks] == ["async"]
+
+        module_key = get_module_key(AsyncDashboardTestModule)
+        request = apply_request_middleware(rf.get("/", {"module": module_key}), user=admin_user)
+        response = DashboardBlocksView.as_view()(request)
+        response.render()
+        assert "Hello" in response.content.decode("utf-8")
+
+        # Once cached, the blocks are rendered with the dashboard itself
+        request = apply_request_middleware(rf.get("/"), user=admin_user)
+        blocks = DashboardView(request=request).get_context_data()["blocks"]
+        assert "async" not in [b.type for b in blocks]
@@ -198,3 +198,19 @@ def test_mass_edit_orders5(rf, admin_user):
         assert response['Content-Disposition'] == 'attachment; filename=order_delivery_pdf.zip'
     else:
         assert response["content-type"] == "application/json"
+
+
+@pytest.mark.django_db
+def test_mass_cancel_skips_paid_orders(rf, admin_user):
+    from shuup.admin.modules.orders.utils import cancel_orders
+    from shuup.core.models import PaymentStatus
+    shop = get_default_shop()
+    supplier = get_default_supplier()
+    product = create_product(printable_gibberish(), shop=shop, supplier=supplier, default_price="50")
+    open_order = create_random_order(customer=create_random_person(), products=[product], completion_probability=0)
+    paid_order = create_random_order(customer=create_random_person(), products=[product], completion_probability=0)
+    Order.objects.filter(pk=paid_order.pk).update(payment_status=PaymentStatus.FULLY_PAID)
+
+    assert cancel_orders(Order.objects.all()) == [open_order.pk]
+    assert Order.objects.get(pk=open_order.pk).status.role == OrderStatusRole.CANCELED
+    assert Order.objects.get(pk=paid_order.pk).status.role != OrderStatusRole.CANCELED
@@ -5,9 +5,11 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
+import datetime
 import json
 
 import pytest
+from django.utils.timezone import now
 from shuup.admin.modules.products.mass_actions import InvisibleMassAction
 from shuup.admin.modules.products.views import ProductListView
 
@@ -74,3 +76,30 @@ def test_mass_edit_products2(rf, admin_user):
     assert response.status_code == 200
     for product in Product.objects.all():
         assert product.get_shop_instance(shop).visibility == ShopProductVisibility.NOT_VISIBLE
+
+
+@pytest.mark.django_db
+def test_mass_edit_products_in_chunks(rf, admin_user, settings):
+    settings.SHUUP_ADMIN_MASS_ACTION_CHUNK_SIZE = 1
+    shop = get_default_shop()
+    supplier = get_default_supplier()
+    product1 = create_product(printable_gibberish(), shop=shop, supplier=supplier, default_price="50")
+    product2 = create_product(printable_gibberish(), shop=shop, supplier=supplier, default_price="501")
+    category = get_default_category()
+
+    modified_on = now() - datetime.timedelta(days=1)
+    Product.objects.filter(pk__in=(product1.pk, product2.pk)).update(modified_on=modified_on)
+
+    data = {"name": "Renamed", "categories": [category.pk], "default_price_value": "10"}
+    request = apply_request_middleware(rf.post("/", data=data), user=admin_user)
+    request.session["mass_action_ids"] = "all"
+    response = ProductMassEditView.as_view()(request=request)
+    assert response.status_code == 302
+
+    for product in (product1, product2):
+        product = Product.objects.get(pk=product.pk)
+        shop_product = product.get_shop_instance(shop)
+        assert product.name == "Renamed"
+        assert list(shop_product.categories.all()) == [category]
+        assert shop_product.default_price_value == 10
+        assert product.modified_on > modified_on
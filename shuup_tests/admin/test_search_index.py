@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+import pytest
+
+from shuup.admin.models import SearchIndexEntry
+from shuup.admin.utils import search_index as search_index_module
+from shuup.admin.utils.search_index import (
+    rebuild_index, search_index, tokenize
+)
+from shuup.testing.factories import create_product, get_default_shop
+
+
+def test_tokenize():
+    assert tokenize("Foo-Bar baz", None, "john.doe@example.com") == {
+        "foo-bar", "foo", "bar", "baz", "john.doe@example.com", "john", "doe", "example", "com"
+    }
+
+
+@pytest.mark.django_db
+def test_product_search_index():
+    shop = get_default_shop()
+    product = create_product("ABC-123", shop=shop)
+    product.name = "Shiny Red Widget"
+    product.save()
+    other = create_product("ABC-999", shop=shop)
+
+    assert search_index("product", "abc") == [other.pk, product.pk]
+    assert search_index("product", "abc-123") == [product.pk]
+    assert search_index("product", "red wid") == [product.pk]
+    assert search_index("product", "red blue") == []
+
+    SearchIndexEntry.objects.all().delete()
+    assert search_index("product", "widget") == []
+    assert rebuild_index("product") == 2
+    assert search_index("product", "widget") == [product.pk]
+
+
+@pytest.mark.django_db
+def test_search_index_updated_only_on_change():
+    product = create_product("ABC-123", shop=get_default_shop())
+    product.name = "Widget"  # The name defaults to the SKU
+    product.save()
+    entry_ids = set(SearchIndexEntry.objects.filter(kind="product").values_list("pk", flat=True))
+    product.save()
+    assert set(SearchIndexEntry.objects.filter(kind="product").values_list("pk", flat=True)) == entry_ids
+
+    product.sku = "XYZ-123"
+    product.save()
+    assert search_index("product", "abc") == []
+    assert search_index("product", "xyz") == [product.pk]
+    assert search_index("product", "123") == [product.pk]
+    assert SearchIndexEntry.objects.filter(pk__in=entry_ids, token="123").exists()
+
+
+@pytest.mark.django_db
+def test_search_index_ordering_and_limit():
+    shop = get_default_shop()
+    products = [create_product("ITEM%d" % x, shop=shop) for x in range(15)]
+    assert search_index("product", "it", limit=3) == [products[14].pk, products[13].pk, products[12].pk]
+    # Exact matches first, then the newest prefix matches
+    assert search_index("product", "item1", limit=3) == [products[1].pk, products[14].pk, products[13].pk]
+
+
+@pytest.mark.django_db
+def test_search_index_built_on_first_use():
+    product = create_product("ABC-123", shop=get_default_shop())
+    SearchIndexEntry.objects.all().delete()
+    search_index_module._checked_kinds.clear()
+    assert search_index("product", "abc") == [product.pk]
+    assert "product" in search_index_module._checked_kinds
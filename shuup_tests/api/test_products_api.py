@@ -817,6 +817,69 @@ def _get_sample_shop_product_data(shop, category, supplier):
     ]
 
 
+def test_product_cursor_pagination_and_sparse_fields(admin_user):
+    get_default_shop()
+    products = [create_product("cursor-product-%d" % index) for index in range(5)]
+    client = _get_client(admin_user)
+
+    response = client.get("/api/shuup/product/?pagination=cursor&limit=2&fields=sku")
+    assert response.status_code == status.HTTP_200_OK
+    data = json.loads(response.content.decode("utf-8"))
+    assert "count" not in data
+    assert [item["id"] for item in data["results"]] == [products[0].pk, products[1].pk]
+    assert set(data["results"][0].keys()) == set(["id", "sku"])
+
+    seen_ids = [item["id"] for item in data["results"]]
+    while data["next"]:
+        response = client.get(data["next"])
+        assert response.status_code == status.HTTP_200_OK
+        data = json.loads(response.content.decode("utf-8"))
+        seen_ids.extend(item["id"] for item in data["results"])
+    assert seen_ids == [product.pk for product in products]
+
+
+def test_product_cursor_ordering(admin_user):
+    get_default_shop()
+    products = [create_product("cursor-ordering-%d" % index) for index in range(3)]
+    client = _get_client(admin_user)
+
+    response = client.get("/api/shuup/product/?pagination=cursor&cursor_ordering=-id&fields=sku")
+    assert response.status_code == status.HTTP_200_OK
+    data = json.loads(response.content.decode("utf-8"))
+    assert [item["id"] for item in data["results"]] == [product.pk for product in reversed(products)]
+
+
+def test_product_sparse_fields_keep_nested_shop_products(admin_user):
+    shop = get_default_shop()
+    product = create_product("sparse-nested", shop=shop)
+    client = _get_client(admin_user)
+
+    response = client.get("/api/shuup/product/%d/?fields=sku,shop_products" % product.pk)
+    assert response.status_code == status.HTTP_200_OK
+    data = json.loads(response.content.decode("utf-8"))
+    assert set(data.keys()) == set(["id", "sku", "shop_products"])
+    shop_product_data = data["shop_products"][0]
+    # nested serializers are never trimmed and see the request context
+    assert shop_product_data["shop"] == shop.pk
+    assert "orderable" in shop_product_data
+    assert "visibility" in shop_product_data
+
+
+def test_product_modified_since(admin_user):
+    get_default_shop()
+    old_product = create_product("old-product")
+    new_product = create_product("new-product")
+    modified_since = dt(2017, 1, 1)
+    Product.objects.filter(pk=old_product.pk).update(modified_on=modified_since - datetime.timedelta(days=1))
+    Product.objects.filter(pk=new_product.pk).update(modified_on=modified_since + datetime.timedelta(days=1))
+    client = _get_client(admin_user)
+
+    response = client.get("/api/shuup/product/?modified_since=%s" % modified_since.strftime("%Y-%m-%dT%H:%M:%S"))
+    assert response.status_code == status.HTTP_200_OK
+    data = json.loads(response.content.decode("utf-8"))
+    assert [item["id"] for item in data] == [new_product.pk]
+
+
 def _check_product_basic_data(product, data, lang="en"):
     precision = Decimal("0.01")
 
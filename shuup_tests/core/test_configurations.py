@@ -5,7 +5,11 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
+import mock
 import pytest
+from django.core.signals import request_finished
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from shuup import configuration
 from shuup.core import cache
@@ -132,3 +136,46 @@ def test_configuration_cache():
     configuration.get(shop, "key1")
     # Now shop configurations and key2 should found from cache
     assert cache.get(configuration._get_cache_key(shop)).get("key2") == "test2"
+
+
+@pytest.mark.django_db
+def test_configuration_snapshot():
+    cache.clear()
+    shop = get_default_shop()
+    configuration.set(shop, "key", {"data": "test"})
+    configuration.get(shop, "key")
+
+    # The snapshot is used without touching the cache or the database
+    with CaptureQueriesContext(connection) as queries:
+        with mock.patch.object(cache, "get", side_effect=AssertionError):
+            assert configuration.get(shop, "key") == {"data": "test"}
+            # Values are not shared with the snapshot
+            configuration.get(shop, "key")["data"] = "changed"
+            assert configuration.get(shop, "key") == {"data": "test"}
+    assert not queries.captured_queries
+
+    # Changes made in other processes are seen on the next request
+    ConfigurationItem.objects.filter(shop=shop, key="key").update(value={"data": "other"})
+    cache.set(configuration._get_cache_key(shop), None)
+    cache.bump_version(configuration._get_shop_namespace(shop.pk))
+    request_finished.send(sender=None)
+    assert configuration.get(shop, "key") == {"data": "other"}
+
+
+@pytest.mark.django_db
+def test_configuration_preload():
+    cache.clear()
+    shop = get_default_shop()
+    configuration.set(None, "key1", "global")
+    configuration.set(shop, "key2", "shop")
+    configuration._snapshots.clear()
+
+    with CaptureQueriesContext(connection) as queries:
+        configuration.preload([shop])
+    assert len(queries.captured_queries) == 1
+
+    with CaptureQueriesContext(connection) as queries:
+        assert configuration.get(shop, "key1") == "global"
+        assert configuration.get(shop, "key2") == "shop"
+        assert configuration.get(None, "key2") is None
+    assert not queries.captured_queries
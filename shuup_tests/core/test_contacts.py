@@ -273,3 +273,24 @@ def test_get_company_contact(regular_user):
     company_contact = create_random_company()
     company_contact.members.add(person_contact)
     assert get_company_contact(regular_user) == company_contact
+
+
+@pytest.mark.django_db
+def test_group_ids_memo_is_invalidated(regular_user):
+    person = get_person_contact(regular_user)
+    other_instance = PersonContact.objects.get(pk=person.pk)
+    group = ContactGroup.objects.create(identifier="memo-group")
+    group_ids = person.get_group_ids()
+    assert group.pk not in group_ids
+    assert other_instance.get_group_ids() == group_ids
+
+    # Changed through the group
+    group.members.add(person)
+    assert group.pk in person.get_group_ids()
+    assert group.pk in other_instance.get_group_ids()
+    group.members.remove(person)
+    assert group.pk not in person.get_group_ids()
+
+    # Changed through another instance of the contact
+    other_instance.groups.add(group)
+    assert group.pk in person.get_group_ids()
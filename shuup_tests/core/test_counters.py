@@ -8,7 +8,9 @@
 import pytest
 from django.core.exceptions import ObjectDoesNotExist
 
-from shuup.core.models import Counter, CounterType
+from shuup.core.models import Counter, CounterType, ShopCounter
+from shuup.core.models._counters import _blocks, get_next_counter_value
+from shuup.testing.factories import get_default_shop
 
 
 @pytest.mark.django_db
@@ -25,3 +27,49 @@ def test_counters():
 
         assert last == initial + 50
         assert Counter.objects.get(id=CounterType.ORDER_REFERENCE).value == initial + 51
+
+
+def _get_values(count, shop=None, gapless=False):
+    return [
+        get_next_counter_value(CounterType.ORDER_REFERENCE, shop=shop, gapless=gapless)
+        for x in range(count)
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_counter_blocks(settings):
+    settings.SHUUP_COUNTER_BLOCK_SIZE = 10
+    _blocks.clear()
+    initial = Counter.allocate(CounterType.ORDER_REFERENCE) + 1
+    values = _get_values(25)
+    assert values == list(range(initial, initial + 25))
+    # Three blocks reserved
+    assert Counter.objects.get(id=CounterType.ORDER_REFERENCE).value == initial + 30
+
+    # Gapless values are reserved from the counter directly
+    assert _get_values(2, gapless=True) == [initial + 30, initial + 31]
+    assert _get_values(5) == list(range(initial + 25, initial + 30))
+    assert _get_values(1) == [initial + 32]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_shop_counters(settings):
+    settings.SHUUP_COUNTER_BLOCK_SIZE = 10
+    _blocks.clear()
+    shop = get_default_shop()
+    initial = Counter.allocate(CounterType.ORDER_REFERENCE, 5) + 5
+
+    # The shop counter starts from the value of the global counter
+    assert _get_values(3, shop=shop) == [initial, initial + 1, initial + 2]
+    assert ShopCounter.objects.get(shop=shop, type=CounterType.ORDER_REFERENCE).value == initial + 10
+    assert Counter.objects.get(id=CounterType.ORDER_REFERENCE).value == initial
+
+    assert _get_values(2, shop=shop, gapless=True) == [initial + 10, initial + 11]
+
+
+@pytest.mark.django_db
+def test_counter_blocks_in_transaction(settings):
+    settings.SHUUP_COUNTER_BLOCK_SIZE = 10
+    _blocks.clear()
+    initial = Counter.allocate(CounterType.ORDER_REFERENCE) + 1
+    assert _get_values(3) == [initial, initial + 1, initial + 2]
@@ -8,6 +8,8 @@
 from decimal import Decimal
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import translation
 
 from shuup.core.models import (
@@ -229,7 +231,10 @@ def test_limited_methods():
         ((common_product.pk, impossible_product.pk,), ()),
     ]:
         product_ids = set(product_ids)
-        assert ShippingMethod.objects.available_ids(shop=shop, products=product_ids) == set(method_ids)
+        method_ids = set(method_ids)
+        with CaptureQueriesContext(connection) as queries:
+            assert ShippingMethod.objects.available_ids(shop=shop, products=product_ids) == method_ids
+        assert len(queries.captured_queries) <= 2  # Limiting shop products and enabled methods
 
 
 def get_total_price_value(lines):
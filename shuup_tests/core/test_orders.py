@@ -5,12 +5,15 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
+import datetime
 from decimal import Decimal
 
 import pytest
 import six
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.timezone import now
 
 from shuup.core.excs import (
@@ -207,6 +210,16 @@ def test_empty_order():
     order.delete()  # Again! (This, too, should be a no-op)
 
 
+@pytest.mark.django_db
+def test_order_modified_on():
+    order = create_empty_order()
+    order.save()
+    Order.objects.filter(pk=order.pk).update(modified_on=order.created_on - datetime.timedelta(days=1))
+    order.set_canceled()
+    order = Order.objects.get(pk=order.pk)
+    assert order.modified_on >= order.created_on
+
+
 @pytest.mark.django_db
 def test_known_extra_data():
     order = create_empty_order()
@@ -719,3 +732,35 @@ def test_product_summary():
     assert all(product_summary.keys())
     summary = product_summary[product.id]
     assert_defaultdict_values(summary, ordered=2, shipped=1, refunded=2, unshipped=0)
+
+
+@pytest.mark.django_db
+def test_order_totals_with_aggregate_queries():
+    product = get_default_product()
+    supplier = get_default_supplier()
+    order = create_order_with_product(
+        product, supplier=supplier, quantity=3, taxless_base_unit_price=Decimal("3.333"),
+        tax_rate=Decimal("0.24"), n_lines=5)
+    discount_line = OrderLine(order=order, quantity=1, type=OrderLineType.DISCOUNT)
+    discount_line.discount_amount = order.shop.create_price(5)
+    discount_line.save()
+
+    with CaptureQueriesContext(connection) as queries:
+        order.cache_prices()
+    # The line values and the tax amounts
+    assert len(queries.captured_queries) == 2
+
+    lines = list(order.lines.all())
+    assert order.taxful_total_price == sum((line.taxful_price for line in lines), order.taxful_total_price.new(0))
+    assert order.taxless_total_price == sum((line.taxless_price for line in lines), order.taxless_total_price.new(0))
+
+    with CaptureQueriesContext(connection) as queries:
+        summary = order.get_product_summary()
+    assert len(queries.captured_queries) == 4
+    assert summary[product.pk]["ordered"] == 15
+    assert order.get_unshipped_products()[product.pk]["unshipped"] == 15
+
+    order.save()
+    order.create_payment(order.taxful_total_price.amount / 2)
+    assert order.get_total_paid_amount() == order.taxful_total_price.amount / 2
+    assert order.is_partially_paid()
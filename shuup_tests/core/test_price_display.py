@@ -172,6 +172,35 @@ def test_filter_parameter():
     assert result.render(context) == "$12.15"
 
 
+@pytest.mark.parametrize("expr,expected_result", [
+    (expr, expected_result) for (expr, expected_result) in TEST_DATA if expr.startswith("prod|")
+])
+@pytest.mark.django_db
+def test_filter_with_preloaded_prices(expr, expected_result):
+    (engine, context) = _get_template_engine_and_context()
+    template = engine.from_string(
+        "{{ preload_prices([prod]) }}{{ preload_prices([prod], quantity=2) }}{{ " + expr + " }}")
+    assert template.render(context) == expected_result
+
+
+@pytest.mark.django_db
+def test_preloaded_prices_are_calculated_once(monkeypatch):
+    (engine, context) = _get_template_engine_and_context()
+    calls = []
+    original_get_price_info = DummyPricingModule.get_price_info
+
+    def get_price_info(self, context, product, quantity=1):
+        calls.append(product)
+        return original_get_price_info(self, context, product, quantity)
+
+    monkeypatch.setattr(DummyPricingModule, "get_price_info", get_price_info)
+    template = engine.from_string(
+        "{{ preload_prices([prod]) }}"
+        "{{ prod|price }} {{ prod|base_price }} {{ prod|is_discounted }} {{ prod|discount_percent }}")
+    assert template.render(context) == "$6.07 $24.30 True 75%"
+    assert len(calls) == 1
+
+
 def _get_template_engine_and_context():
     engine = django.template.engines['jinja2']
     assert isinstance(engine, django_jinja.backend.Jinja2)
@@ -6,17 +6,29 @@
 # LICENSE file in the root directory of this source tree.
 import pytest
 
+from shuup.core import cache
+from shuup.core.models import ShopProduct
 from shuup.core.pricing import TaxfulPrice, TaxlessPrice
+from shuup.core.utils import context_cache
 from shuup.testing.factories import (
-    create_product, get_default_product, get_default_shop
+    create_product, get_default_product, get_default_shop,
+    get_default_supplier
 )
 from shuup.testing.utils import apply_request_middleware
 
 
+def setup_function(fn):
+    cache.clear()
+
+
 def init_test(request, shop, prices):
     apply_request_middleware(request)
     parent = create_product("parent_product", shop=shop)
-    children = [create_product("child-%d" % price, shop=shop, default_price=price) for price in prices]
+    supplier = get_default_supplier()
+    children = [
+        create_product("child-%d" % price, shop=shop, supplier=supplier, default_price=price)
+        for price in prices
+    ]
     for child in children:
         child.link_to_parent(parent)
     return parent
@@ -75,3 +87,41 @@ def test_only_one_variation_child(rf):
     assert parent.get_cheapest_child_price(request) == price(min(prices))
     assert parent.get_child_price_range(request) == (price(min(prices)), price(max(prices)))
     assert price_info.price == price(min(prices))
+
+
+@pytest.mark.django_db
+def test_children_are_priced_in_one_batch(rf):
+    prices = [100, 20, 50]
+
+    shop = get_default_shop()
+    request = rf.get("/")
+    request.shop = shop
+    parent = init_test(request, shop, prices)
+
+    price = shop.create_price
+    assert parent.get_child_price_range(request) == (price(20), price(100))
+    priced_children = parent.get_priced_children(request)
+    assert [price_info.price for (child, price_info) in priced_children] == [price(20), price(50), price(100)]
+    assert [child.sku for (child, price_info) in priced_children] == ["child-20", "child-50", "child-100"]
+
+    # Changing a child price bumps the cached parent result
+    child = priced_children[0][0]
+    shop_product = child.get_shop_instance(shop)
+    shop_product.default_price_value = 10
+    shop_product.save()
+    assert parent.get_cheapest_child_price(request) == price(10)
+
+
+@pytest.mark.django_db
+def test_priced_children_orderability_is_not_cached(rf):
+    shop = get_default_shop()
+    request = rf.get("/")
+    request.shop = shop
+    parent = init_test(request, shop, [100, 20, 50])
+    assert len(parent.get_priced_children(request)) == 3
+
+    # Changes bumping only the child's own cache don't reach the parent
+    ShopProduct.objects.filter(product__sku="child-20").update(minimum_purchase_quantity=2)
+    context_cache.bump_cache_for_item(ShopProduct.objects.get(product__sku="child-20"))
+    priced_children = parent.get_priced_children(request)
+    assert [child.sku for (child, price_info) in priced_children] == ["child-50", "child-100"]
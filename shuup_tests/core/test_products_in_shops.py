@@ -10,7 +10,9 @@ import uuid
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from shuup import configuration
 from shuup.core.excs import (
@@ -92,6 +94,38 @@ def test_product_unsupplied(admin_user):
     with modify(shop_product, visibility_limit=ProductVisibility.VISIBLE_TO_ALL, orderable=True):
         assert any(ve.code == "invalid_supplier" for ve in shop_product.get_orderability_errors(supplier=fake_supplier, customer=admin_contact, quantity=1))
 
+@pytest.mark.django_db
+@pytest.mark.usefixtures("regular_user")
+def test_bulk_orderability_queries(regular_user):
+    shop = get_default_shop()
+    supplier = get_default_supplier()
+    customer_group = get_default_customer_group()
+    grouped_contact = get_person_contact(regular_user)
+    customer_group.members.add(grouped_contact)
+    assert customer_group.pk in grouped_contact.get_group_ids()
+
+    def get_bulk_errors(count):
+        shop_products = []
+        for index in range(count):
+            product = create_product(printable_gibberish(), shop=shop, supplier=supplier)
+            shop_product = product.get_shop_instance(shop)
+            shop_product.visibility_limit = ProductVisibility.VISIBLE_TO_GROUPS
+            shop_product.save()
+            shop_product.visibility_groups.add(customer_group)
+            shop_products.append(shop_product.pk)
+
+        with CaptureQueriesContext(connection) as context:
+            errors = ShopProduct.objects.filter(pk__in=shop_products).get_orderability_errors(customer=grouped_contact)
+        return errors, len(context.captured_queries)
+
+    errors, few_queries = get_bulk_errors(2)
+    assert all(not product_errors for product_errors in errors.values())
+    errors, many_queries = get_bulk_errors(8)
+    assert len(errors) == 8
+    assert all(not product_errors for product_errors in errors.values())
+    assert few_queries == many_queries
+
+
 @pytest.mark.django_db
 @pytest.mark.usefixtures("regular_user")
 def test_product_visibility(rf, admin_user, regular_user):
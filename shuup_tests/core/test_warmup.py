@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+import pytest
+from django.core.management import call_command
+from django.utils.six import StringIO
+
+from shuup import configuration
+from shuup.core.utils.warmup import warm_up
+from shuup.testing.factories import get_default_shop
+
+
+@pytest.mark.django_db
+def test_warm_up():
+    shop = get_default_shop()
+    configuration._snapshots.clear()
+    steps = warm_up(templates=False)
+    steps_by_name = dict(((step.kind, step.name), step) for step in steps)
+
+    step = steps_by_name[("provide", "pricing_module: shuup.core.pricing.default_pricing:DefaultPricingModule")]
+    assert not step.error
+    assert step.duration >= 0
+    assert not steps_by_name[("provides", "pricing_module")].error
+    assert not steps_by_name[("setting", "SHUUP_BASKET_CLASS_SPEC")].error
+    assert not steps_by_name[("cache", "configuration")].error
+    assert shop.pk in configuration._snapshots
+
+
+@pytest.mark.django_db
+def test_warmup_command():
+    get_default_shop()
+    stdout = StringIO()
+    call_command("shuup_warmup", "--no-templates", "--limit=3", stdout=stdout, stderr=StringIO())
+    lines = stdout.getvalue().splitlines()
+    assert len(lines) == 4
+    assert lines[-1].startswith("Warmed up")
@@ -10,10 +10,13 @@ import decimal
 import pytest
 
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from shuup.core.models import (
     OrderLineType, WeightBasedPriceRange, WeightBasedPricingBehaviorComponent
 )
+from shuup.core.models._service_base import prefetch_behavior_components
 from shuup.core.models._service_behavior import _is_in_range
 from shuup.testing.factories import (
     create_product, get_default_payment_method, get_default_shipping_method, get_default_supplier
@@ -177,3 +180,22 @@ def test_out_of_range(admin_user, get_service, service_attr):
     # Mid, high and expensive ranges matches but the mid range is selected
     source = _get_source_for_weight(admin_user, service, service_attr, decimal.Decimal("40"), "mid")
     _test_service_ranges_against_source(source, service, decimal.Decimal("10.000000"), "Mid range")
+
+
+@pytest.mark.django_db
+def test_prefetched_ranges(admin_user):
+    ranges_data = [
+        (None, "10.32", decimal.Decimal("1"), "Low range"),
+        ("10.32", None, decimal.Decimal("10"), "High range"),
+    ]
+    service = get_default_shipping_method()
+    _assign_component_for_service(service, ranges_data)
+    source = _get_source_for_weight(admin_user, service, "shipping_method", decimal.Decimal("20"), "prefetch")
+
+    [service] = prefetch_behavior_components(type(service).objects.filter(pk=service.pk))
+    with CaptureQueriesContext(connection) as queries:
+        costs = list(service.get_costs(source))
+        assert not list(service.get_unavailability_reasons(source))
+    assert not queries.captured_queries
+    assert costs[0].price.value == decimal.Decimal("10")
+    assert costs[0].description == "High range"
@@ -7,7 +7,10 @@
 # LICENSE file in the root directory of this source tree.
 import pytest
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from shuup.core import cache
 from shuup.core.models import AnonymousContact
 from shuup.core.pricing import get_pricing_module
 from shuup.customer_group_pricing.models import CgpPrice
@@ -193,3 +196,39 @@ def test_zero_default_price(rf, admin_user):
     price_info = product.get_price_info(request)
 
     assert price_info.price == price(50)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("use_price_table", [False, True])
+def test_batch_price_infos(rf, settings, use_price_table):
+    settings.SHUUP_CUSTOMER_GROUP_PRICING_USE_PRICE_TABLE = use_price_table
+    cache.clear()
+    request, shop, group = initialize_test(rf, False)
+    products = [create_product("batch-%d" % x, shop=shop, default_price=100) for x in range(6)]
+    for (index, product) in enumerate(products[:4]):
+        CgpPrice.objects.create(product=product, shop=shop, group=group, price_value=50 + index)
+    CgpPrice.objects.create(product=products[4], shop=shop, group=group, price_value=150)
+
+    module = get_pricing_module()
+    context = module.get_context_from_request(request)
+    price_infos = module.get_price_infos(context, products)
+    assert set(price_infos) == set(product.pk for product in products)
+    for product in products:
+        assert price_infos[product.pk].price == module.get_price_info(context, product).price
+    assert price_infos[products[1].pk].price == shop.create_price(51)
+    assert price_infos[products[4].pk].price == shop.create_price(100)
+    assert price_infos[products[5].pk].price == shop.create_price(100)
+
+    with CaptureQueriesContext(connection) as queries:
+        module.get_price_infos(context, products)
+    # The shop products and (unless tabled) the group prices
+    assert len(queries.captured_queries) == (1 if use_price_table else 2)
+
+    steps = module.get_pricing_steps_for_products(context, [product.pk for product in products])
+    assert steps[products[0].pk][0].price == shop.create_price(50)
+
+    # Changing the prices refreshes the price table
+    CgpPrice.objects.filter(product=products[0]).update(price_value=20)
+    CgpPrice.objects.get(product=products[0]).save()
+    price_infos = module.get_price_infos(module.get_context_from_request(request), products)
+    assert price_infos[products[0].pk].price == shop.create_price(20)
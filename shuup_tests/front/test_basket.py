@@ -7,9 +7,12 @@
 # LICENSE file in the root directory of this source tree.
 import pytest
 from django.conf import settings
+from django.db import connection
 from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
 from django.test.utils import override_settings
 
+from shuup.core import cache
 from shuup.core.models import ShippingMode
 from shuup.front.basket import get_basket
 from shuup.front.models import StoredBasket
@@ -27,6 +30,7 @@ from .utils import get_unstocked_package_product_and_stocked_child
 @pytest.mark.parametrize("storage", [
     "shuup.front.basket.storage:DirectSessionBasketStorage",
     "shuup.front.basket.storage:DatabaseBasketStorage",
+    "shuup.front.basket.storage:CachedDatabaseBasketStorage",
 ])
 def test_basket(rf, storage):
     StoredBasket.objects.all().delete()
@@ -78,6 +82,89 @@ def test_basket(rf, storage):
         basket.finalize()
 
 
+@pytest.mark.django_db
+def test_cached_database_basket_storage(rf, settings):
+    settings.SHUUP_BASKET_STORAGE_CLASS_SPEC = "shuup.front.basket.storage:CachedDatabaseBasketStorage"
+    settings.SHUUP_BASKET_STORAGE_WRITE_BEHIND_DELAY = 60
+    cache.clear()
+    StoredBasket.objects.all().delete()
+    shop = get_default_shop()
+    get_default_payment_method()
+    supplier = get_default_supplier()
+    product = create_product(printable_gibberish(), shop=shop, supplier=supplier, default_price=50)
+
+    request = apply_request_middleware(rf.get("/"))
+    basket = get_basket(request)
+    basket.add_product(supplier=supplier, shop=shop, product=product, quantity=2)
+    basket.save()
+    # Only the cached copy is written
+    assert not StoredBasket.objects.exists()
+
+    delattr(request, "basket")
+    basket = get_basket(request)
+    assert basket.get_product_ids_and_quantities() == {product.pk: 2}
+
+    # The basket is written into the database on the first save after the delay
+    settings.SHUUP_BASKET_STORAGE_WRITE_BEHIND_DELAY = 0
+    basket.add_product(supplier=supplier, shop=shop, product=product, quantity=1)
+    basket.save()
+    stored_basket = StoredBasket.objects.get()
+    assert stored_basket.product_count == 3
+    assert set(stored_basket.products.values_list("id", flat=True)) == set([product.pk])
+
+    # and loaded from it when the cached copy is gone
+    cache.clear()
+    basket = get_basket(request)
+    assert basket.get_product_ids_and_quantities() == {product.pk: 3}
+
+    settings.SHUUP_BASKET_STORAGE_WRITE_BEHIND_DELAY = 60
+    basket.add_product(supplier=supplier, shop=shop, product=product, quantity=1)
+    basket.save()
+    assert StoredBasket.objects.get().product_count == 3
+
+    # Changes of a basket idle for longer than the delay are written when it is loaded again
+    settings.SHUUP_BASKET_STORAGE_WRITE_BEHIND_DELAY = 0
+    basket = get_basket(request)
+    assert basket.get_product_ids_and_quantities() == {product.pk: 4}
+    assert StoredBasket.objects.get().product_count == 4
+
+    settings.SHUUP_BASKET_STORAGE_WRITE_BEHIND_DELAY = 60
+    basket.add_product(supplier=supplier, shop=shop, product=product, quantity=1)
+    basket.save()
+    assert StoredBasket.objects.get().product_count == 4
+    basket.finalize()
+    stored_basket = StoredBasket.objects.get()
+    assert stored_basket.finished
+    assert stored_basket.product_count == 5
+
+
+@pytest.mark.django_db
+def test_basket_add_products(rf):
+    shop = get_default_shop()
+    get_default_payment_method()
+    supplier = get_default_supplier()
+    products = [
+        create_product(printable_gibberish(), shop=shop, supplier=supplier, default_price=10)
+        for x in range(3)
+    ]
+    unavailable_product = create_product(printable_gibberish())
+    request = apply_request_middleware(rf.get("/"))
+    basket = get_basket(request)
+    basket.add_product(supplier=supplier, shop=shop, product=products[0], quantity=1)
+
+    added_lines, errors = basket.add_products([
+        {"product_id": products[0].pk, "quantity": 2},
+        {"product_id": products[1].pk, "quantity": 3, "supplier_id": supplier.pk},
+        {"product_id": products[2].pk, "quantity": 1, "supplier_id": supplier.pk + 100},
+        {"product_id": unavailable_product.pk, "quantity": 1},
+        {"product_id": products[1].pk, "quantity": 1},
+    ])
+    assert len(added_lines) == 3
+    assert [line["product_id"] for (line, message) in errors] == [products[2].pk, unavailable_product.pk]
+    assert basket.get_product_ids_and_quantities() == {products[0].pk: 3, products[1].pk: 4}
+    assert len(basket.get_lines()) == 2
+
+
 @pytest.mark.django_db
 def test_basket_dirtying_with_fnl(rf):
     shop = get_default_shop()
@@ -209,3 +296,37 @@ def test_basket_package_product_orderability_change(rf):
     # After reducing stock to 0, should be stock for neither
     assert len(basket.get_lines()) == 0
     assert len(basket.get_unorderable_lines()) == 2
+
+
+@pytest.mark.django_db
+def test_basket_available_services_cache(rf):
+    cache.clear()
+    StoredBasket.objects.all().delete()
+    shop = get_default_shop()
+    supplier = get_default_supplier()
+    product = create_product(printable_gibberish(), shop=shop, supplier=supplier, default_price=50)
+    shipping_method = get_shipping_method(name="cached", price=10)
+
+    request = apply_request_middleware(rf.get("/"))
+    basket = get_basket(request)
+    basket.add_product(supplier=supplier, shop=shop, product=product, quantity=1)
+    assert shipping_method in basket.get_available_shipping_methods()
+
+    # Memoized on the basket
+    with CaptureQueriesContext(connection) as queries:
+        assert shipping_method in basket.get_available_shipping_methods()
+    assert not queries.captured_queries
+
+    # Saving the method invalidates the cached methods
+    shipping_method.enabled = False
+    shipping_method.save()
+    assert shipping_method not in basket.get_available_shipping_methods()
+
+    # and so does saving the (polymorphic) provider of the method
+    shipping_method.enabled = True
+    shipping_method.save()
+    assert shipping_method in basket.get_available_shipping_methods()
+    carrier = shipping_method.carrier
+    carrier.enabled = False
+    carrier.save()
+    assert shipping_method not in basket.get_available_shipping_methods()
@@ -13,8 +13,8 @@ from django.utils import timezone
 import shuup.core.models
 from shuup.admin.urls import login
 from shuup.core.models import (
-    AnonymousContact, CompanyContact, Contact, get_company_contact,
-    get_person_contact, PersonContact, Shop
+    AnonymousContact, CompanyContact, Contact, ContactGroup,
+    get_company_contact, get_person_contact, PersonContact, Shop
 )
 from shuup.front.middleware import ShuupFrontMiddleware
 from shuup.front.views.index import IndexView
@@ -175,3 +175,61 @@ def test_with_inactive_contact(rf, regular_user, admin_user):
     assert request.user == AnonymousUser()
     assert request.person == AnonymousContact()
     assert request.customer == AnonymousContact()
+
+
+@pytest.mark.django_db
+def test_request_context_is_cached_and_lazy(rf, regular_user):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    get_default_shop()
+    person = get_person_contact(regular_user)
+    mw = ShuupFrontMiddleware()
+    mw.process_request(apply_request_middleware(rf.get("/"), user=regular_user))
+
+    request = apply_request_middleware(rf.get("/"), user=regular_user)
+    with CaptureQueriesContext(connection) as context:
+        mw.process_request(request)
+        mw.process_response(request, None)
+    assert not context.captured_queries  # Basket was never touched
+    assert request.person == person
+    assert request.customer == person
+
+    # Company memberships invalidate the cached contacts
+    company = create_random_company()
+    company.members.add(person)
+    request = apply_request_middleware(rf.get("/"), user=regular_user)
+    mw.process_request(request)
+    assert request.customer == company
+    assert request.is_company_member
+
+    # ...and so does deleting the company
+    company.delete()
+    request = apply_request_middleware(rf.get("/"), user=regular_user)
+    mw.process_request(request)
+    assert request.customer == person
+    assert not request.is_company_member
+
+
+@pytest.mark.django_db
+def test_cached_contacts_follow_group_memberships(rf, regular_user):
+    get_default_shop()
+    person = get_person_contact(regular_user)
+    group = ContactGroup.objects.create(identifier="cached-group")
+    mw = ShuupFrontMiddleware()
+    request = apply_request_middleware(rf.get("/"), user=regular_user)
+    assert group.pk not in request.customer.get_group_ids()
+
+    group.members.add(person)
+    mw.process_request(request)
+    assert group.pk in request.customer.get_group_ids()
+
+
+@pytest.mark.django_db
+def test_loaded_basket_is_kept_on_refresh(rf, regular_user):
+    get_default_shop()
+    request = apply_request_middleware(rf.get("/"), user=regular_user)
+    basket = request.basket
+    basket.extra_data["marker"] = True
+    ShuupFrontMiddleware.refresh_on_user_change(request)
+    assert request.basket.extra_data.get("marker")
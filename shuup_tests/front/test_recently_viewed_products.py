@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from shuup.core import cache
+from shuup.core.models import (
+    ContactGroup, ProductVisibility, ShopProductVisibility
+)
+from shuup.front.apps.recently_viewed_products.plugins import (
+    get_recently_viewed_product_ids, get_recently_viewed_products,
+    RecentlyViewedProductsPlugin
+)
+from shuup.testing.factories import (
+    create_product, create_random_person, get_default_shop
+)
+from shuup.testing.utils import apply_request_middleware
+
+
+def _get_request(rf, product_ids):
+    request = rf.get("/")
+    request.COOKIES["rvp"] = ",".join(str(product_id) for product_id in product_ids)
+    return apply_request_middleware(request)
+
+
+def test_recently_viewed_product_ids(rf):
+    request = rf.get("/")
+    request.COOKIES["rvp"] = "3,1,,x,3,2,5,6,7,8"
+    assert get_recently_viewed_product_ids(request) == [3, 1, 2, 5, 6]
+
+
+@pytest.mark.django_db
+def test_recently_viewed_products_plugin(rf):
+    cache.clear()
+    shop = get_default_shop()
+    products = [create_product("rvp-%d" % i, shop=shop, name="Product %d" % i) for i in range(3)]
+    invisible = products[1].get_shop_instance(shop)
+    invisible.visibility = ShopProductVisibility.NOT_VISIBLE
+    invisible.save()
+
+    plugin = RecentlyViewedProductsPlugin({})
+    request = _get_request(rf, [products[2].pk, products[1].pk, products[0].pk])
+    context = plugin.get_context_data({"request": request})
+    assert [product["name"] for product in context["products"]] == ["Product 2", "Product 0"]
+
+    # The second render is served from the cache
+    with CaptureQueriesContext(connection) as queries:
+        context = plugin.get_context_data({"request": request})
+    assert not queries.captured_queries
+    assert [product["pk"] for product in context["products"]] == [products[2].pk, products[0].pk]
+
+    # Saving products invalidates the cached data
+    invisible.visibility = ShopProductVisibility.ALWAYS_VISIBLE
+    invisible.save()
+    context = plugin.get_context_data({"request": request})
+    assert [product["name"] for product in context["products"]] == ["Product 2", "Product 1", "Product 0"]
+
+    # and so do deleting them and changing their visibility groups
+    products[2].get_shop_instance(shop).delete()
+    context = plugin.get_context_data({"request": request})
+    assert [product["name"] for product in context["products"]] == ["Product 1", "Product 0"]
+
+    person = create_random_person()
+    group = ContactGroup.objects.create(identifier="rvp")
+    person.groups.add(group)
+    product_ids = [product.pk for product in products]
+    invisible.visibility_limit = ProductVisibility.VISIBLE_TO_GROUPS
+    invisible.save()
+    assert [product["name"] for product in get_recently_viewed_products(shop, person, product_ids)] == ["Product 0"]
+    invisible.visibility_groups.add(group)
+    assert [product["name"] for product in get_recently_viewed_products(shop, person, product_ids)] == [
+        "Product 0", "Product 1"]
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+import pytest
+from django.core.urlresolvers import reverse
+
+from shuup.regions.resources import add_regions_script, get_regions_script
+from shuup.testing.factories import get_default_shop
+from shuup.xtheme.resources import (
+    RESOURCE_CONTAINER_VAR_NAME, ResourceContainer
+)
+
+
+@pytest.mark.django_db
+def test_regions_script(client):
+    get_default_shop()
+    (script, script_hash) = get_regions_script()
+    assert "window.REGIONS" in script
+    assert get_regions_script() == (script, script_hash)
+
+    url = reverse("shuup:regions", kwargs={"hash": script_hash})
+    context = {RESOURCE_CONTAINER_VAR_NAME: ResourceContainer()}
+    add_regions_script(context)
+    assert context[RESOURCE_CONTAINER_VAR_NAME].resources["body_end"] == [url]
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.content.decode("utf-8") == script
+    assert "max-age=31536000" in response["Cache-Control"]
+
+    response = client.get(reverse("shuup:regions", kwargs={"hash": "0123456789ab"}))
+    assert response.status_code == 302
+    assert response["Location"].endswith(url)
+
+
+@pytest.mark.django_db
+def test_regions_script_in_maintenance_mode(client):
+    shop = get_default_shop()
+    shop.maintenance_mode = True
+    shop.save()
+    (script, script_hash) = get_regions_script()
+    response = client.get(reverse("shuup:regions", kwargs={"hash": script_hash}))
+    assert response.status_code == 200
+    assert response.content.decode("utf-8") == script
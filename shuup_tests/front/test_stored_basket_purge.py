@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# This file is part of Shuup.
+#
+# Copyright (c) 2012-2017, Shoop Commerce Ltd. All rights reserved.
+#
+# This source code is licensed under the OSL-3.0 license found in the
+# LICENSE file in the root directory of this source tree.
+import datetime
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from django.utils.six import StringIO
+
+from shuup.front.models import AbandonedBasketSummary, StoredBasket
+from shuup.testing.factories import (
+    create_product, create_random_person, get_default_shop
+)
+
+
+def _create_basket(shop, days_old, **kwargs):
+    product = create_product("purge-%d" % StoredBasket.objects.count(), shop=shop)
+    basket = StoredBasket.objects.create(
+        shop=shop, currency=shop.currency, prices_include_tax=shop.prices_include_tax, data={},
+        product_count=2, taxful_total_price_value=10, taxless_total_price_value=8, **kwargs)
+    basket.products = [product]
+    StoredBasket.objects.filter(pk=basket.pk).update(
+        updated_on=timezone.now() - datetime.timedelta(days=days_old))
+    return basket
+
+
+@pytest.mark.django_db
+def test_purge_stored_baskets(settings):
+    settings.SHUUP_STORED_BASKET_RETENTION_DAYS = {
+        "finished": 10,
+        "persistent": None,
+        "anonymous": 10,
+        "customer": 20,
+    }
+    shop = get_default_shop()
+    customer = create_random_person()
+    old_anonymous = [_create_basket(shop, 15) for x in range(3)]
+    new_anonymous = _create_basket(shop, 5)
+    old_finished = _create_basket(shop, 15, finished=True, deleted=True)
+    new_customer = _create_basket(shop, 15, customer=customer)
+    old_customer = _create_basket(shop, 25, customer=customer)
+    saved_cart = _create_basket(shop, 100, customer=customer, persistent=True)
+
+    out = StringIO()
+    call_command("shuup_purge_stored_baskets", chunk_size=2, stdout=out)
+    assert "Purged 3 anonymous baskets" in out.getvalue()
+
+    remaining = set(StoredBasket.objects.values_list("pk", flat=True))
+    assert remaining == set([new_anonymous.pk, new_customer.pk, saved_cart.pk])
+    assert not StoredBasket.products.through.objects.filter(
+        storedbasket_id__in=[basket.pk for basket in old_anonymous + [old_finished, old_customer]]).exists()
+
+    anonymous_summary = AbandonedBasketSummary.objects.get(shop=shop, anonymous=True)
+    assert anonymous_summary.basket_count == 3
+    assert anonymous_summary.product_count == 6
+    assert anonymous_summary.taxful_total_price_value == 30
+    customer_summary = AbandonedBasketSummary.objects.get(shop=shop, anonymous=False)
+    assert customer_summary.basket_count == 1
+    assert customer_summary.taxless_total_price_value == 8
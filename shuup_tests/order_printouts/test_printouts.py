@@ -5,9 +5,17 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
+import multiprocessing
+import zipfile
+
+import mock
 import pytest
+from six import BytesIO
 
 from shuup.apps.provides import override_provides
+from shuup.order_printouts.batch import (
+    ERRORS_FILENAME, get_confirmation_documents, render_pdfs, write_pdf_zip
+)
 from shuup.order_printouts.utils import PrintoutDeliveryExtraInformation
 from shuup.order_printouts.admin_module.views import (
     get_confirmation_pdf, get_delivery_pdf, get_delivery_html
@@ -69,3 +77,67 @@ def test_adding_extra_fields_to_the_delivery(rf):
         assert response.status_code == 200
         assert "123456789" in response.content.decode()
         assert "Random" in response.content.decode()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("processes", [0, 2])
+def test_batch_printouts(rf, processes):
+    try:
+        import weasyprint
+    except ImportError:
+        pytest.skip()
+
+    shop = get_default_shop()
+    supplier = get_default_supplier()
+    product = create_product("simple-test-product", shop)
+    orders = [create_order_with_product(product, supplier, 1, 6, shop=shop) for x in range(3)]
+    order_ids = [order.id for order in orders] + [-1]
+    request = rf.get("/")
+
+    documents, errors = get_confirmation_documents(request, order_ids)
+    assert len(documents) == 3
+    assert len(errors) == 1
+
+    buff = BytesIO()
+    write_pdf_zip(documents, buff, errors, processes=processes)
+    archive = zipfile.ZipFile(BytesIO(buff.getvalue()))
+    filenames = archive.namelist()
+    assert filenames == ["order_%d_confirmation.pdf" % order.id for order in orders] + [ERRORS_FILENAME]
+    assert archive.read(filenames[0]).startswith(b"%PDF")
+
+
+@pytest.mark.django_db
+def test_batch_printouts_in_daemonic_process(rf):
+    try:
+        import weasyprint
+    except ImportError:
+        pytest.skip()
+
+    shop = get_default_shop()
+    product = create_product("simple-test-product", shop)
+    orders = [create_order_with_product(product, get_default_supplier(), 1, 6, shop=shop) for x in range(2)]
+    documents, errors = get_confirmation_documents(rf.get("/"), [order.id for order in orders])
+
+    # Daemonic processes can't have children, so no pool may be created
+    with mock.patch.object(multiprocessing, "current_process", return_value=mock.Mock(daemon=True)):
+        with mock.patch.object(multiprocessing, "Pool", side_effect=AssertionError):
+            results = list(render_pdfs(documents, processes=2))
+    assert [filename for (filename, pdf, error) in results] == [filename for (filename, html) in documents]
+    assert all(pdf.startswith(b"%PDF") for (filename, pdf, error) in results)
+
+
+def test_batch_printouts_resource_errors():
+    def fetch_resources(html, resources):
+        if html == "broken":
+            raise ValueError("Missing logo")
+        return {}
+
+    documents = [("first.pdf", "ok"), ("second.pdf", "broken"), ("third.pdf", "ok")]
+    with mock.patch("shuup.order_printouts.batch.load_stylesheets"), \
+            mock.patch("shuup.order_printouts.batch.fetch_resources", side_effect=fetch_resources), \
+            mock.patch("shuup.order_printouts.batch.html_to_pdf", return_value=b"%PDF"):
+        buff = BytesIO()
+        write_pdf_zip(documents, buff, processes=0)
+    archive = zipfile.ZipFile(BytesIO(buff.getvalue()))
+    assert archive.namelist() == ["first.pdf", "third.pdf", ERRORS_FILENAME]
+    assert archive.read(ERRORS_FILENAME) == b"Missing logo"
@@ -14,6 +14,7 @@ import pytest
 from shuup.admin.modules.products.views.edit import ProductEditView
 from shuup.core import cache
 from shuup.core.models import StockBehavior, Supplier
+from shuup.core.utils.stock_updates import deferred_stock_updates
 from shuup.simple_supplier.admin_module.forms import SimpleSupplierForm
 from shuup.simple_supplier.admin_module.views import (process_alert_limit,
                                                       process_stock_adjustment)
@@ -239,3 +240,32 @@ def test_alert_limit_notification(rf, admin_user):
 
     event = AlertLimitReached(product=product, supplier=supplier)
     assert event.variable_values["dispatched_last_24hs"] == "False"
+
+
+@pytest.mark.django_db
+def test_deferred_stock_updates():
+    supplier = get_simple_supplier()
+    shop = get_default_shop()
+    product1 = create_product("simple-test-product-1", shop, stock_behavior=StockBehavior.STOCKED)
+    product2 = create_product("simple-test-product-2", shop, stock_behavior=StockBehavior.STOCKED)
+
+    with deferred_stock_updates():
+        supplier.adjust_stock(product1.pk, 10)
+        supplier.adjust_stock(product2.pk, 5)
+        # Nothing is updated before the end of the block
+        assert not StockCount.objects.filter(supplier=supplier).exists()
+
+    assert supplier.get_stock_status(product1.pk).logical_count == 10
+    assert supplier.get_stock_status(product2.pk).logical_count == 5
+
+    order = create_order_with_product(product1, supplier, 3, 3, shop=shop)
+    assert supplier.get_stock_status(product1.pk).logical_count == 7
+
+    # Saves not affecting the stocks don't update them
+    StockCount.objects.filter(supplier=supplier, product=product1).update(logical_count=0)
+    order.save()
+    assert supplier.get_stock_status(product1.pk).logical_count == 0
+
+    # Changing the status does
+    order.set_canceled()
+    assert supplier.get_stock_status(product1.pk).logical_count == 10
@@ -6,7 +6,10 @@
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
+from shuup.core import cache
 from shuup.xtheme import Theme, XTHEME_GLOBAL_VIEW_NAME
 from shuup.xtheme.view_config import ViewConfig
 from shuup_tests.utils import printable_gibberish
@@ -103,3 +106,31 @@ def test_unthemebound_view_config_cant_do_much():
 def test_unsaved_vc_reversion():
     vc = ViewConfig(theme=ATestTheme(), view_name=printable_gibberish(), draft=True)
     vc.revert()  # No-op, since this has never been saved (but shouldn't crash either)
+
+
+@pytest.mark.django_db
+def test_published_layout_is_cached():
+    cache.clear()
+    view_name = printable_gibberish()
+    theme = ATestTheme()
+    placeholder_name = "test_ph"
+    layout_data = {"rows": [{"cells": [{"plugin": "text", "config": {"text": "hello"}}]}]}
+    vc = ViewConfig(theme=theme, view_name=view_name, draft=True)
+    vc.save_placeholder_layout(placeholder_name, layout_data)
+    vc.publish()
+
+    layout = ViewConfig(theme=theme, view_name=view_name, draft=False).get_placeholder_layout(placeholder_name)
+    assert layout.get_cell(0, 0).config["text"] == "hello"
+    with CaptureQueriesContext(connection) as context:
+        cached_layout = ViewConfig(theme=theme, view_name=view_name, draft=False).get_placeholder_layout(
+            placeholder_name)
+    assert cached_layout is layout
+    assert not context.captured_queries
+
+    # Publishing a new version invalidates the cached layout
+    vc = ViewConfig(theme=theme, view_name=view_name, draft=True)
+    layout_data["rows"][0]["cells"][0]["config"]["text"] = "world"
+    vc.save_placeholder_layout(placeholder_name, layout_data)
+    vc.publish()
+    layout = ViewConfig(theme=theme, view_name=view_name, draft=False).get_placeholder_layout(placeholder_name)
+    assert layout.get_cell(0, 0).config["text"] == "world"
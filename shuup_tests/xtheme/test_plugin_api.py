@@ -5,12 +5,38 @@
 #
 # This source code is licensed under the OSL-3.0 license found in the
 # LICENSE file in the root directory of this source tree.
+import pytest
+from django.utils.translation import activate
+
+from shuup.apps.provides import override_provides
+from shuup.core import cache
+from shuup.testing.factories import (
+    create_product, get_default_category, get_default_shop
+)
 from shuup.testing.themes import ShuupTestingTheme
 from shuup.testing.themes.plugins import HighlightTestPlugin
-from shuup.xtheme import templated_plugin_factory, TemplatedPlugin
+from shuup.xtheme import Plugin, templated_plugin_factory, TemplatedPlugin
+from shuup.xtheme.layout import LayoutCell
+from shuup.xtheme.plugins._base import (
+    _get_cache_tag_namespace, bump_plugin_cache_tag
+)
 from shuup.xtheme.testing import override_current_theme_class
 from shuup_tests.utils import printable_gibberish
-from shuup_tests.xtheme.utils import get_jinja2_engine, plugin_override
+from shuup_tests.xtheme.utils import (
+    get_jinja2_engine, get_request, plugin_override
+)
+
+
+class CountingPlugin(Plugin):
+    identifier = "counting"
+    cacheable = True
+    cache_key_fields = ("text",)
+    cache_tags = ("counting",)
+    render_count = 0
+
+    def render(self, context):
+        CountingPlugin.render_count += 1
+        return "%s %d" % (self.config.get("text"), CountingPlugin.render_count)
 
 
 def test_plugin_choices():
@@ -43,3 +69,51 @@ def test_templated_plugin():
         rendered_content = plugin.render(top_context)
         expected_content = "Good day %s" % top_context["name"]
         assert rendered_content == expected_content
+
+
+def test_plugin_cache():
+    cache.clear()
+    activate("en")
+    context = {"request": get_request()}
+    with override_provides("xtheme_plugin", ["shuup_tests.xtheme.test_plugin_api:CountingPlugin"]):
+        cell = LayoutCell(None, "counting", config={"text": "hello"})
+        assert not cell.cacheable  # Tagged plugins are only cached per cell
+        first = cell.render(context)
+        assert cell.render(context) == first
+
+        cell.config["ignored"] = True  # Not in `cache_key_fields`
+        assert cell.render(context) == first
+
+        cell.config["text"] = "world"
+        assert cell.render(context) != first
+
+        cell.config["text"] = "hello"
+        bump_plugin_cache_tag("counting")
+        assert cell.render(context) != first
+
+
+@pytest.mark.django_db
+def test_plugin_cache_tag_signals():
+    cache.clear()
+    shop = get_default_shop()
+    product = create_product("tagged-product", shop=shop)
+    shop_product = product.get_shop_instance(shop)
+    category = get_default_category()
+    namespace = _get_cache_tag_namespace("products")
+
+    def assert_bumped(func):
+        version = cache.get_version(namespace)
+        func()
+        assert cache.get_version(namespace) != version
+
+    assert_bumped(lambda: shop_product.categories.add(category))
+    assert_bumped(lambda: shop_product.categories.remove(category))
+    assert_bumped(lambda: shop_product.visibility_groups.clear())
+
+    def save_translation():
+        product.set_current_language("en")
+        product.name = "renamed"
+        product.save_translations()
+
+    assert_bumped(save_translation)
+    assert_bumped(lambda: shop_product.delete())
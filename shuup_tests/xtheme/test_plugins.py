@@ -16,11 +16,14 @@ from shuup.testing.factories import (
 )
 from shuup.testing.utils import apply_request_middleware
 from shuup.xtheme import resources
+from shuup.xtheme.layout import LayoutCell
+from shuup.xtheme.plugins._base import bump_plugin_cache_tag
 from shuup.xtheme.plugins.category_links import CategoryLinksPlugin
 from shuup.xtheme.plugins.image import ImageIDField, ImagePluginChoiceWidget
 from shuup.xtheme.plugins.snippets import SnippetsPlugin
 from shuup.xtheme.plugins.social_media_links import SocialMediaLinksPlugin
 from shuup_tests.front.fixtures import get_jinja_context
+from shuup_tests.xtheme.utils import get_request
 
 
 def test_snippets_plugin():
@@ -191,3 +194,16 @@ def test_image_plugin_choice_widget_get_object():
     # We don't want any exceptions if the image doesn't exist or else we won't be
     # able to display the form to change it
     assert widget.get_object(1000) == None
+
+
+@pytest.mark.django_db
+def test_image_plugin_cache_invalidation():
+    bump_plugin_cache_tag("images")
+    image = File.objects.create(original_filename="first.jpg")
+    cell = LayoutCell(None, "images", config={"image_id": image.pk})
+    assert not cell.cacheable  # Only cached per cell, since it depends on the image
+    context = {"request": get_request()}
+    assert "<img" in cell.render(context)
+
+    image.delete()
+    assert "<img" not in cell.render(context)
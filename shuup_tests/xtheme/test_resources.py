@@ -69,3 +69,22 @@ def test_without_rc():
     content1 = "<html>"
     content2 = inject_resources(ctx, content1)
     assert content1 == content2
+
+
+def test_inject_resources_in_single_pass():
+    rc = ResourceContainer()
+    context = {RESOURCE_CONTAINER_VAR_NAME: rc}
+    rc.add_resource("head_end", InlineMarkupResource("<head-end>"))
+    rc.add_resource("body_start", InlineMarkupResource("<start>"))
+    rc.add_resource("body_end", InlineMarkupResource("<end>"))
+    content = "<html><head></head><BODY class=\"x\"><p>hi</p></body></html>"
+    assert inject_resources(context, content) == (
+        "<html><head><head-end></head>"
+        "<BODY class=\"x\"><start><p>hi</p><end></body></html>"
+    )
+    assert not rc.resources  # All of the locations were cleaned
+
+    # Locations without insertion points keep their resources
+    rc.add_resource("body_end", InlineMarkupResource("<end>"))
+    assert inject_resources(context, "<p>fragment</p>") == "<p>fragment</p>"
+    assert rc.resources["body_end"] == ["<end>"]
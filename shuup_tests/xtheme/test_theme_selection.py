@@ -8,8 +8,10 @@
 
 from contextlib import contextmanager
 
+import mock
 import pytest
 from django.template import TemplateDoesNotExist
+from jinja2.bccache import FileSystemBytecodeCache
 
 from shuup.apps.provides import get_provide_objects, override_provides
 from shuup.xtheme import set_current_theme
@@ -42,3 +44,24 @@ def test_theme_selection():
                 t = je.get_template("42.jinja")
                 content = t.render().strip()
                 assert "a slice of lemon wrapped around a large gold brick" in content.replace("\n", " ")
+
+
+@pytest.mark.django_db
+def test_template_name_memoization(settings, tmpdir):
+    settings.SHUUP_ENABLE_TEMPLATE_BYTECODE_CACHE = True
+    settings.SHUUP_TEMPLATE_BYTECODE_CACHE_DIR = str(tmpdir)
+    with override_current_theme_class(), override_provides("xtheme", ["shuup_tests.xtheme.utils:H2G2Theme"]):
+        ThemeSettings.objects.all().delete()
+        set_current_theme("h2g2")
+        env = get_jinja2_engine().env
+        assert isinstance(env.bytecode_cache, FileSystemBytecodeCache)
+        env.auto_reload = False
+
+        assert env.get_template("complex.jinja").name == "complex.jinja"
+        assert env._selected_template_names == {(("h2g2/complex.jinja", "complex.jinja"), None): "complex.jinja"}
+
+        # The memoized name is loaded directly, without probing for the missing themed template
+        with mock.patch.object(env.loader, "get_source", wraps=env.loader.get_source) as get_source:
+            assert env.get_template("complex.jinja").name == "complex.jinja"
+        assert [call[0][1] for call in get_source.call_args_list] == ["complex.jinja"]
+        assert tmpdir.listdir()  # The compiled bytecode was cached on disk
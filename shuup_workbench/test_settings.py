@@ -221,6 +221,10 @@ SHUUP_ERROR_PAGE_HANDLERS_SPEC = [
 
 SHUUP_SIMPLE_SEARCH_LIMIT = 150
 
+# Tests run inside transactions which the admin search worker threads
+# (using connections of their own) would not see
+SHUUP_ADMIN_SEARCH_WORKERS = 0
+
 
 if os.environ.get("SHUUP_WORKBENCH_DISABLE_MIGRATIONS") == "1":
     from shuup_workbench.settings.utils import DisableMigrations